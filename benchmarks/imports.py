@@ -0,0 +1,116 @@
+"""
+Cold-start benchmark: the import time of each module, in fresh interpreters.
+
+Run from the repository root:
+
+    python -m benchmarks.imports                  # report import times and heavy dependencies
+    python -m benchmarks.imports linkedin_api     # any module
+    python -m benchmarks.imports --check          # fail if a module loads a dependency it defers
+
+Times come from ``python -X importtime``, best of `--repeat` runs, after a
+first run compiles the bytecode. They vary with the machine, so `--check`
+only looks at which heavy dependencies each module loads.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Tuple
+
+# third-party and stdlib packages slow enough to be imported on first use
+HEAVY = ("requests", "httpx", "asyncio")
+
+# the heavy dependencies each module must not load
+DEFERRED: Dict[str, Tuple[str, ...]] = {
+    "linkedin_api": HEAVY,
+    "linkedin_api.client": ("httpx", "asyncio"),
+    "linkedin_api.linkedin": ("httpx", "asyncio"),
+    "linkedin_api.async_linkedin": (),
+}
+
+
+class Result(NamedTuple):
+    module: str
+    # cumulative import time of the module, in microseconds
+    import_us: int
+    heavy: FrozenSet[str]
+
+
+def import_times(module: str) -> Dict[str, int]:
+    """
+    Import `module` in a fresh interpreter, and return the cumulative import
+    time, in microseconds, of every module it loaded.
+    """
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        env=env,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+    times = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def measure(module: str, repeat=5) -> Result:
+    """Return the best import time of `module` over `repeat` cold starts."""
+    times = import_times(module)  # compiles the bytecode, if needed
+    best = None
+    for _ in range(repeat):
+        times = import_times(module)
+        best = times[module] if best is None else min(best, times[module])
+    heavy = frozenset(name.split(".")[0] for name in times) & frozenset(HEAVY)
+    return Result(module, best, heavy)
+
+
+def run(modules: Optional[List[str]] = None, repeat=5) -> List[Result]:
+    return [measure(module, repeat) for module in modules or DEFERRED]
+
+
+def violations(results: List[Result]) -> List[str]:
+    """Return a description of every heavy dependency loaded too early."""
+    found = []
+    for result in results:
+        early = sorted(result.heavy & frozenset(DEFERRED.get(result.module, ())))
+        if early:
+            found.append(f"{result.module}: imports {', '.join(early)}")
+    return found
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("modules", nargs="*", help=f"defaults to {', '.join(DEFERRED)}")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--check", action="store_true", help="fail on heavy dependencies"
+    )
+    args = parser.parse_args(argv)
+
+    results = run(args.modules, args.repeat)
+
+    print(f"{'module':<32} {'import ms':>10}  heavy dependencies")
+    for result in results:
+        print(
+            f"{result.module:<32} {result.import_us / 1000:>10,.1f}  "
+            f"{', '.join(sorted(result.heavy)) or '-'}"
+        )
+
+    if args.check:
+        found = violations(results)
+        for violation in found:
+            print(f"REGRESSION {violation}", file=sys.stderr)
+        return 1 if found else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
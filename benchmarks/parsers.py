@@ -0,0 +1,320 @@
+"""
+Micro-benchmarks of the CPU-side parsers, on synthetic Voyager payloads.
+
+Run from the repository root:
+
+    python -m benchmarks.parsers                     # report ops/sec and peak memory
+    python -m benchmarks.parsers --sizes 10 100000   # any payload size
+    python -m benchmarks.parsers --check             # compare with stored baselines
+    python -m benchmarks.parsers --save              # store new baselines
+
+Speeds are checked after scaling out the speed of the machine, estimated as
+the median speed-up over all the benchmarks of the run, so baselines hold
+across machines running the same Python version. Baselines are stored per
+Python version, and a check fails when there are none for the running one.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from benchmarks import payloads
+from linkedin_api import Linkedin
+from linkedin_api.client import Client
+from linkedin_api.decoder import default_json_decoder
+from linkedin_api.utils.helpers import (
+    get_feed_posts_in_order,
+    get_list_posts_sorted_without_promoted,
+    index_feed_posts,
+    parse_list_raw_posts,
+    parse_list_raw_urns,
+)
+
+BASELINES_PATH = os.path.join(os.path.dirname(__file__), "baselines.json")
+# baselines depend on the interpreter, they are stored by "major.minor" version
+PYTHON_VERSION = "{}.{}".format(*sys.version_info)
+DEFAULT_SIZES = (10, 100, 1000)
+# fewer results make too noisy an estimate of the machine speed
+MIN_RESULTS_TO_SCALE = 5
+
+# a parser under test, and a factory of the arguments of one call
+Case = Tuple[Callable, Callable[[], tuple]]
+
+
+def _api() -> Linkedin:
+    return Linkedin("", "", authenticate=False)
+
+
+def bench_parse_list_raw_posts(size: int) -> Case:
+    included = payloads.feed_page(size)["included"]
+    return parse_list_raw_posts, lambda: (included, Client.LINKEDIN_BASE_URL)
+
+
+def bench_sort_posts_without_promoted(size: int) -> Case:
+    page = payloads.feed_page(size)
+    posts = parse_list_raw_posts(page["included"], Client.LINKEDIN_BASE_URL)
+    urns = parse_list_raw_urns(page["data"]["*elements"])
+    # the parser empties the list of posts it is given
+    return get_list_posts_sorted_without_promoted, lambda: (urns, list(posts))
+
+
+def bench_assemble_feed_posts(size: int) -> Case:
+    page = payloads.feed_page(size)
+    included = page["included"]
+    urns = parse_list_raw_urns(page["data"]["*elements"])
+
+    def assemble(urns, included):
+        return get_feed_posts_in_order(
+            urns, index_feed_posts(included, Client.LINKEDIN_BASE_URL)
+        )
+
+    return assemble, lambda: (urns, included)
+
+
+def bench_search(size: int) -> Case:
+    data = payloads.search_page(size)
+    return _api()._parse_search_page, lambda: (data,)
+
+
+def bench_get_profile(size: int) -> Case:
+    raw = payloads.to_bytes(payloads.profile_view(size))
+    # the parser massages the profile in place
+    return _api()._parse_profile, lambda: (json.loads(raw),)
+
+
+def bench_get_profile_urn(size: int) -> Case:
+    data = payloads.profile_view(size)
+    api = _api()
+
+    def get_profile_urn(data):
+        return api._parse_profile(data, lazy=True)["profile_urn"]
+
+    # only the top card is massaged: the sections can be shared by every call
+    return get_profile_urn, lambda: ({**data, "profile": dict(data["profile"])},)
+
+
+def bench_search_jobs(size: int) -> Case:
+    included = payloads.job_search_page(size)["included"]
+    return _api()._parse_job_postings, lambda: (included,)
+
+
+def bench_decode_feed_page(size: int) -> Case:
+    raw = payloads.to_bytes(payloads.feed_page(size))
+    return json.loads, lambda: (raw,)
+
+
+def bench_decode_feed_page_default_decoder(size: int) -> Case:
+    raw = payloads.to_bytes(payloads.feed_page(size))
+    return default_json_decoder(), lambda: (raw,)
+
+
+BENCHMARKS: Dict[str, Callable[[int], Case]] = {
+    "parse_list_raw_posts": bench_parse_list_raw_posts,
+    "get_list_posts_sorted_without_promoted": bench_sort_posts_without_promoted,
+    "assemble_feed_posts": bench_assemble_feed_posts,
+    "search": bench_search,
+    "get_profile": bench_get_profile,
+    "get_profile_urn": bench_get_profile_urn,
+    "search_jobs": bench_search_jobs,
+    "decode_feed_page": bench_decode_feed_page,
+    "decode_feed_page_default_decoder": bench_decode_feed_page_default_decoder,
+}
+
+
+class Result(NamedTuple):
+    name: str
+    size: int
+    ops_per_sec: float
+    peak_bytes: int
+
+    @property
+    def key(self) -> str:
+        return f"{self.name}[{self.size}]"
+
+
+def _time(fn: Callable, make_args: Callable[[], tuple], number: int) -> float:
+    batch = [make_args() for _ in range(number)]
+    start = time.perf_counter()
+    for args in batch:
+        fn(*args)
+    return time.perf_counter() - start
+
+
+def measure(
+    fn: Callable, make_args: Callable[[], tuple], min_time=0.2, repeat=3
+) -> float:
+    """
+    Return the calls per second of `fn`, excluding the preparation of its
+    arguments. Like `timeit`, the best of `repeat` rounds of at least
+    `min_time` seconds is kept, as slower rounds only measure noise.
+    """
+    number = 1
+    while True:
+        elapsed = _time(fn, make_args, number)
+        if elapsed >= min_time:
+            break
+        number *= 2 if elapsed == 0 else max(2, int(min_time / elapsed) + 1)
+
+    best = elapsed
+    for _ in range(repeat - 1):
+        best = min(best, _time(fn, make_args, number))
+    return number / best
+
+
+def peak_memory(fn: Callable, make_args: Callable[[], tuple]) -> int:
+    """Return the peak memory allocated by one call of `fn`, in bytes."""
+    args = make_args()
+    tracemalloc.start()
+    try:
+        baseline, _ = tracemalloc.get_traced_memory()
+        fn(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak - baseline
+
+
+def run(
+    names: Optional[List[str]] = None, sizes=DEFAULT_SIZES, min_time=0.2, repeat=3
+) -> List[Result]:
+    results = []
+    for name in names or BENCHMARKS:
+        for size in sizes:
+            fn, make_args = BENCHMARKS[name](size)
+            results.append(
+                Result(
+                    name,
+                    size,
+                    measure(fn, make_args, min_time, repeat),
+                    peak_memory(fn, make_args),
+                )
+            )
+    return results
+
+
+def _load_all_baselines(path: str) -> Dict[str, Dict[str, Dict]]:
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def load_baselines(path=BASELINES_PATH, version=PYTHON_VERSION) -> Dict[str, Dict]:
+    """Return the baselines stored for Python `version`, by benchmark key."""
+    return _load_all_baselines(path).get(version, {})
+
+
+def save_baselines(results: List[Result], path=BASELINES_PATH, version=PYTHON_VERSION):
+    """Store `results` as baselines of Python `version`, keeping the others."""
+    stored = _load_all_baselines(path)
+    baselines = stored.setdefault(version, {})
+    for result in results:
+        baselines[result.key] = {
+            "ops_per_sec": round(result.ops_per_sec, 1),
+            "peak_bytes": result.peak_bytes,
+        }
+    with open(path, "w") as f:
+        json.dump(stored, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def machine_speed(results: List[Result], baselines: Dict[str, Dict]) -> float:
+    """
+    Return how much faster this machine runs the benchmarks than the one that
+    stored the baselines: the median ratio of their speeds. Most benchmarks are
+    unaffected by a given change, so the median tracks the machine, not the
+    change. Returns 1 when too few results have a baseline.
+    """
+    ratios = [
+        result.ops_per_sec / baselines[result.key]["ops_per_sec"]
+        for result in results
+        if result.key in baselines
+    ]
+    if len(ratios) < MIN_RESULTS_TO_SCALE:
+        return 1.0
+    return statistics.median(ratios)
+
+
+def regressions(
+    results: List[Result], baselines: Dict[str, Dict], tolerance=0.3
+) -> List[str]:
+    """
+    Return a description of every result slower, or hungrier, than its
+    baseline by more than `tolerance`. Speeds are first scaled by
+    `machine_speed`.
+    """
+    scale = machine_speed(results, baselines)
+    found = []
+    for result in results:
+        baseline = baselines.get(result.key)
+        if not baseline:
+            continue
+        expected = baseline["ops_per_sec"] * scale
+        if result.ops_per_sec < expected * (1 - tolerance):
+            found.append(
+                f"{result.key}: {result.ops_per_sec:,.1f} ops/s, expected {expected:,.1f} on this machine"
+            )
+        if result.peak_bytes > baseline["peak_bytes"] * (1 + tolerance):
+            found.append(
+                f"{result.key}: peak {result.peak_bytes:,} B, baseline {baseline['peak_bytes']:,}"
+            )
+    return found
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("names", nargs="*", help=f"any of {', '.join(BENCHMARKS)}")
+    parser.add_argument("--sizes", nargs="+", type=int, default=DEFAULT_SIZES)
+    parser.add_argument("--min-time", type=float, default=0.2)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--baselines", default=BASELINES_PATH)
+    parser.add_argument("--save", action="store_true", help="store new baselines")
+    parser.add_argument("--check", action="store_true", help="fail on regressions")
+    parser.add_argument("--tolerance", type=float, default=0.3)
+    args = parser.parse_args(argv)
+    unknown = set(args.names) - set(BENCHMARKS)
+    if unknown:
+        parser.error(f"unknown benchmark(s): {', '.join(sorted(unknown))}")
+
+    results = run(args.names, args.sizes, args.min_time, args.repeat)
+    baselines = load_baselines(args.baselines)
+    scale = machine_speed(results, baselines)
+
+    print(f"machine speed vs Python {PYTHON_VERSION} baselines: {scale:.2f}x")
+    print(f"{'benchmark':<50} {'ops/s':>14} {'peak KiB':>12} {'vs baseline':>12}")
+    for result in results:
+        baseline = baselines.get(result.key)
+        ratio = (
+            f"{result.ops_per_sec / (baseline['ops_per_sec'] * scale):.2f}x"
+            if baseline
+            else "-"
+        )
+        print(
+            f"{result.key:<50} {result.ops_per_sec:>14,.1f} "
+            f"{result.peak_bytes / 1024:>12,.1f} {ratio:>12}"
+        )
+
+    if args.save:
+        save_baselines(results, args.baselines)
+    if args.check:
+        if not baselines:
+            print(
+                f"no baselines for Python {PYTHON_VERSION}, store them with --save",
+                file=sys.stderr,
+            )
+            return 1
+        found = regressions(results, baselines, args.tolerance)
+        for regression in found:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        return 1 if found else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
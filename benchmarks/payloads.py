@@ -0,0 +1,270 @@
+"""
+Generates synthetic Voyager payloads, shaped like real LinkedIn responses, at any size.
+
+Every generator is deterministic for a given `size` and `seed`.
+"""
+
+import json
+import random
+from typing import Dict, List
+
+ACTIVITY_ID_BASE = 6970000000000000000  # fixed width, like real activity IDs
+
+FILLER_TYPES = (
+    "com.linkedin.voyager.identity.shared.MiniProfile",
+    "com.linkedin.voyager.feed.shared.SocialActivityCounts",
+    "com.linkedin.voyager.organization.shared.MiniCompany",
+    "com.linkedin.voyager.dash.deco.jobs.search.JobPostingCard",
+)
+WORDS = (
+    "growth",
+    "platform",
+    "engineering",
+    "team",
+    "hiring",
+    "launch",
+    "product",
+    "data",
+    "customers",
+    "python",
+    "remote",
+    "thrilled",
+)
+
+
+def _text(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+def _vector_image(rng: random.Random, artifacts=4) -> Dict:
+    return {
+        "com.linkedin.common.VectorImage": {
+            "rootUrl": "https://media.licdn.com/dms/image/C4E03AQ/",
+            "artifacts": [
+                {
+                    "width": 100 * (i + 1),
+                    "height": 100 * (i + 1),
+                    "fileIdentifyingUrlPathSegment": f"{100 * (i + 1)}_{rng.randrange(10**9)}",
+                    "expiresAt": 1700000000000,
+                }
+                for i in range(artifacts)
+            ],
+        }
+    }
+
+
+def _filler(rng: random.Random, i: int) -> Dict:
+    return {
+        "$type": FILLER_TYPES[i % len(FILLER_TYPES)],
+        "entityUrn": f"urn:li:fs_miniProfile:ACoAA{i:08d}",
+        "firstName": rng.choice(WORDS).title(),
+        "occupation": _text(rng, 5),
+        "numLikes": rng.randrange(1000),
+    }
+
+
+def feed_update(rng: random.Random, i: int, promoted=False) -> Dict:
+    """Return one `UpdateV2` entity of a normalized feed page."""
+    activity_urn = f"urn:li:activity:{ACTIVITY_ID_BASE + i}"
+    actor_urn = (
+        f"urn:li:company:{i}" if promoted or i % 5 == 0 else f"urn:li:member:{i}"
+    )
+    update = {
+        "$type": "com.linkedin.voyager.feed.render.UpdateV2",
+        "entityUrn": f"urn:li:fs_updateV2:({activity_urn},MAIN_FEED,EMPTY,DEFAULT,false)",
+        "actor": {
+            "name": {"text": _text(rng, 2).title()},
+            "urn": actor_urn,
+            "subDescription": {
+                "text": "Promoted" if promoted else f"{rng.randrange(1, 24)}h • "
+            },
+        },
+        "updateMetadata": {"urn": activity_urn, "actionsPosition": "ACTOR_COMPONENT"},
+        "commentary": {"text": {"text": _text(rng, 30)}},
+    }
+    if i % 7 == 0:
+        # reshares carry no commentary of their own
+        update["commentary"] = None
+        update["*resharedUpdate"] = (
+            f"urn:li:fs_updateV2:(urn:li:activity:{ACTIVITY_ID_BASE - i},"
+            "MAIN_FEED,EMPTY,DEFAULT,false)"
+        )
+    return update
+
+
+def feed_page(size: int, promoted_ratio=0.1, filler_ratio=1.0, seed=0) -> Dict:
+    """
+    Return a normalized `/feed/updatesV2` page of `size` updates.
+
+    `data["*elements"]` lists the updates in feed order, while `included` holds
+    them shuffled among `filler_ratio * size` unrelated entities, as Voyager does.
+    """
+    rng = random.Random(seed)
+    updates = [feed_update(rng, i, rng.random() < promoted_ratio) for i in range(size)]
+    elements = [update["entityUrn"] for update in updates]
+    included = updates + [_filler(rng, i) for i in range(int(size * filler_ratio))]
+    rng.shuffle(included)
+    return {
+        "data": {"*elements": elements, "paging": {"start": 0, "count": size}},
+        "included": included,
+    }
+
+
+def search_page(size: int, cluster_size=10, seed=0) -> Dict:
+    """Return a `voyagerSearchDashClusters` graphql page of `size` results."""
+    rng = random.Random(seed)
+    clusters = []
+    for start in range(0, size, cluster_size):
+        items = []
+        for i in range(start, min(start + cluster_size, size)):
+            items.append(
+                {
+                    "_type": "com.linkedin.voyager.dash.search.SearchItem",
+                    "item": {
+                        "entityResult": {
+                            "_type": "com.linkedin.voyager.dash.search.EntityResultViewModel",
+                            "entityUrn": f"urn:li:fsd_entityResultViewModel:(urn:li:fsd_profile:ACoAA{i:08d},SEARCH_SRP,DEFAULT)",
+                            "title": {"text": _text(rng, 2).title()},
+                            "primarySubtitle": {"text": _text(rng, 4)},
+                            "secondarySubtitle": {"text": _text(rng, 2)},
+                            "navigationUrl": f"https://www.linkedin.com/in/user-{i}",
+                            "badgeText": {"text": "• 2nd"},
+                        }
+                    },
+                }
+            )
+        # a cluster of "people also searched" without entity results
+        items.append(
+            {"_type": "com.linkedin.voyager.dash.search.SearchItem", "item": {}}
+        )
+        clusters.append(
+            {
+                "_type": "com.linkedin.voyager.dash.search.SearchClusterViewModel",
+                "items": items,
+            }
+        )
+    return {
+        "data": {
+            "searchDashClustersByAll": {
+                "_type": "com.linkedin.restli.common.CollectionResponse",
+                "elements": clusters,
+                "paging": {"start": 0, "count": size, "total": size},
+            }
+        }
+    }
+
+
+PROFILE_SECTIONS = (
+    "languageView",
+    "publicationView",
+    "certificationView",
+    "volunteerExperienceView",
+    "honorView",
+    "projectView",
+    "skillView",
+)
+
+
+def profile_view(size: int, seed=0) -> Dict:
+    """
+    Return a `profileView` response whose sections hold `size` elements in total.
+    """
+    rng = random.Random(seed)
+    per_section = max(1, size // (len(PROFILE_SECTIONS) + 2))
+
+    def elements(kind: str) -> List[Dict]:
+        return [
+            {
+                "entityUrn": f"urn:li:fs_{kind}:(ACoAA,{i})",
+                "name": _text(rng, 3),
+                "description": _text(rng, 20),
+            }
+            for i in range(per_section)
+        ]
+
+    data = {
+        "profile": {
+            "miniProfile": {
+                "picture": _vector_image(rng),
+                "entityUrn": "urn:li:fs_miniProfile:ACoAABQ11fIB",
+                "objectUrn": "urn:li:member:123456",
+                "publicIdentifier": "billy-g",
+            },
+            "entityUrn": "urn:li:fs_profile:ACoAABQ11fIB",
+            "firstName": "Billy",
+            "lastName": "G",
+            "headline": _text(rng, 8),
+            "summary": _text(rng, 60),
+            "defaultLocale": {"country": "US", "language": "en"},
+            "supportedLocales": [{"country": "US", "language": "en"}],
+            "versionTag": "1234",
+            "showEducationOnProfileTopCard": True,
+        },
+        "positionView": {
+            "elements": [
+                {
+                    "entityUrn": f"urn:li:fs_position:(ACoAA,{i})",
+                    "title": _text(rng, 3),
+                    "description": _text(rng, 40),
+                    "company": {
+                        "miniCompany": {
+                            "logo": _vector_image(rng, artifacts=2),
+                            "name": _text(rng, 2),
+                        },
+                        "employeeCountRange": {"start": 51, "end": 200},
+                    },
+                }
+                for i in range(per_section)
+            ]
+        },
+        "educationView": {
+            "elements": [
+                {
+                    "entityUrn": f"urn:li:fs_education:(ACoAA,{i})",
+                    "degreeName": _text(rng, 2),
+                    "school": {
+                        "schoolName": _text(rng, 3),
+                        "logo": _vector_image(rng, artifacts=2),
+                    },
+                }
+                for i in range(per_section)
+            ]
+        },
+    }
+    for section in PROFILE_SECTIONS:
+        data[section] = {"elements": elements(section)}
+    for publication in data["publicationView"]["elements"]:
+        publication["authors"] = [
+            {"entityUrn": f"urn:li:fs_contributor:{i}", "name": _text(rng, 2)}
+            for i in range(3)
+        ]
+    return data
+
+
+def job_search_page(size: int, posting_ratio=0.25, seed=0) -> Dict:
+    """
+    Return a normalized `voyagerJobsDashJobCards` page whose `included` holds
+    `size` entities, `posting_ratio` of them job postings.
+    """
+    rng = random.Random(seed)
+    included = []
+    for i in range(size):
+        if rng.random() < posting_ratio:
+            included.append(
+                {
+                    "$type": "com.linkedin.voyager.dash.jobs.JobPosting",
+                    "entityUrn": f"urn:li:fsd_jobPosting:{3700000000 + i}",
+                    "title": _text(rng, 3).title(),
+                    "repostedJob": False,
+                    "posterId": str(rng.randrange(10**8)),
+                    "contentSource": "JOBS_PREMIUM_OFFLINE",
+                }
+            )
+        else:
+            included.append(_filler(rng, i))
+    return {"data": {"paging": {"start": 0, "count": size}}, "included": included}
+
+
+def to_bytes(payload: Dict) -> bytes:
+    """Return a payload serialized as LinkedIn sends it."""
+    return json.dumps(payload, separators=(",", ":")).encode()
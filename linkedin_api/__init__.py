@@ -2,7 +2,24 @@
     linkedin-api
 """
 
-from .linkedin import Linkedin
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .linkedin import Linkedin
+    from .account_pool import AccountPool
+    from .bulk import BulkResult
+    from .cache import ResponseCache
+    from .cassette import Cassette
+    from .cookie_repository import SQLiteCookieRepository
+    from .entity_store import EntityStore
+    from .metrics import MetricsRegistry
+    from .models import CompanyResult, FeedPost, JobCard, LazyProfile, PersonResult
+    from .proxy_pool import ProxyPool
+    from .async_linkedin import AsyncLinkedin
+    from .rate_limiter import RateLimiter
+    from .retry import RetryPolicy
+    from .transport import TransportConfig
 
 __title__ = "linkedin_api"
 __version__ = "2.1.1"
@@ -13,4 +30,60 @@ __license__ = "MIT"
 __author__ = "Tom Quirk"
 __email__ = "tomquirkacc@gmail.com"
 
-__all__ = ["Linkedin"]
+__all__ = [
+    "Linkedin",
+    "AccountPool",
+    "BulkResult",
+    "AsyncLinkedin",
+    "Cassette",
+    "EntityStore",
+    "MetricsRegistry",
+    "CompanyResult",
+    "FeedPost",
+    "JobCard",
+    "LazyProfile",
+    "PersonResult",
+    "ProxyPool",
+    "RateLimiter",
+    "ResponseCache",
+    "RetryPolicy",
+    "SQLiteCookieRepository",
+    "TransportConfig",
+]
+
+# public names, imported from their module on first access: importing the
+# package alone stays cheap for short-lived processes
+_LAZY = {
+    "Linkedin": ".linkedin",
+    "AccountPool": ".account_pool",
+    "BulkResult": ".bulk",
+    "AsyncLinkedin": ".async_linkedin",
+    "Cassette": ".cassette",
+    "EntityStore": ".entity_store",
+    "MetricsRegistry": ".metrics",
+    "CompanyResult": ".models",
+    "FeedPost": ".models",
+    "JobCard": ".models",
+    "LazyProfile": ".models",
+    "PersonResult": ".models",
+    "ProxyPool": ".proxy_pool",
+    "RateLimiter": ".rate_limiter",
+    "ResponseCache": ".cache",
+    "RetryPolicy": ".retry",
+    "SQLiteCookieRepository": ".cookie_repository",
+    "TransportConfig": ".transport",
+}
+
+
+def __getattr__(name: str):
+    try:
+        module = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,274 @@
+"""
+Provides spreading of Linkedin API calls over many accounts
+"""
+
+import inspect
+import logging
+import threading
+from functools import partial
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+
+from linkedin_api.bulk import BulkResult, iter_bulk
+from linkedin_api.client import Client, ChallengeException, UnauthorizedException
+from linkedin_api.linkedin import Linkedin
+from linkedin_api.utils.helpers import get_id_from_urn
+
+logger = logging.getLogger(__name__)
+
+# errors taking an account out of rotation
+ACCOUNT_ERRORS = (ChallengeException, UnauthorizedException)
+# statuses of API responses refusing the account itself: logged out,
+# forbidden, or Linkedin's "999 request denied"
+ACCOUNT_STATUSES = frozenset((401, 403, 999))
+
+
+def check_account_response(res, *args, **kwargs):
+    """
+    Raise the account error of an API response refusing its account: a
+    status of `ACCOUNT_STATUSES`, or a redirect to a security challenge. A
+    `requests` response hook, installed on the accounts of a pool.
+    """
+    if not res.request.url.startswith(Client.API_BASE_URL):
+        return
+    location = res.headers.get("Location", "") if res.is_redirect else ""
+    if "/checkpoint/" in location:
+        raise ChallengeException(
+            f"{res.request.method} {res.url} redirected to a challenge"
+        )
+    if res.status_code in ACCOUNT_STATUSES:
+        raise UnauthorizedException(
+            f"{res.request.method} {res.url} answered {res.status_code}"
+        )
+
+
+class NoAccountAvailable(Exception):
+    pass
+
+
+def get_method_family(name: str) -> str:
+    """
+    Return the endpoint family (see `get_endpoint_family`) a `Linkedin`
+    method mostly sends requests to.
+    """
+    if name.startswith("search"):
+        return "search"
+    if name.startswith("get_profile"):
+        return "profile"
+    return "default"
+
+
+class _Account(object):
+    """An account of the pool, and its load."""
+
+    def __init__(self, name: str, api: Linkedin):
+        self.name = name
+        self.api = api
+        self.in_flight = 0
+        self.calls = 0
+        self.error: Optional[Exception] = None
+
+
+class AccountPool(object):
+    """
+    Spreads Linkedin API calls over many authenticated accounts.
+
+    The pool has the methods of `Linkedin`. A call goes to the healthy
+    account with the most rate budget left for its endpoint family, net of
+    its calls in flight (with a `RateLimiter`), then with the fewest calls in
+    flight and made so far.
+
+    Methods acting on the state of one account (`ACCOUNT_METHODS`:
+    messaging, invitations, connections, own feed...) are pinned to it: pass
+    ``account=<name>``. Conversations listed through the pool are remembered,
+    so later calls on them go to their owning account without it.
+
+    An account raising `ChallengeException` or `UnauthorizedException`, at
+    login or because an API call was refused (see `check_account_response`),
+    is taken out of rotation, and calls not pinned to it are retried on
+    another account.
+
+    :param accounts: `Linkedin` instances, by account name
+    :type accounts: dict, optional
+    """
+
+    ACCOUNT_METHODS = frozenset(
+        (
+            "get_conversations",
+            "get_conversation_details",
+            "get_conversation",
+            "send_message",
+            "mark_conversation_as_seen",
+            "get_user_profile",
+            "get_invitations",
+            "reply_invitation",
+            "add_connection",
+            "remove_connection",
+            "get_current_profile_views",
+            "get_feed_posts",
+            "iter_feed_posts",
+            "unfollow_entity",
+            "track",
+        )
+    )
+
+    def __init__(self, accounts: Optional[Dict[str, Linkedin]] = None):
+        self._accounts: Dict[str, _Account] = {}
+        # conversation id -> name of the account it belongs to
+        self._owners: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        for name, api in (accounts or {}).items():
+            self.add(name, api)
+
+    @classmethod
+    def login(cls, credentials: Dict[str, str], **kwargs) -> "AccountPool":
+        """
+        Return a pool of the accounts of `credentials`, by username, logged
+        in with their password. `kwargs` are passed to `Linkedin`. Accounts
+        failing to log in are out of rotation.
+        """
+        pool = cls()
+        for username, password in credentials.items():
+            api = Linkedin(username, password, authenticate=False, **kwargs)
+            pool.add(username, api)
+            try:
+                api.client.authenticate(username, password)
+            except ACCOUNT_ERRORS as e:
+                pool.disable(username, e)
+        return pool
+
+    def add(self, name: str, api: Linkedin):
+        """Put the account `name`, using `api`, in rotation."""
+        hooks = api.client.session.hooks["response"]
+        if check_account_response not in hooks:
+            hooks.append(check_account_response)
+        with self._lock:
+            self._accounts[name] = _Account(name, api)
+
+    def disable(self, name: str, error: Optional[Exception] = None):
+        """Take the account `name` out of rotation, because of `error`."""
+        logger.warning(f"Account {name} out of rotation: {error!r}")
+        with self._lock:
+            self._accounts[name].error = error or Exception("disabled")
+
+    def enable(self, name: str):
+        """Put the account `name` back in rotation, e.g. once its challenge is solved."""
+        with self._lock:
+            self._accounts[name].error = None
+
+    @property
+    def healthy(self) -> List[str]:
+        """Names of the accounts in rotation."""
+        with self._lock:
+            return [a.name for a in self._accounts.values() if a.error is None]
+
+    def account(self, name: str) -> Linkedin:
+        """Return the `Linkedin` instance of the account `name`."""
+        return self._accounts[name].api
+
+    def __getattr__(self, name: str):
+        if name.startswith("_") or not callable(getattr(Linkedin, name, None)):
+            raise AttributeError(f"{type(self).__name__!r} has no attribute {name!r}")
+        return partial(self.call, name)
+
+    def call(self, method: str, *args, account: Optional[str] = None, **kwargs):
+        """Call `Linkedin.<method>` on the account chosen for it."""
+        if method in self.ACCOUNT_METHODS or account is not None:
+            chosen = self._reserve(self._owner(method, account, args, kwargs))
+            result = self._run(chosen, method, args, kwargs)
+            self._remember_conversations(chosen.name, method, result)
+            return result
+
+        tried = set()
+        while True:
+            chosen = self._pick(get_method_family(method), tried)
+            try:
+                return self._run(chosen, method, args, kwargs)
+            except ACCOUNT_ERRORS:
+                tried.add(chosen.name)
+
+    def get_profiles(
+        self,
+        ids: Iterable[Union[str, Dict]],
+        max_concurrency: Optional[int] = None,
+        getter="get_profile",
+    ) -> Iterator[BulkResult]:
+        """
+        Like `Linkedin.get_profiles`, with the calls spread over the
+        accounts: by default, one call in flight per healthy account.
+        """
+        if getter not in Linkedin.PROFILE_GETTERS:
+            raise ValueError(
+                f"getter must be one of {', '.join(Linkedin.PROFILE_GETTERS)}, not {getter!r}"
+            )
+        concurrency = max_concurrency or max(1, len(self.healthy))
+        return iter_bulk(partial(self.call, getter), ids, concurrency)
+
+    def _pick(self, family: str, exclude) -> _Account:
+        """Reserve the least loaded healthy account not in `exclude`."""
+        with self._lock:
+            candidates = [
+                a
+                for a in self._accounts.values()
+                if a.error is None and a.name not in exclude
+            ]
+            if not candidates:
+                raise NoAccountAvailable("No account left in rotation")
+            # calls in flight are about to spend some of the budget
+            chosen = max(
+                candidates,
+                key=lambda a: (
+                    self._budget(a, family) - a.in_flight,
+                    -a.in_flight,
+                    -a.calls,
+                ),
+            )
+            chosen.in_flight += 1
+            chosen.calls += 1
+            return chosen
+
+    @staticmethod
+    def _budget(account: _Account, family: str) -> float:
+        limiter = account.api.rate_limiter
+        return limiter.remaining(family) if limiter else float("inf")
+
+    def _reserve(self, name: str) -> _Account:
+        """Reserve the account `name`, which must be in rotation."""
+        with self._lock:
+            chosen = self._accounts[name]
+            if chosen.error is not None:
+                raise NoAccountAvailable(
+                    f"Account {name} is out of rotation: {chosen.error!r}"
+                )
+            chosen.in_flight += 1
+            chosen.calls += 1
+            return chosen
+
+    def _run(self, account: _Account, method: str, args, kwargs):
+        try:
+            return getattr(account.api, method)(*args, **kwargs)
+        except ACCOUNT_ERRORS as e:
+            self.disable(account.name, e)
+            raise
+        finally:
+            with self._lock:
+                account.in_flight -= 1
+
+    def _owner(self, method: str, account: Optional[str], args, kwargs) -> str:
+        """Return the name of the account a pinned call must go to."""
+        bound = inspect.signature(getattr(Linkedin, method)).bind(None, *args, **kwargs)
+        conversation = bound.arguments.get("conversation_urn_id")
+        if account is not None:
+            if conversation:
+                self._owners[conversation] = account
+            return account
+        if conversation in self._owners:
+            return self._owners[conversation]
+        raise ValueError(f"{method} acts on one account: pass account=<name>")
+
+    def _remember_conversations(self, name: str, method: str, result):
+        """Record the owner of the conversations a call returned."""
+        if method == "get_conversations" and isinstance(result, dict):
+            for conversation in result.get("elements", []):
+                self._owners[get_id_from_urn(conversation["entityUrn"])] = name
+        elif method == "get_conversation_details" and result:
+            self._owners[result["id"]] = name
@@ -0,0 +1,276 @@
+import asyncio
+import logging
+import time
+from linkedin_api.cassette import Cassette
+from linkedin_api.client import Client, ChallengeException, UnauthorizedException
+from linkedin_api.cookie_repository import CookieRepository
+from linkedin_api.meta_tags import META_CHUNK_SIZE, MetaTagScanner
+from linkedin_api.transport import TransportConfig
+from typing import Optional
+from requests.cookies import RequestsCookieJar, merge_cookies
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None
+
+logger = logging.getLogger(__name__)
+
+
+def _proxy_mounts(proxies, limits, http2=False):
+    """
+    Translate a `requests`-style proxies dict into httpx transport mounts.
+    """
+    mounts = {}
+    for scheme, proxy in proxies.items():
+        pattern = scheme if "://" in scheme else f"{scheme}://"
+        mounts[pattern] = httpx.AsyncHTTPTransport(
+            proxy=proxy, limits=limits, http2=http2
+        )
+    return mounts
+
+
+if httpx is not None:
+
+    class AsyncCassetteTransport(httpx.AsyncBaseTransport):
+        """httpx transport recording to, or replaying from, a `Cassette`."""
+
+        def __init__(self, cassette: Cassette, transport=None):
+            self.cassette = cassette
+            self.transport = transport
+
+        async def handle_async_request(self, request):
+            url = str(request.url)
+            if not self.cassette.replaying:
+                res = await self.transport.handle_async_request(request)
+                body = await res.aread()
+                self.cassette.record(
+                    request.method, url, res.status_code, res.headers, body
+                )
+                return httpx.Response(
+                    res.status_code,
+                    headers=[
+                        (name, value)
+                        for name, value in res.headers.multi_items()
+                        if name.lower() not in ("content-encoding", "content-length")
+                    ],
+                    content=body,
+                    request=request,
+                )
+
+            status_code, headers, body = self.cassette.play(request.method, url)
+            return httpx.Response(
+                status_code, headers=headers, content=body, request=request
+            )
+
+        async def aclose(self):
+            if self.transport is not None:
+                await self.transport.aclose()
+
+    class AsyncProxyPoolTransport(httpx.AsyncBaseTransport):
+        """httpx transport sending each request through a proxy of a `ProxyPool`."""
+
+        def __init__(self, pool, key=lambda: None, **transport_kwargs):
+            self.pool = pool
+            self.key = key
+            self.transport_kwargs = transport_kwargs
+            # proxy url -> transport, created on first use
+            self.transports = {}
+
+        async def handle_async_request(self, request):
+            url = self.pool.acquire(self.key())
+            if url not in self.transports:
+                self.transports[url] = httpx.AsyncHTTPTransport(
+                    proxy=url, **self.transport_kwargs
+                )
+            start = time.monotonic()
+            try:
+                res = await self.transports[url].handle_async_request(request)
+            except httpx.TransportError as e:
+                self.pool.record(url, time.monotonic() - start, error=e)
+                raise
+            self.pool.record(url, time.monotonic() - start, res.status_code)
+            return res
+
+        async def aclose(self):
+            for transport in self.transports.values():
+                await transport.aclose()
+
+
+class AsyncClient(Client):
+    """
+    Class to act as an asyncio client for the Linkedin API.
+
+    Requests go through a single pooled `httpx.AsyncClient`, so many of them
+    can be in flight at once.
+    """
+
+    def __init__(
+        self,
+        *,
+        debug=False,
+        refresh_cookies=False,
+        proxies={},
+        cookies_dir: str = "",
+        transport: Optional[TransportConfig] = None,
+        cassette: Optional[Cassette] = None,
+        cookie_repository=None,
+        proxy_pool=None,
+    ):
+        if httpx is None:
+            raise ImportError(
+                "AsyncClient requires httpx. Install it with `pip install linkedin-api[async]`."
+            )
+
+        self.transport = transport or TransportConfig()
+        self.cassette = cassette
+        self.proxy_pool = proxy_pool
+        self.proxy_key = f"client-{id(self)}"
+        limits = self.transport.httpx_limits()
+        if proxy_pool is not None:
+            mounts = {}
+            http_transport = proxy_pool.async_transport(
+                lambda: self.proxy_key, limits=limits, http2=self.transport.http2
+            )
+        else:
+            mounts = _proxy_mounts(proxies, limits, self.transport.http2)
+            http_transport = httpx.AsyncHTTPTransport(
+                limits=limits, http2=self.transport.http2
+            )
+        if cassette is not None:
+            http_transport = cassette.async_transport(http_transport)
+            mounts = {
+                pattern: cassette.async_transport(mounted)
+                for pattern, mounted in mounts.items()
+            }
+        self.session = httpx.AsyncClient(
+            headers=Client.REQUEST_HEADERS,
+            transport=http_transport,
+            mounts=mounts,
+            follow_redirects=True,
+            timeout=None,
+        )
+        self.proxies = proxies
+        self.logger = logger
+        self.metadata = {}
+        self._use_cookie_cache = not refresh_cookies
+        self._cookie_repository = cookie_repository or CookieRepository(
+            cookies_dir=cookies_dir
+        )
+
+        logging.basicConfig(level=logging.DEBUG if debug else logging.INFO)
+
+    async def prewarm(self):
+        """
+        Open `transport.prewarm` pooled connections to Linkedin ahead of the first requests.
+        """
+        count = self.transport.prewarm or 1
+        self.logger.debug(f"Pre-warming {count} connection(s).")
+
+        results = await asyncio.gather(
+            *(self.session.head(Client.LINKEDIN_BASE_URL) for _ in range(count)),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                self.logger.debug(f"Pre-warming failed: {result}")
+
+    async def close(self):
+        """
+        Close the underlying connection pool.
+        """
+        await self.session.aclose()
+
+    async def _send_auth_request(self, method: str, url: str, stream=False, **kwargs):
+        """
+        Send a request with the authentication headers only, as done by `Client`.
+        """
+        request = self.session.build_request(method, url, **kwargs)
+        for name in (*Client.REQUEST_HEADERS, "csrf-token"):
+            request.headers.pop(name, None)
+        request.headers.update(Client.AUTH_REQUEST_HEADERS)
+
+        return await self.session.send(request, stream=stream)
+
+    async def _request_session_cookies(self):
+        """
+        Return a new set of session cookies as given by Linkedin.
+        """
+        self.logger.debug("Requesting new cookies.")
+
+        res = await self._send_auth_request(
+            "GET", f"{Client.LINKEDIN_BASE_URL}/uas/authenticate"
+        )
+        return res.cookies.jar
+
+    async def authenticate(self, username: str, password: str):
+        self.proxy_key = username
+        if self._use_cookie_cache:
+            self.logger.debug("Attempting to use cached cookies")
+            cookies = self._cookie_repository.get(username)
+            if cookies:
+                self.logger.debug("Using cached cookies")
+                self._set_session_cookies(cookies)
+                if not self._restore_metadata(username):
+                    await self._fetch_metadata()
+                    self._cookie_repository.save_metadata(self.metadata, username)
+                return
+
+        await self._do_authentication_request(username, password)
+        await self._fetch_metadata()
+        self._cookie_repository.save_metadata(self.metadata, username)
+
+    async def _fetch_metadata(self):
+        """
+        Get metadata about the "instance" of the LinkedIn application for the signed in user.
+
+        Store this data in self.metadata. The page is only read up to its
+        metadata tags.
+        """
+        res = await self._send_auth_request(
+            "GET", f"{Client.LINKEDIN_BASE_URL}", stream=True
+        )
+        scanner = MetaTagScanner(Client.METADATA_TAGS)
+        try:
+            async for chunk in res.aiter_bytes(META_CHUNK_SIZE):
+                if scanner.feed(chunk):
+                    break
+        finally:
+            await res.aclose()
+
+        self._set_metadata(scanner.found)
+
+    async def _do_authentication_request(self, username: str, password: str):
+        """
+        Authenticate with Linkedin.
+
+        Return a session object that is authenticated.
+        """
+        self._set_session_cookies(await self._request_session_cookies())
+
+        payload = {
+            "session_key": username,
+            "session_password": password,
+            "JSESSIONID": self.session.cookies["JSESSIONID"],
+        }
+
+        res = await self._send_auth_request(
+            "POST", f"{Client.LINKEDIN_BASE_URL}/uas/authenticate", data=payload
+        )
+
+        data = res.json()
+
+        if data and data["login_result"] != "PASS":
+            raise ChallengeException(data["login_result"])
+
+        if res.status_code == 401:
+            raise UnauthorizedException()
+
+        if res.status_code != 200:
+            raise Exception()
+
+        self._set_session_cookies(res.cookies.jar)
+        # persist as a RequestsCookieJar so the cookie cache is shared with `Client`
+        self._cookie_repository.save(
+            merge_cookies(RequestsCookieJar(), res.cookies.jar), username
+        )
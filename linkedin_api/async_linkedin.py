@@ -0,0 +1,191 @@
+"""
+Provides asyncio linkedin api-related code
+"""
+
+import asyncio
+import random
+from typing import AsyncIterator
+
+from linkedin_api.async_client import AsyncClient, httpx
+from linkedin_api.bulk import aiter_bulk
+from linkedin_api.cache import cache_key
+from linkedin_api.linkedin import Linkedin
+from linkedin_api.metrics import endpoint_template
+from linkedin_api.pagination import AsyncPagePrefetcher
+from linkedin_api.partitioned_search import aiter_partitions
+from linkedin_api.plans import aconsume, aiter_plan, arun_plan
+from linkedin_api.single_flight import AsyncSingleFlight
+from linkedin_api.streaming import STREAM_CHUNK_SIZE, AsyncStreamedPage
+from linkedin_api.utils.helpers import get_endpoint_family
+
+
+async def default_evade():
+    """
+    Awaitable counterpart of `linkedin_api.linkedin.default_evade`.
+    Delays the request by a random (bounded) time without blocking the event loop
+    """
+    await asyncio.sleep(random.randint(2, 5))
+
+
+class AsyncLinkedin(Linkedin):
+    """
+    Class for accessing the LinkedIn API with asyncio.
+
+    Exposes the same methods as :class:`Linkedin`, as coroutines, so a single
+    event loop can have many calls in flight: the `iter_*` methods and
+    `get_profiles` return async iterators. The methods are the plans of
+    :class:`Linkedin` (see `linkedin_api.plans`), run with the I/O of this
+    class. Authentication happens on ``async with`` or an explicit
+    ``await api.authenticate()``. Takes the same keyword arguments as
+    :class:`Linkedin`.
+
+    :param username: Username of LinkedIn account.
+    :type username: str
+    :param password: Password of LinkedIn account.
+    :type password: str
+    """
+
+    _CLIENT = AsyncClient
+    _SINGLE_FLIGHT = AsyncSingleFlight
+    _PREFETCHER = AsyncPagePrefetcher
+    _run = staticmethod(arun_plan)
+    _iterate = staticmethod(aiter_plan)
+    _consume = staticmethod(aconsume)
+    _iter_bulk = staticmethod(aiter_bulk)
+    _iter_partitions = staticmethod(aiter_partitions)
+
+    def __init__(
+        self, username: str, password: str, *, authenticate=True, cookies=None, **kwargs
+    ):
+        """Constructor method"""
+        self._configure(**kwargs)
+
+        self._credentials = (username, password)
+        self._needs_authentication = authenticate and not cookies
+        if authenticate and cookies:
+            # If the cookies are expired, the API won't work anymore since
+            # `username` and `password` are not used at all in this case.
+            self.client._set_session_cookies(cookies)
+
+    async def __aenter__(self):
+        if self.client.transport.prewarm:
+            await self.client.prewarm()
+        if self._needs_authentication:
+            await self.authenticate()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def authenticate(self):
+        """Authenticate with the credentials given to the constructor."""
+        await self.client.authenticate(*self._credentials)
+        self._needs_authentication = False
+
+    async def close(self):
+        """Close the underlying connection pool."""
+        await self.client.close()
+
+    async def _pace(self, method: str, uri: str, evade):
+        """Wait before a request, using the rate limiter when one is set"""
+        if self.client.cassette is not None and self.client.cassette.replaying:
+            return
+        if self.rate_limiter and evade is default_evade:
+            await self.rate_limiter.acquire_async(get_endpoint_family(method, uri))
+        else:
+            await evade()
+
+    async def _request(
+        self, method: str, uri: str, evade=default_evade, base_request=False, **kwargs
+    ):
+        """Async counterpart of :meth:`Linkedin._request`."""
+        url = f"{self.client.API_BASE_URL if not base_request else self.client.LINKEDIN_BASE_URL}{uri}"
+        if method != "GET":
+            return await self._send(method, uri, url, evade, **kwargs)
+
+        key = cache_key(method, url, kwargs.get("params"), kwargs.get("headers"))
+        if self.cache is not None:
+            entry = self.cache.get(key)
+            if entry is not None:
+                return httpx.Response(
+                    entry.status_code,
+                    headers=entry.headers,
+                    content=entry.content,
+                    request=httpx.Request(method, entry.url),
+                )
+
+        if self._in_flight is None:
+            return await self._send_and_cache(key, uri, url, evade, **kwargs)
+        return await self._in_flight.do(
+            key, lambda: self._send_and_cache(key, uri, url, evade, **kwargs)
+        )
+
+    async def _send_and_cache(self, key: str, uri: str, url: str, evade, **kwargs):
+        """Async counterpart of :meth:`Linkedin._send_and_cache`."""
+        res = await self._send("GET", uri, url, evade, **kwargs)
+        if self.cache is not None:
+            self.cache.set(
+                key, uri, str(res.url), res.status_code, res.headers, res.content
+            )
+        return res
+
+    async def _send(self, method: str, uri: str, url: str, evade, **kwargs):
+        """Async counterpart of :meth:`Linkedin._send`."""
+        # httpx expects raw bodies as `content`; `data` is for form fields
+        if isinstance(kwargs.get("data"), (str, bytes)):
+            kwargs["content"] = kwargs.pop("data")
+
+        endpoint = endpoint_template(uri) if self.metrics is not None else None
+        stream = kwargs.pop("stream", False)
+        session = self.client.session
+
+        attempt = 0
+        while True:
+            with self._timer("evade", method, endpoint):
+                await self._pace(method, uri, evade)
+            try:
+                with self._timer("network", method, endpoint):
+                    if stream:
+                        request = session.build_request(method, url, **kwargs)
+                        res = await session.send(request, stream=True)
+                    else:
+                        res = await session.request(method, url, **kwargs)
+            except httpx.TransportError as e:
+                delay = self._retry_delay(method, uri, endpoint, attempt, error=e)
+                if delay is None:
+                    raise
+            else:
+                delay = self._retry_delay(
+                    method, uri, endpoint, attempt, res=res, stream=stream
+                )
+                if delay is None:
+                    return res
+                await res.aclose()
+            await self.retry_policy.async_sleep(delay)
+            attempt += 1
+
+    async def _fetch(self, uri: str, evade=default_evade, base_request=False, **kwargs):
+        """GET request to Linkedin API"""
+        return await self._request("GET", uri, evade, base_request, **kwargs)
+
+    async def _stream(self, uri: str, needles, evade=default_evade, **kwargs):
+        """
+        Async counterpart of :meth:`Linkedin._stream`, returning an
+        `AsyncStreamedPage` of the wanted `included` entities.
+        """
+        url = f"{self.client.API_BASE_URL}{uri}"
+        res = await self._send("GET", uri, url, evade, stream=True, **kwargs)
+        return AsyncStreamedPage(self._aiter_body(res), needles, self.json_decoder)
+
+    @staticmethod
+    async def _aiter_body(res) -> AsyncIterator[bytes]:
+        """Async counterpart of :meth:`Linkedin._iter_body`."""
+        try:
+            async for chunk in res.aiter_bytes(STREAM_CHUNK_SIZE):
+                yield chunk
+        finally:
+            await res.aclose()
+
+    async def _post(self, uri: str, evade=default_evade, base_request=False, **kwargs):
+        """POST request to Linkedin API"""
+        return await self._request("POST", uri, evade, base_request, **kwargs)
@@ -0,0 +1,100 @@
+"""
+Provides bounded-concurrency fan-out of per-item Linkedin API calls
+"""
+
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Iterable, Iterator, NamedTuple, Optional, Union
+
+
+class BulkResult(NamedTuple):
+    """
+    Outcome of one item of a bulk call.
+
+    :param id: Item as given by the caller
+    :param value: Value returned for the item, None if the call raised
+    :param error: Exception raised for the item, None on success
+    """
+
+    id: Union[str, dict]
+    value: Any = None
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _call(fn: Callable, item: Union[str, dict]):
+    """Call `fn` with a positional id, or with keyword arguments for a dict item"""
+    if isinstance(item, dict):
+        return fn(**item)
+    return fn(item)
+
+
+def _run(fn: Callable, item: Union[str, dict]) -> BulkResult:
+    try:
+        return BulkResult(item, _call(fn, item))
+    except Exception as e:
+        return BulkResult(item, error=e)
+
+
+def iter_bulk(
+    fn: Callable, items: Iterable, max_concurrency: int = 4
+) -> Iterator[BulkResult]:
+    """
+    Call `fn` for every item on a thread pool, yielding results as they complete.
+
+    At most `max_concurrency` calls are in flight, and `items` is consumed
+    lazily, so long (or endless) inputs are fine. An exception raised for one
+    item is returned in its `BulkResult` and does not stop the others.
+    """
+    items = iter(items)
+    executor = ThreadPoolExecutor(max_workers=max_concurrency)
+    pending = set()
+    try:
+        while True:
+            for item in items:
+                pending.add(executor.submit(_run, fn, item))
+                if len(pending) >= max_concurrency:
+                    break
+            if not pending:
+                return
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+async def aiter_bulk(fn: Callable, items: Iterable, max_concurrency: int = 4):
+    """
+    Async counterpart of `iter_bulk`, for coroutine functions.
+    """
+    import asyncio
+
+    async def run(item):
+        try:
+            return BulkResult(item, await _call(fn, item))
+        except Exception as e:
+            return BulkResult(item, error=e)
+
+    items = iter(items)
+    pending = set()
+    try:
+        while True:
+            for item in items:
+                pending.add(asyncio.ensure_future(run(item)))
+                if len(pending) >= max_concurrency:
+                    break
+            if not pending:
+                return
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
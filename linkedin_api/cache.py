@@ -0,0 +1,262 @@
+"""
+Provides caching of Linkedin API responses
+"""
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, NamedTuple, Optional
+from urllib.parse import urlencode
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+logger = logging.getLogger(__name__)
+
+
+class CachedResponse(NamedTuple):
+    """A response as kept by `ResponseCache`."""
+
+    key: str
+    url: str
+    status_code: int
+    headers: Dict[str, str]
+    content: bytes
+    expires: float
+
+    def to_response(self) -> requests.Response:
+        """Return a fresh `requests.Response` for this entry."""
+        res = requests.Response()
+        res.status_code = self.status_code
+        res.headers = CaseInsensitiveDict(self.headers)
+        res._content = self.content
+        res.url = self.url
+        res.encoding = "utf-8"
+        res.request = requests.Request("GET", self.url).prepare()
+        return res
+
+
+def cache_key(method: str, url: str, params=None, headers=None) -> str:
+    """
+    Return the cache key of a request: its method, URL, normalized params and
+    `accept` header (which selects the normalized or raw JSON flavour).
+    """
+    key = f"{method.upper()} {url}"
+    if isinstance(params, dict):
+        params = urlencode(sorted(params.items()), doseq=True)
+    if params:
+        key += f"{'&' if '?' in url else '?'}{params}"
+    accept = (headers or {}).get("accept")
+    if accept:
+        key += f" [{accept}]"
+    return key
+
+
+def is_failed_response(status_code: int, content: bytes) -> bool:
+    """
+    Return True for a "not found" answer: a 404, or a small 200 whose body
+    carries an error status as Voyager sometimes returns.
+    """
+    if status_code == 404:
+        return True
+    if status_code != 200 or len(content) > 4096 or b'"status"' not in content:
+        return False
+    try:
+        data = json.loads(content)
+    except ValueError:
+        return False
+    return isinstance(data, dict) and data.get("status", 200) != 200
+
+
+class ResponseCache(object):
+    """
+    Response cache for GET requests, with an in-memory LRU tier and an
+    optional on-disk tier that survives restarts.
+
+    Successful responses are kept for the TTL of their endpoint, "not found"
+    answers (see `is_failed_response`) for `negative_ttl`. Other failures
+    (throttling, server errors) are never cached.
+
+    :param ttl: Seconds a response is kept when no entry of `ttls` matches
+    :type ttl: float, optional
+    :param ttls: Per endpoint overrides of `DEFAULT_TTLS`, keyed on URI prefix. A TTL of 0 disables caching
+    :type ttls: dict, optional
+    :param negative_ttl: Seconds a "not found" answer is kept. 0 disables negative caching
+    :type negative_ttl: float, optional
+    :param max_entries: Maximum number of responses kept in memory
+    :type max_entries: int, optional
+    :param cache_dir: Directory of the on-disk tier. Disabled when empty
+    :type cache_dir: str, optional
+    :param clock: Wall clock returning seconds. Defaults to `time.time`
+    :type clock: callable, optional
+    """
+
+    DEFAULT_TTLS = {
+        "/organization/companies": 86400,  # companies and schools
+        "/identity/profiles": 3600,
+        "/jobs/jobPostings": 3600,
+        "/graphql": 600,  # people and company search
+        "/voyagerJobsDashJobCards": 600,  # job search
+        "/feed": 60,
+        "/relationships": 60,
+        "/messaging": 0,
+        "/me": 3600,
+    }
+    DROPPED_HEADERS = ("content-encoding", "content-length", "transfer-encoding")
+
+    def __init__(
+        self,
+        ttl: float = 300,
+        ttls: Optional[Dict[str, float]] = None,
+        negative_ttl: float = 60,
+        max_entries: int = 1024,
+        cache_dir: str = "",
+        clock: Callable[[], float] = time.time,
+    ):
+        self.ttl = ttl
+        self.ttls = {**self.DEFAULT_TTLS, **(ttls or {})}
+        self._prefixes = sorted(self.ttls, key=len, reverse=True)
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+        self.cache_dir = cache_dir
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def ttl_for(self, uri: str) -> float:
+        """Return the TTL of the endpoint at `uri` (longest matching prefix wins)."""
+        for prefix in self._prefixes:
+            if uri.startswith(prefix):
+                return self.ttls[prefix]
+        return self.ttl
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Return the live entry stored under `key`, if any."""
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires <= now:
+                del self._entries[key]
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+
+        if entry is None and self.cache_dir:
+            entry = self._load(key)
+            if entry is not None and entry.expires <= now:
+                self._unlink(key)
+                entry = None
+            if entry is not None:
+                self._remember(entry)
+
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return entry
+
+    def set(
+        self, key: str, uri: str, url: str, status_code: int, headers, content: bytes
+    ) -> Optional[CachedResponse]:
+        """Store a response if it is cacheable, and return its entry."""
+        if is_failed_response(status_code, content):
+            ttl = self.negative_ttl
+        elif status_code == 200:
+            ttl = self.ttl_for(uri)
+        else:
+            return None
+        if ttl <= 0:
+            return None
+
+        # the content is stored decoded, so its transfer headers no longer apply
+        headers = {
+            name: value
+            for name, value in headers.items()
+            if name.lower() not in self.DROPPED_HEADERS
+        }
+        entry = CachedResponse(
+            key, url, status_code, headers, content, self._clock() + ttl
+        )
+        self._remember(entry)
+        if self.cache_dir:
+            self._dump(entry)
+        return entry
+
+    def invalidate(self, *fragments: str):
+        """Drop every entry whose key contains one of `fragments`."""
+        with self._lock:
+            for key in [k for k in self._entries if any(f in k for f in fragments)]:
+                del self._entries[key]
+
+        if self.cache_dir and os.path.isdir(self.cache_dir):
+            for name in os.listdir(self.cache_dir):
+                path = os.path.join(self.cache_dir, name)
+                entry = self._read(path)
+                if entry is not None and any(f in entry.key for f in fragments):
+                    self._remove(path)
+
+    def clear(self):
+        """Drop every entry, on disk included."""
+        with self._lock:
+            self._entries.clear()
+        if self.cache_dir and os.path.isdir(self.cache_dir):
+            for name in os.listdir(self.cache_dir):
+                if name.endswith(".cache"):
+                    self._remove(os.path.join(self.cache_dir, name))
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _remember(self, entry: CachedResponse):
+        with self._lock:
+            self._entries[entry.key] = entry
+            self._entries.move_to_end(entry.key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _get_filepath(self, key: str) -> str:
+        digest = hashlib.sha1(key.encode()).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.cache")
+
+    def _dump(self, entry: CachedResponse):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._get_filepath(entry.key)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(tuple(entry), f)
+        os.replace(tmp_path, path)
+
+    def _load(self, key: str) -> Optional[CachedResponse]:
+        entry = self._read(self._get_filepath(key))
+        return entry if entry is not None and entry.key == key else None
+
+    def _unlink(self, key: str):
+        self._remove(self._get_filepath(key))
+
+    @staticmethod
+    def _read(path: str) -> Optional[CachedResponse]:
+        if not path.endswith(".cache"):
+            return None
+        try:
+            with open(path, "rb") as f:
+                return CachedResponse(*pickle.load(f))
+        except FileNotFoundError:
+            return None
+        except (pickle.UnpicklingError, EOFError, TypeError) as e:
+            logger.debug(f"Ignoring unreadable cache file {path}: {e}")
+            return None
+
+    @staticmethod
+    def _remove(path: str):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
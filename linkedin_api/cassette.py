@@ -0,0 +1,194 @@
+"""
+Provides recording and offline replay of Linkedin API exchanges
+"""
+
+import base64
+import gzip
+import json
+import logging
+import os
+import threading
+from collections import defaultdict, deque
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+logger = logging.getLogger(__name__)
+
+# never written to a cassette: transfer details of the original exchange, and credentials
+DROPPED_HEADERS = frozenset(
+    ("content-encoding", "content-length", "transfer-encoding", "set-cookie")
+)
+
+
+class CassetteError(Exception):
+    """Raised when a replayed request was not recorded in the cassette."""
+
+    pass
+
+
+def match_key(method: str, url: str) -> str:
+    """
+    Return the key requests are matched on: method, path and sorted query params.
+    """
+    parts = urlsplit(url)
+    params = sorted(parse_qsl(parts.query, keep_blank_values=True))
+    query = "&".join(f"{name}={value}" for name, value in params)
+    return f"{method.upper()} {parts.path}?{query}"
+
+
+class Cassette(object):
+    """
+    A file of recorded Linkedin API exchanges.
+
+    In ``"record"`` mode, requests go to LinkedIn and their responses are
+    recorded, to be written by `save` (or on leaving a ``with`` block). In
+    ``"replay"`` mode, nothing reaches the network: requests are answered from
+    the cassette, matching on method, path and normalized query params, and
+    `Linkedin` skips the evade delay. Identical requests are answered in the
+    order they were recorded, the last answer repeating once they run out.
+
+    Cassettes hold whole response bodies, so treat them like the account's
+    data. Cookies are never recorded; replay with ``authenticate=False``.
+
+    :param path: Cassette file. Compressed with gzip when it ends with ``.gz``
+    :type path: str
+    :param mode: ``"replay"`` or ``"record"``
+    :type mode: str, optional
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: str, mode="replay"):
+        if mode not in ("replay", "record"):
+            raise ValueError(f"mode must be 'replay' or 'record', not {mode!r}")
+        self.path = path
+        self.mode = mode
+        self.interactions: List[Dict] = []
+        self._lock = threading.Lock()
+        self._answers: Dict[str, deque] = defaultdict(deque)
+        if self.replaying:
+            self.load()
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == "replay"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        if not self.replaying:
+            self.save()
+
+    def _open(self, mode: str):
+        if self.path.endswith(".gz"):
+            return gzip.open(self.path, mode)
+        return open(self.path, mode)
+
+    def load(self):
+        """Read the interactions of the cassette file."""
+        with self._open("rt") as f:
+            data = json.load(f)
+        if data.get("version") != self.VERSION:
+            raise CassetteError(f"Unsupported cassette version in {self.path}")
+
+        with self._lock:
+            self.interactions = data["interactions"]
+            self._answers.clear()
+            for interaction in self.interactions:
+                self._answers[interaction["key"]].append(interaction)
+
+    def save(self):
+        """Write the recorded interactions to the cassette file."""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._lock:
+            data = {"version": self.VERSION, "interactions": list(self.interactions)}
+        with self._open("wt") as f:
+            json.dump(data, f, separators=(",", ":"))
+
+    def record(self, method: str, url: str, status_code: int, headers, body: bytes):
+        """Add an exchange to the cassette."""
+        interaction = {
+            "key": match_key(method, url),
+            "url": url,
+            "status": status_code,
+            "headers": {
+                name: value
+                for name, value in headers.items()
+                if name.lower() not in DROPPED_HEADERS
+            },
+        }
+        try:
+            interaction["body"] = body.decode("utf-8")
+        except UnicodeDecodeError:
+            interaction["body_b64"] = base64.b64encode(body).decode("ascii")
+
+        with self._lock:
+            self.interactions.append(interaction)
+
+    def play(self, method: str, url: str) -> Tuple[int, Dict[str, str], bytes]:
+        """
+        Return the recorded status code, headers and body answering a request.
+
+        :raises CassetteError: if no such request was recorded
+        """
+        key = match_key(method, url)
+        with self._lock:
+            answers = self._answers.get(key)
+            if not answers:
+                raise CassetteError(f"No recorded response for {key} in {self.path}")
+            interaction = answers.popleft() if len(answers) > 1 else answers[0]
+
+        if "body_b64" in interaction:
+            body = base64.b64decode(interaction["body_b64"])
+        else:
+            body = interaction["body"].encode("utf-8")
+        return interaction["status"], interaction["headers"], body
+
+    def adapter(self, adapter: Optional[BaseAdapter] = None) -> "CassetteAdapter":
+        """Return a `requests` adapter recording through, or replacing, `adapter`."""
+        return CassetteAdapter(self, adapter)
+
+    def async_transport(self, transport=None) -> "AsyncCassetteTransport":
+        """Return an httpx transport recording through, or replacing, `transport`."""
+        from linkedin_api.async_client import AsyncCassetteTransport
+
+        return AsyncCassetteTransport(self, transport)
+
+
+class CassetteAdapter(BaseAdapter):
+    """`requests` adapter recording to, or replaying from, a `Cassette`."""
+
+    def __init__(self, cassette: Cassette, adapter: Optional[BaseAdapter] = None):
+        super().__init__()
+        self.cassette = cassette
+        self.adapter = adapter
+
+    def send(self, request, **kwargs):
+        if not self.cassette.replaying:
+            res = self.adapter.send(request, **kwargs)
+            self.cassette.record(
+                request.method, request.url, res.status_code, res.headers, res.content
+            )
+            return res
+
+        status_code, headers, body = self.cassette.play(request.method, request.url)
+        res = requests.Response()
+        res.status_code = status_code
+        res.headers = CaseInsensitiveDict(headers)
+        res._content = body
+        res._content_consumed = True
+        res.url = request.url
+        res.request = request
+        res.reason = "Replayed"
+        return res
+
+    def close(self):
+        if self.adapter is not None:
+            self.adapter.close()
@@ -1,7 +1,11 @@
 import requests
 import logging
+from linkedin_api.cassette import Cassette
 from linkedin_api.cookie_repository import CookieRepository
-from bs4 import BeautifulSoup, Tag
+from linkedin_api.meta_tags import META_CHUNK_SIZE, MetaTagScanner
+from linkedin_api.transport import TransportConfig
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
 from requests.cookies import RequestsCookieJar
 import json
 
@@ -19,6 +23,15 @@ class UnauthorizedException(Exception):
 class Client(object):
     """
     Class to act as a client for the Linkedin API.
+
+    :param transport: Connection pooling settings, see `TransportConfig`
+    :type transport: TransportConfig, optional
+    :param cassette: Records exchanges to, or replays them from, a `Cassette`
+    :type cassette: Cassette, optional
+    :param cookie_repository: Stores session cookies and metadata. Defaults to a `CookieRepository` in `cookies_dir`
+    :type cookie_repository: CookieRepository or SQLiteCookieRepository, optional
+    :param proxy_pool: Rotates requests over proxies, instead of the fixed `proxies`
+    :type proxy_pool: ProxyPool, optional
     """
 
     # Settings for general Linkedin API calls
@@ -47,31 +60,90 @@ class Client(object):
         "X-User-Locale": "en_US",
         "Accept-Language": "en-us",
     }
+    # <meta> tags of the home page holding the application instance metadata
+    METADATA_TAGS = ("applicationInstance", "clientPageInstanceId")
 
     def __init__(
-        self, *, debug=False, refresh_cookies=False, proxies={}, cookies_dir: str = ""
+        self,
+        *,
+        debug=False,
+        refresh_cookies=False,
+        proxies={},
+        cookies_dir: str = "",
+        transport: Optional[TransportConfig] = None,
+        cassette: Optional[Cassette] = None,
+        cookie_repository=None,
+        proxy_pool=None,
     ):
+        self.transport = transport or TransportConfig()
         self.session = requests.session()
+        self.transport.configure_session(self.session)
+        self.proxy_pool = proxy_pool
+        # requests of an account stick to one proxy of the pool
+        self.proxy_key = f"client-{id(self)}"
+        if proxy_pool is not None:
+            for prefix in ("https://", "http://"):
+                self.session.mount(
+                    prefix,
+                    proxy_pool.adapter(
+                        self.session.get_adapter(prefix), lambda: self.proxy_key
+                    ),
+                )
+        self.cassette = cassette
+        if cassette is not None:
+            for prefix in ("https://", "http://"):
+                self.session.mount(
+                    prefix, cassette.adapter(self.session.get_adapter(prefix))
+                )
         self.session.proxies.update(proxies)
         self.session.headers.update(Client.REQUEST_HEADERS)
         self.proxies = proxies
         self.logger = logger
         self.metadata = {}
         self._use_cookie_cache = not refresh_cookies
-        self._cookie_repository = CookieRepository(cookies_dir=cookies_dir)
+        self._cookie_repository = cookie_repository or CookieRepository(
+            cookies_dir=cookies_dir
+        )
 
         logging.basicConfig(level=logging.DEBUG if debug else logging.INFO)
 
+        if self.transport.prewarm:
+            self.prewarm()
+
+    def prewarm(self):
+        """
+        Open `transport.prewarm` pooled connections to Linkedin ahead of the first requests.
+        """
+        count = self.transport.prewarm or 1
+        self.logger.debug(f"Pre-warming {count} connection(s).")
+
+        def head(_):
+            try:
+                self.session.head(Client.LINKEDIN_BASE_URL)
+            except requests.RequestException as e:
+                self.logger.debug(f"Pre-warming failed: {e}")
+
+        with ThreadPoolExecutor(max_workers=count) as executor:
+            list(executor.map(head, range(count)))
+
+    def _auth_headers(self):
+        """
+        Return headers making a session request send the authentication headers only.
+        """
+        # a `None` value drops the corresponding session header from the request
+        headers = {name: None for name in (*Client.REQUEST_HEADERS, "csrf-token")}
+        headers.update(Client.AUTH_REQUEST_HEADERS)
+        return headers
+
     def _request_session_cookies(self):
         """
         Return a new set of session cookies as given by Linkedin.
         """
         self.logger.debug("Requesting new cookies.")
 
-        res = requests.get(
+        res = self.session.get(
             f"{Client.LINKEDIN_BASE_URL}/uas/authenticate",
-            headers=Client.AUTH_REQUEST_HEADERS,
-            proxies=self.proxies,
+            headers=self._auth_headers(),
         )
         return res.cookies
 
@@ -89,51 +161,65 @@ class Client(object):
         return self.session.cookies
 
     def authenticate(self, username: str, password: str):
+        self.proxy_key = username
         if self._use_cookie_cache:
             self.logger.debug("Attempting to use cached cookies")
             cookies = self._cookie_repository.get(username)
             if cookies:
                 self.logger.debug("Using cached cookies")
                 self._set_session_cookies(cookies)
-                self._fetch_metadata()
+                if not self._restore_metadata(username):
+                    self._fetch_metadata()
+                    self._cookie_repository.save_metadata(self.metadata, username)
                 return
 
         self._do_authentication_request(username, password)
         self._fetch_metadata()
+        self._cookie_repository.save_metadata(self.metadata, username)
+
+    def _restore_metadata(self, username: str) -> bool:
+        """
+        Load the metadata saved with the cached cookies of `username`, and
+        return whether there was any.
+        """
+        metadata = self._cookie_repository.get_metadata(username)
+        if metadata:
+            self.metadata.update(metadata)
+        return bool(metadata)
 
     def _fetch_metadata(self):
         """
         Get metadata about the "instance" of the LinkedIn application for the signed in user.
 
-        Store this data in self.metadata
+        Store this data in self.metadata. The page is only read up to its
+        metadata tags.
         """
-        res = requests.get(
+        res = self.session.get(
             f"{Client.LINKEDIN_BASE_URL}",
-            cookies=self.session.cookies,
-            headers=Client.AUTH_REQUEST_HEADERS,
-            proxies=self.proxies,
+            headers=self._auth_headers(),
+            stream=True,
         )
+        scanner = MetaTagScanner(Client.METADATA_TAGS)
+        try:
+            for chunk in res.iter_content(META_CHUNK_SIZE):
+                if scanner.feed(chunk):
+                    break
+        finally:
+            res.close()
 
-        soup = BeautifulSoup(res.text, "lxml")
+        self._set_metadata(scanner.found)
 
-        clientApplicationInstanceRaw = soup.find(
-            "meta", attrs={"name": "applicationInstance"}
-        )
-        if clientApplicationInstanceRaw and isinstance(
-            clientApplicationInstanceRaw, Tag
-        ):
-            clientApplicationInstanceRaw = clientApplicationInstanceRaw.attrs.get(
-                "content", {}
+    def _set_metadata(self, tags: Dict[str, str]):
+        """
+        Store the application instance metadata read from the `METADATA_TAGS`
+        of the LinkedIn home page in self.metadata
+        """
+        if "applicationInstance" in tags:
+            self.metadata["clientApplicationInstance"] = json.loads(
+                tags["applicationInstance"]
             )
-            clientApplicationInstance = json.loads(clientApplicationInstanceRaw)
-            self.metadata["clientApplicationInstance"] = clientApplicationInstance
-
-        clientPageInstanceIdRaw = soup.find(
-            "meta", attrs={"name": "clientPageInstanceId"}
-        )
-        if clientPageInstanceIdRaw and isinstance(clientPageInstanceIdRaw, Tag):
-            clientPageInstanceId = clientPageInstanceIdRaw.attrs.get("content", {})
-            self.metadata["clientPageInstanceId"] = clientPageInstanceId
+        if "clientPageInstanceId" in tags:
+            self.metadata["clientPageInstanceId"] = tags["clientPageInstanceId"]
 
     def _do_authentication_request(self, username: str, password: str):
         """
@@ -149,12 +235,10 @@ class Client(object):
             "JSESSIONID": self.session.cookies["JSESSIONID"],
         }
 
-        res = requests.post(
+        res = self.session.post(
             f"{Client.LINKEDIN_BASE_URL}/uas/authenticate",
             data=payload,
-            cookies=self.session.cookies,
-            headers=Client.AUTH_REQUEST_HEADERS,
-            proxies=self.proxies,
+            headers=self._auth_headers(),
         )
 
         data = res.json()
@@ -1,9 +1,12 @@
+import json
 import os
 import pickle
+import sqlite3
 import time
+from contextlib import contextmanager
 import linkedin_api.settings as settings
 from requests.cookies import RequestsCookieJar
-from typing import Optional
+from typing import Dict, Iterator, List, Optional
 
 
 class Error(Exception):
@@ -16,6 +19,16 @@ class LinkedinSessionExpired(Error):
     pass
 
 
+def get_session_expiry(cookiejar: RequestsCookieJar) -> Optional[float]:
+    """
+    Return when the JSESSIONID cookie of a jar expires, or None if it has none.
+    """
+    for cookie in cookiejar:
+        if cookie.name == "JSESSIONID" and cookie.value:
+            return cookie.expires or None
+    return None
+
+
 class CookieRepository(object):
     """
     Class to act as a repository for the cookies.
@@ -39,6 +52,24 @@ class CookieRepository(object):
 
         return cookies
 
+    def save_metadata(self, metadata: Dict, username: str):
+        """
+        Store the application instance metadata of the session saved for `username`.
+        """
+        self._ensure_cookies_dir()
+        with open(self._get_metadata_filepath(username), "w") as f:
+            json.dump(metadata, f)
+
+    def get_metadata(self, username: str) -> Optional[Dict]:
+        """
+        Return the metadata stored with the session of `username`, if any.
+        """
+        try:
+            with open(self._get_metadata_filepath(username)) as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+
     def _ensure_cookies_dir(self):
         if not os.path.exists(self.cookies_dir):
             os.makedirs(self.cookies_dir)
@@ -49,6 +80,12 @@ class CookieRepository(object):
         """
         return "{}{}.jr".format(self.cookies_dir, username)
 
+    def _get_metadata_filepath(self, username) -> str:
+        """
+        Return the absolute path of the metadata for a given username
+        """
+        return "{}{}.meta.json".format(self.cookies_dir, username)
+
     def _load_cookies_from_cache(self, username: str) -> Optional[RequestsCookieJar]:
         cookiejar_filepath = self._get_cookies_filepath(username)
         try:
@@ -60,11 +97,149 @@ class CookieRepository(object):
 
     @staticmethod
     def _is_token_still_valid(cookiejar: RequestsCookieJar):
-        _now = time.time()
-        for cookie in cookiejar:
-            if cookie.name == "JSESSIONID" and cookie.value:
-                if cookie.expires and cookie.expires > _now:
-                    return True
-                break
-
-        return False
+        expires = get_session_expiry(cookiejar)
+        return expires is not None and expires > time.time()
+
+
+class SQLiteCookieRepository(object):
+    """
+    Repository for the cookies and metadata of many accounts, in one SQLite
+    database shared by any number of processes. Use it in place of
+    `CookieRepository`.
+
+    The database runs in WAL mode, so reads never wait for writes. Every
+    write is an atomic upsert made under SQLite's cross-process write lock.
+    The expiry of each JSESSIONID is indexed, so validity checks do not
+    unpickle the cookies.
+
+    :param path: Database file. Defaults to ``~/.linkedin_api/sessions.sqlite3``
+    :type path: str, optional
+    :param timeout: Seconds to wait for the write lock held by another process
+    :type timeout: float, optional
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS sessions (
+            username TEXT PRIMARY KEY,
+            cookies BLOB,
+            expires REAL,
+            metadata TEXT
+        );
+        CREATE INDEX IF NOT EXISTS sessions_expires ON sessions (expires);
+    """
+
+    def __init__(self, path: str = "", timeout=30.0):
+        self.path = path or settings.SESSION_DB_PATH
+        self.timeout = timeout
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as db:
+            db.execute("PRAGMA journal_mode=WAL")
+            db.executescript(self._SCHEMA)
+
+    @contextmanager
+    def _connect(self, write=False) -> Iterator[sqlite3.Connection]:
+        """
+        Open a connection, in a transaction holding the write lock if `write`.
+        """
+        db = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+        try:
+            if not write:
+                yield db
+                return
+            db.execute("BEGIN IMMEDIATE")
+            try:
+                yield db
+            except BaseException:
+                db.execute("ROLLBACK")
+                raise
+            db.execute("COMMIT")
+        finally:
+            db.close()
+
+    def _upsert(self, username: str, **columns):
+        """Set `columns` of the session of `username`, creating it if needed."""
+        names = list(columns)
+        values = [columns[name] for name in names]
+        with self._connect(write=True) as db:
+            updated = db.execute(
+                f"UPDATE sessions SET {', '.join(f'{name} = ?' for name in names)} "
+                "WHERE username = ?",
+                (*values, username),
+            ).rowcount
+            if not updated:
+                db.execute(
+                    f"INSERT INTO sessions (username, {', '.join(names)}) "
+                    f"VALUES (?{', ?' * len(names)})",
+                    (username, *values),
+                )
+
+    def save(self, cookies, username):
+        self._upsert(
+            username,
+            cookies=pickle.dumps(cookies),
+            expires=get_session_expiry(cookies),
+        )
+
+    def get(self, username: str) -> Optional[RequestsCookieJar]:
+        with self._connect() as db:
+            row = db.execute(
+                "SELECT cookies, expires FROM sessions WHERE username = ?",
+                (username,),
+            ).fetchone()
+        if row is None or row[0] is None:
+            return None
+        if row[1] is None or row[1] <= time.time():
+            raise LinkedinSessionExpired
+        return pickle.loads(row[0])
+
+    def save_metadata(self, metadata: Dict, username: str):
+        """
+        Store the application instance metadata of the session saved for `username`.
+        """
+        self._upsert(username, metadata=json.dumps(metadata))
+
+    def get_metadata(self, username: str) -> Optional[Dict]:
+        """
+        Return the metadata stored with the session of `username`, if any.
+        """
+        with self._connect() as db:
+            row = db.execute(
+                "SELECT metadata FROM sessions WHERE username = ?", (username,)
+            ).fetchone()
+        return json.loads(row[0]) if row and row[0] else None
+
+    def is_valid(self, username: str) -> bool:
+        """
+        Return whether `username` has a session whose JSESSIONID has not expired.
+        """
+        with self._connect() as db:
+            row = db.execute(
+                "SELECT 1 FROM sessions WHERE username = ? AND expires > ?",
+                (username, time.time()),
+            ).fetchone()
+        return row is not None
+
+    def valid_usernames(self) -> List[str]:
+        """
+        Return the usernames of every session whose JSESSIONID has not expired.
+        """
+        with self._connect() as db:
+            rows = db.execute(
+                "SELECT username FROM sessions WHERE expires > ? ORDER BY username",
+                (time.time(),),
+            ).fetchall()
+        return [username for (username,) in rows]
+
+    def get_all(self) -> Dict[str, RequestsCookieJar]:
+        """
+        Return the cookies of every session whose JSESSIONID has not expired,
+        by username, in a single query.
+        """
+        with self._connect() as db:
+            rows = db.execute(
+                "SELECT username, cookies FROM sessions WHERE expires > ?",
+                (time.time(),),
+            ).fetchall()
+        return {username: pickle.loads(cookies) for username, cookies in rows}
@@ -0,0 +1,52 @@
+"""
+Provides decoding of Linkedin API response bodies
+"""
+
+import copy
+import json
+from typing import Any, Callable, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+# attribute holding the decoded body on a response
+_DECODED = "_linkedin_api_decoded"
+
+
+def default_json_decoder() -> Callable[[bytes], Any]:
+    """Return `orjson.loads` when orjson is installed, `json.loads` otherwise."""
+    return orjson.loads if orjson is not None else json.loads
+
+
+def decode_response(res, decoder: Optional[Callable[[bytes], Any]] = None):
+    """
+    Return the decoded JSON body of a `requests` or httpx response.
+
+    The body is decoded once: later calls on the same response return the
+    same object, mutations included.
+
+    :param res: Response to decode
+    :param decoder: Turns the raw body into Python objects. Defaults to `default_json_decoder()`
+    :type decoder: callable, optional
+    """
+    try:
+        return getattr(res, _DECODED)
+    except AttributeError:
+        pass
+    data = (decoder or default_json_decoder())(res.content)
+    setattr(res, _DECODED, data)
+    return data
+
+
+def clone_response(res):
+    """
+    Return a shallow copy of a response, without its decoded body.
+
+    Single-flight followers get their own copy to decode, as parsers modify
+    the objects they are given.
+    """
+    clone = copy.copy(res)
+    clone.__dict__.pop(_DECODED, None)
+    return clone
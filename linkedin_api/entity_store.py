@@ -0,0 +1,144 @@
+"""
+Provides a store of the entities of normalized Linkedin API responses
+"""
+
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+
+def entity_size(value: Any) -> int:
+    """Return an estimate of the memory held by `value`, a decoded JSON value, in bytes."""
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        for key, item in value.items():
+            size += sys.getsizeof(key) + entity_size(item)
+    elif isinstance(value, list):
+        for item in value:
+            size += entity_size(item)
+    return size
+
+
+class EntityStore(object):
+    """
+    Indexes the entities of normalized responses (their ``included`` list,
+    as requested with the ``application/vnd.linkedin.normalized+json+2.1``
+    accept header) by ``entityUrn``, across calls.
+
+    Lookups and additions are constant time. The store holds at most
+    `max_entities` entities, dropping the least recently used ones. Set
+    `max_bytes` to also bound their estimated size: sizes are then computed
+    with `size_of` as entities are added, which costs a walk of each one.
+    An entity seen again replaces the stored one.
+
+    Entities are stored as returned to the caller, not copied: results
+    modified by the caller are modified in the store too. `resolve` returns
+    copies.
+
+    :param max_entities: Number of entities the store may hold
+    :type max_entities: int, optional
+    :param max_bytes: Estimated memory the entities may hold, in bytes. Defaults to no bound
+    :type max_bytes: int, optional
+    :param size_of: Estimates the size of an entity. Defaults to `entity_size`
+    :type size_of: callable, optional
+    """
+
+    def __init__(
+        self,
+        max_entities: int = 100_000,
+        max_bytes: Optional[int] = None,
+        size_of: Callable[[Dict], int] = entity_size,
+    ):
+        self.max_entities = max_entities
+        self.max_bytes = max_bytes
+        self._size_of = size_of
+        # urn -> (entity, size), the size being 0 without max_bytes
+        self._entities: "OrderedDict[str, Tuple[Dict, int]]" = OrderedDict()
+        self.size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def add(self, entity: Dict) -> Dict:
+        """Store `entity`, if it has an ``entityUrn``, and return it."""
+        urn = entity.get("entityUrn") if isinstance(entity, dict) else None
+        if not isinstance(urn, str):
+            return entity
+        size = self._size_of(entity) if self.max_bytes is not None else 0
+        with self._lock:
+            previous = self._entities.pop(urn, None)
+            if previous is not None:
+                self.size -= previous[1]
+            if self.max_bytes is not None and size > self.max_bytes:
+                return entity
+            self._entities[urn] = (entity, size)
+            self.size += size
+            while len(self._entities) > self.max_entities or (
+                self.max_bytes is not None and self.size > self.max_bytes
+            ):
+                _, (_, evicted) = self._entities.popitem(last=False)
+                self.size -= evicted
+        return entity
+
+    def add_all(self, entities: Iterable[Dict]):
+        """Store every entity of `entities`."""
+        for entity in entities:
+            self.add(entity)
+
+    def indexing(self, entities: Iterable[Dict]) -> Iterator[Dict]:
+        """Yield `entities`, storing each one on the way."""
+        for entity in entities:
+            yield self.add(entity)
+
+    def get(self, urn: str) -> Optional[Dict]:
+        """Return the entity stored under `urn`, if any."""
+        with self._lock:
+            stored = self._entities.get(urn)
+            if stored is None:
+                self.misses += 1
+                return None
+            self._entities.move_to_end(urn)
+            self.hits += 1
+            return stored[0]
+
+    def resolve(self, value: Any, depth=1) -> Any:
+        """
+        Return a copy of `value`, an entity or the ``data`` of a response,
+        in which every ``"*name": urn`` reference (or list of URNs) to a
+        stored entity is resolved under ``name``, recursively for `depth`
+        levels of entities. Stored entities are not modified, and
+        references to unknown entities are left unresolved.
+        """
+        if isinstance(value, list):
+            return [self.resolve(item, depth) for item in value]
+        if not isinstance(value, dict):
+            return value
+        resolved = {}
+        for key, item in value.items():
+            resolved[key] = self.resolve(item, depth)
+            if depth < 1 or not key.startswith("*"):
+                continue
+            if isinstance(item, str):
+                entity = self.get(item)
+                if entity is not None:
+                    resolved[key[1:]] = self.resolve(entity, depth - 1)
+            elif isinstance(item, list):
+                entities = [self.get(urn) for urn in item if isinstance(urn, str)]
+                if entities and all(entity is not None for entity in entities):
+                    resolved[key[1:]] = [
+                        self.resolve(entity, depth - 1) for entity in entities
+                    ]
+        return resolved
+
+    def __contains__(self, urn: str) -> bool:
+        return urn in self._entities
+
+    def __len__(self) -> int:
+        return len(self._entities)
+
+    def clear(self):
+        """Drop every entity."""
+        with self._lock:
+            self._entities.clear()
+            self.size = 0
@@ -6,17 +6,71 @@ import json
 import logging
 import random
 import uuid
-from operator import itemgetter
+from contextlib import nullcontext
 from time import sleep
 from urllib.parse import urlencode
-from typing import Dict, Union, Optional, List, Literal
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Union,
+    Optional,
+    List,
+    Literal,
+    Iterable,
+    Iterator,
+    Type,
+)
+
+import requests
 
+from linkedin_api.bulk import BulkResult, iter_bulk
+from linkedin_api.cache import ResponseCache, cache_key
+from linkedin_api.cassette import Cassette
 from linkedin_api.client import Client
+from linkedin_api.decoder import clone_response, decode_response, default_json_decoder
+from linkedin_api.entity_store import EntityStore
+from linkedin_api.metrics import MetricsRegistry, endpoint_template
+from linkedin_api.models import (
+    CompactResult,
+    CompanyResult,
+    FeedPost,
+    JobCard,
+    LazyProfile,
+    PersonResult,
+    massage_profile,
+)
+from linkedin_api.pagination import Page, PagePrefetcher, next_pages
+from linkedin_api.partitioned_search import (
+    PartitionResult,
+    SearchPartition,
+    check_partition_by,
+    iter_partitions,
+)
+from linkedin_api.plans import (
+    Plan,
+    consume,
+    iter_plan,
+    planned,
+    planned_pages,
+    run_plan,
+)
+from linkedin_api.rate_limiter import RateLimiter
+from linkedin_api.retry import RetryPolicy
+from linkedin_api.single_flight import SingleFlight
+from linkedin_api.streaming import (
+    FEED_NEEDLES,
+    JOB_POSTING_NEEDLES,
+    STREAM_CHUNK_SIZE,
+    StreamedPage,
+)
+from linkedin_api.transport import TransportConfig
 from linkedin_api.utils.helpers import (
+    get_endpoint_family,
     get_id_from_urn,
     get_urn_from_raw_update,
-    get_list_posts_sorted_without_promoted,
-    parse_list_raw_posts,
+    get_feed_posts_in_order,
+    index_feed_posts,
     parse_list_raw_urns,
     generate_trackingId,
     generate_trackingId_as_charString,
@@ -41,6 +95,32 @@ class Linkedin(object):
     :type username: str
     :param password: Password of LinkedIn account.
     :type password: str
+    :param rate_limiter: Paces requests per endpoint family instead of the fixed `default_evade` delay
+    :type rate_limiter: RateLimiter, optional
+    :param transport: Connection pooling settings, see `TransportConfig`
+    :type transport: TransportConfig, optional
+    :param retry_policy: Retries transient failures (429, 5xx, connection errors) of idempotent requests
+    :type retry_policy: RetryPolicy, optional
+    :param cache: Answers repeated GET requests without hitting the network
+    :type cache: ResponseCache, optional
+    :param coalesce: Let concurrent identical GET requests share one network call. Defaults to True
+    :type coalesce: bool, optional
+    :param metrics: Records per-endpoint request counts, bytes and timings
+    :type metrics: MetricsRegistry, optional
+    :param cassette: Records requests to, or replays them from, a `Cassette`. Replays skip the evade delay
+    :type cassette: Cassette, optional
+    :param json_decoder: Turns response bodies (bytes) into Python objects. Defaults to orjson when installed, else the stdlib `json`
+    :type json_decoder: callable, optional
+    :param stream_included: Parse feed and job search pages as they download, keeping only the entities they need, instead of decoding whole pages. Streamed requests skip the cache and coalescing. Defaults to False
+    :type stream_included: bool, optional
+    :param cookie_repository: Stores session cookies and metadata, e.g. a `SQLiteCookieRepository` shared by many processes. Defaults to pickle files in `cookies_dir`
+    :type cookie_repository: CookieRepository or SQLiteCookieRepository, optional
+    :param proxy_pool: Rotates requests over the healthiest proxies, instead of the fixed `proxies`
+    :type proxy_pool: ProxyPool, optional
+    :param entity_store: Indexes the `included` entities of normalized responses (job searches, the feed, privacy settings, badges and network info) by URN, across calls
+    :type entity_store: EntityStore, optional
+    :param compact_results: Return the results of `search_people`, `search_companies`, `search_jobs` and `get_feed_posts` as read-only, dict-like objects using less memory, see `linkedin_api.models`. Defaults to False
+    :type compact_results: bool, optional
     """
 
     _MAX_POST_COUNT = 100  # max seems to be 100 posts per page
@@ -49,6 +129,29 @@ class Linkedin(object):
     _MAX_REPEATED_REQUESTS = (
         200  # VERY conservative max requests count to avoid rate-limit
     )
+    _MAX_SEARCH_RESULTS = 1000  # a single search query seems to stop at 1000 results
+    _CLIENT = Client
+    _SINGLE_FLIGHT = SingleFlight
+    _PREFETCHER = PagePrefetcher
+    # drivers of the plans (see `linkedin_api.plans`) and their helpers,
+    # overridden by `AsyncLinkedin`
+    _run = staticmethod(run_plan)
+    _iterate = staticmethod(iter_plan)
+    _consume = staticmethod(consume)
+    _iter_bulk = staticmethod(iter_bulk)
+    _iter_partitions = staticmethod(iter_partitions)
+    # per-profile methods accepted by `get_profiles`
+    PROFILE_GETTERS = (
+        "get_profile",
+        "get_profile_contact_info",
+        "get_profile_skills",
+        "get_profile_connections",
+        "get_profile_posts",
+        "get_profile_updates",
+        "get_profile_privacy_settings",
+        "get_profile_member_badges",
+        "get_profile_network_info",
+    )
 
     def __init__(
         self,
@@ -61,16 +164,40 @@ class Linkedin(object):
         proxies={},
         cookies=None,
         cookies_dir: str = "",
+        rate_limiter: Optional[RateLimiter] = None,
+        transport: Optional[TransportConfig] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        cache: Optional[ResponseCache] = None,
+        coalesce=True,
+        metrics: Optional[MetricsRegistry] = None,
+        cassette: Optional[Cassette] = None,
+        json_decoder: Optional[Callable[[bytes], Any]] = None,
+        stream_included=False,
+        cookie_repository=None,
+        proxy_pool=None,
+        entity_store: Optional[EntityStore] = None,
+        compact_results=False,
     ):
         """Constructor method"""
-        self.client = Client(
+        self._configure(
             refresh_cookies=refresh_cookies,
             debug=debug,
             proxies=proxies,
             cookies_dir=cookies_dir,
+            rate_limiter=rate_limiter,
+            transport=transport,
+            retry_policy=retry_policy,
+            cache=cache,
+            coalesce=coalesce,
+            metrics=metrics,
+            cassette=cassette,
+            json_decoder=json_decoder,
+            stream_included=stream_included,
+            cookie_repository=cookie_repository,
+            proxy_pool=proxy_pool,
+            entity_store=entity_store,
+            compact_results=compact_results,
         )
-        logging.basicConfig(level=logging.DEBUG if debug else logging.INFO)
-        self.logger = logger
 
         if authenticate:
             if cookies:
@@ -80,12 +207,219 @@ class Linkedin(object):
             else:
                 self.client.authenticate(username, password)
 
+    def _configure(
+        self,
+        *,
+        refresh_cookies=False,
+        debug=False,
+        proxies={},
+        cookies_dir: str = "",
+        rate_limiter: Optional[RateLimiter] = None,
+        transport: Optional[TransportConfig] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        cache: Optional[ResponseCache] = None,
+        coalesce=True,
+        metrics: Optional[MetricsRegistry] = None,
+        cassette: Optional[Cassette] = None,
+        json_decoder: Optional[Callable[[bytes], Any]] = None,
+        stream_included=False,
+        cookie_repository=None,
+        proxy_pool=None,
+        entity_store: Optional[EntityStore] = None,
+        compact_results=False,
+    ):
+        """Set up everything but authentication, for this class and `AsyncLinkedin`"""
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self.cache = cache
+        self.metrics = metrics
+        self.json_decoder = json_decoder or default_json_decoder()
+        self.stream_included = stream_included
+        self.entity_store = entity_store
+        self.compact_results = compact_results
+        self._in_flight = (
+            self._SINGLE_FLIGHT(clone=clone_response) if coalesce else None
+        )
+        self.client = self._CLIENT(
+            refresh_cookies=refresh_cookies,
+            debug=debug,
+            proxies=proxies,
+            cookies_dir=cookies_dir,
+            transport=transport,
+            cassette=cassette,
+            cookie_repository=cookie_repository,
+            proxy_pool=proxy_pool,
+        )
+        logging.basicConfig(level=logging.DEBUG if debug else logging.INFO)
+        self.logger = logging.getLogger(type(self).__module__)
+
+    def _compact(self, model: Type[CompactResult], results: List[Dict]) -> List:
+        """Return `results` as `model` objects if `compact_results` is set."""
+        if self.compact_results:
+            return [model.from_dict(result) for result in results]
+        return results
+
+    def _store_included(self, entities: Iterable[Dict]) -> Iterable[Dict]:
+        """
+        Return `entities`, the `included` list of a normalized response,
+        adding them to the entity store as they are iterated when one is set.
+        """
+        if self.entity_store is None:
+            return entities
+        return self.entity_store.indexing(entities)
+
+    def _pace(self, method: str, uri: str, evade):
+        """Wait before a request, using the rate limiter when one is set"""
+        if self.client.cassette is not None and self.client.cassette.replaying:
+            return
+        if self.rate_limiter and evade is default_evade:
+            self.rate_limiter.acquire(get_endpoint_family(method, uri))
+        else:
+            evade()
+
+    def _request(
+        self, method: str, uri: str, evade=default_evade, base_request=False, **kwargs
+    ):
+        """Send a request to Linkedin API.
+
+        GETs are answered from the cache when one is set, and identical GETs
+        already in flight share a single network call.
+        """
+        url = f"{self.client.API_BASE_URL if not base_request else self.client.LINKEDIN_BASE_URL}{uri}"
+        if method != "GET":
+            return self._send(method, uri, url, evade, **kwargs)
+
+        key = cache_key(method, url, kwargs.get("params"), kwargs.get("headers"))
+        if self.cache is not None:
+            entry = self.cache.get(key)
+            if entry is not None:
+                return entry.to_response()
+
+        if self._in_flight is None:
+            return self._send_and_cache(key, uri, url, evade, **kwargs)
+        return self._in_flight.do(
+            key, lambda: self._send_and_cache(key, uri, url, evade, **kwargs)
+        )
+
+    def _send_and_cache(self, key: str, uri: str, url: str, evade, **kwargs):
+        """Send a GET request and store its response in the cache when one is set"""
+        res = self._send("GET", uri, url, evade, **kwargs)
+        if self.cache is not None:
+            self.cache.set(key, uri, res.url, res.status_code, res.headers, res.content)
+        return res
+
+    def _send(self, method: str, uri: str, url: str, evade, **kwargs):
+        """Send a request to [url], retrying transient failures"""
+        endpoint = endpoint_template(uri) if self.metrics is not None else None
+        stream = kwargs.get("stream", False)
+
+        attempt = 0
+        while True:
+            with self._timer("evade", method, endpoint):
+                self._pace(method, uri, evade)
+            try:
+                with self._timer("network", method, endpoint):
+                    res = self.client.session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                delay = self._retry_delay(method, uri, endpoint, attempt, error=e)
+                if delay is None:
+                    raise
+            else:
+                delay = self._retry_delay(
+                    method, uri, endpoint, attempt, res=res, stream=stream
+                )
+                if delay is None:
+                    return res
+                res.close()
+            self.retry_policy.sleep(delay)
+            attempt += 1
+
+    def _retry_delay(
+        self,
+        method: str,
+        uri: str,
+        endpoint: Optional[str],
+        attempt: int,
+        res=None,
+        error: Optional[Exception] = None,
+        stream=False,
+    ) -> Optional[float]:
+        """
+        Record the outcome of an attempt at a request, which either got a
+        response or raised `error`, and return how long to wait before
+        retrying it, or None if it must not be retried.
+
+        The size of a `stream` response, whose body is yet to be read, is
+        taken from its ``Content-Length``.
+        """
+        if error is not None:
+            if self.metrics is not None:
+                self.metrics.record_error(method, endpoint)
+        elif self.metrics is not None:
+            size = (
+                int(res.headers.get("Content-Length", 0))
+                if stream
+                else len(res.content)
+            )
+            self.metrics.record_response(method, endpoint, res.status_code, size)
+
+        retries = self.retry_policy.retries_for(method, uri) if self.retry_policy else 0
+        if attempt >= retries:
+            return None
+        if error is not None:
+            delay = self.retry_policy.backoff(attempt)
+            self.logger.debug(
+                f"{method} {uri} failed ({error}), retrying in {delay:.1f}s"
+            )
+            return delay
+        if not self.retry_policy.should_retry(res):
+            return None
+        delay = self.retry_policy.backoff(attempt, res)
+        self.logger.debug(
+            f"{method} {uri} returned {res.status_code}, retrying in {delay:.1f}s"
+        )
+        return delay
+
+    def _timer(self, timing: str, method: str, endpoint: str):
+        """Time a block into the metrics registry, when one is set"""
+        if self.metrics is None:
+            return nullcontext()
+        return self.metrics.timer(timing, method, endpoint)
+
+    def _decode(self, res):
+        """Decode the JSON body of a response, once, see `decode_response`"""
+        if self.metrics is None:
+            return decode_response(res, self.json_decoder)
+        with self.metrics.timer(
+            "decode", res.request.method, endpoint_template(str(res.url))
+        ):
+            return decode_response(res, self.json_decoder)
+
+    def _invalidate(self, *fragments: str):
+        """Drop cached responses affected by a write, see `ResponseCache.invalidate`"""
+        if self.cache is not None:
+            self.cache.invalidate(*fragments)
+
     def _fetch(self, uri: str, evade=default_evade, base_request=False, **kwargs):
         """GET request to Linkedin API"""
-        evade()
+        return self._request("GET", uri, evade, base_request, **kwargs)
 
-        url = f"{self.client.API_BASE_URL if not base_request else self.client.LINKEDIN_BASE_URL}{uri}"
-        return self.client.session.get(url, **kwargs)
+    def _stream(self, uri: str, needles, evade=default_evade, **kwargs):
+        """
+        GET request to Linkedin API, returning a `StreamedPage` of the wanted
+        `included` entities. The cache and coalescing are skipped.
+        """
+        url = f"{self.client.API_BASE_URL}{uri}"
+        res = self._send("GET", uri, url, evade, stream=True, **kwargs)
+        return StreamedPage(self._iter_body(res), needles, self.json_decoder)
+
+    @staticmethod
+    def _iter_body(res) -> Iterator[bytes]:
+        """Yield the body of a streamed response as it downloads, then close it"""
+        try:
+            yield from res.iter_content(STREAM_CHUNK_SIZE)
+        finally:
+            res.close()
 
     def _cookies(self):
         """Return client cookies"""
@@ -97,11 +431,29 @@ class Linkedin(object):
 
     def _post(self, uri: str, evade=default_evade, base_request=False, **kwargs):
         """POST request to Linkedin API"""
-        evade()
+        return self._request("POST", uri, evade, base_request, **kwargs)
 
-        url = f"{self.client.API_BASE_URL if not base_request else self.client.LINKEDIN_BASE_URL}{uri}"
-        return self.client.session.post(url, **kwargs)
+    def _collect(
+        self, pages: Iterator[Page], parse: Optional[Callable[[Page], List]] = None
+    ) -> Plan:
+        """
+        Plan returning the results of the iterator `pages`, parsed page by
+        page by [parse] if given, and whether a page failed.
+        """
+        results = []
+        failed = False
 
+        def add(page: Page):
+            nonlocal failed
+            if page.failed:
+                failed = True
+            else:
+                results.extend(page if parse is None else parse(page))
+
+        yield self._consume(pages, add)
+        return results, failed
+
+    @planned
     def get_profile_posts(
         self,
         public_id: Optional[str] = None,
@@ -120,39 +472,83 @@ class Linkedin(object):
         :return: List of posts
         :rtype: list
         """
+        posts, failed = yield from self._collect(
+            self.iter_profile_posts(public_id, urn_id, post_count)
+        )
+        return [{}] if failed else posts
+
+    def _profile_posts_params(
+        self, profile_urn: str, post_count: int, start: int, pagination_token
+    ) -> Dict:
+        """Return the parameters of the first page of `iter_profile_posts`."""
         url_params = {
             "count": min(post_count, self._MAX_POST_COUNT),
-            "start": 0,
+            "start": start,
             "q": "memberShareFeed",
             "moduleKey": "member-shares:phone",
             "includeLongTermHistory": True,
+            "profileUrn": profile_urn,
         }
+        if pagination_token:
+            url_params["paginationToken"] = pagination_token
+        return url_params
+
+    def _token_page(self, data: Dict, url_params: Dict) -> Page:
+        """
+        Return the `Page` of `data`, one page of a paginationToken pagination,
+        and move `url_params` to the next page.
+        """
+        start = url_params["start"]
+        if data and "status" in data and data["status"] != 200:
+            self.logger.info(
+                "request failed: {}".format(data.get("message", data["status"]))
+            )
+            return Page([], start, start, url_params.get("paginationToken"), True)
+        pagination_token = data["metadata"]["paginationToken"]
+        url_params["start"] = start + self._MAX_POST_COUNT
+        url_params["paginationToken"] = pagination_token
+        return Page(data["elements"], start, url_params["start"], pagination_token)
+
+    @planned_pages
+    def iter_profile_posts(
+        self,
+        public_id: Optional[str] = None,
+        urn_id: Optional[str] = None,
+        post_count=10,
+        start=0,
+        pagination_token: Optional[str] = None,
+    ) -> Iterator[Page]:
+        """
+        Yield the posts of a profile page by page, as they are fetched. See
+        `get_profile_posts`.
+
+        :param start: Position to resume from, see `Page.next_start`
+        :type start: int, optional
+        :param pagination_token: Token to resume from, see `Page.pagination_token`
+        :type pagination_token: str, optional
+        :return: Pages of posts
+        :rtype: iterator of Page
+        """
         if urn_id:
             profile_urn = f"urn:li:fsd_profile:{urn_id}"
         else:
-            profile = self.get_profile(public_id=public_id)
+            profile = yield self.get_profile(public_id=public_id, lazy=True)
             profile_urn = profile["profile_urn"].replace(
                 "fs_miniProfile", "fsd_profile"
             )
-        url_params["profileUrn"] = profile_urn
-        url = f"/identity/profileUpdatesV2"
-        res = self._fetch(url, params=url_params)
-        data = res.json()
-        if data and "status" in data and data["status"] != 200:
-            self.logger.info("request failed: {}".format(data["message"]))
-            return [{}]
-        while data and data["metadata"]["paginationToken"] != "":
-            if len(data["elements"]) >= post_count:
-                break
-            pagination_token = data["metadata"]["paginationToken"]
-            url_params["start"] = url_params["start"] + self._MAX_POST_COUNT
-            url_params["paginationToken"] = pagination_token
-            res = self._fetch(url, params=url_params)
-            data["metadata"] = res.json()["metadata"]
-            data["elements"] = data["elements"] + res.json()["elements"]
-            data["paging"] = res.json()["paging"]
-        return data["elements"]
-
+        url_params = self._profile_posts_params(
+            profile_urn, post_count, start, pagination_token
+        )
+        fetched = 0
+        while True:
+            res = yield self._fetch(f"/identity/profileUpdatesV2", params=url_params)
+            page = self._token_page(self._decode(res), url_params)
+            yield page
+            fetched += len(page)
+            if page.failed or not page.pagination_token or fetched >= post_count:
+                return
+
+    @planned
     def get_post_comments(self, post_urn: str, comment_count=100) -> List:
         """
         get_post_comments: Get post comments
@@ -164,42 +560,139 @@ class Linkedin(object):
         :return: List of post comments
         :rtype: list
         """
+        comments, failed = yield from self._collect(
+            self.iter_post_comments(post_urn, comment_count)
+        )
+        return [{}] if failed else comments
+
+    def _post_comments_params(
+        self, post_urn: str, comment_count: int, start: int, pagination_token
+    ) -> Dict:
+        """Return the parameters of the first page of `iter_post_comments`."""
         url_params = {
             "count": min(comment_count, self._MAX_POST_COUNT),
-            "start": 0,
+            "start": start,
             "q": "comments",
             "sortOrder": "RELEVANCE",
+            "updateId": "activity:" + post_urn,
         }
-        url = f"/feed/comments"
-        url_params["updateId"] = "activity:" + post_urn
-        res = self._fetch(url, params=url_params)
-        data = res.json()
-        if data and "status" in data and data["status"] != 200:
-            self.logger.info("request failed: {}".format(data["status"]))
-            return [{}]
-        while data and data["metadata"]["paginationToken"] != "":
-            if len(data["elements"]) >= comment_count:
-                break
-            pagination_token = data["metadata"]["paginationToken"]
-            url_params["start"] = url_params["start"] + self._MAX_POST_COUNT
-            url_params["count"] = self._MAX_POST_COUNT
+        if pagination_token:
             url_params["paginationToken"] = pagination_token
-            res = self._fetch(url, params=url_params)
-            if res.json() and "status" in res.json() and res.json()["status"] != 200:
-                self.logger.info("request failed: {}".format(data["status"]))
-                return [{}]
-            data["metadata"] = res.json()["metadata"]
-            """ When the number of comments exceed total available 
-            comments, the api starts returning an empty list of elements"""
-            if res.json()["elements"] and len(res.json()["elements"]) == 0:
-                break
-            if data["elements"] and len(res.json()["elements"]) == 0:
-                break
-            data["elements"] = data["elements"] + res.json()["elements"]
-            data["paging"] = res.json()["paging"]
-        return data["elements"]
-
-    def search(self, params: Dict, limit=-1, offset=0) -> List:
+        return url_params
+
+    @planned_pages
+    def iter_post_comments(
+        self,
+        post_urn: str,
+        comment_count=100,
+        start=0,
+        pagination_token: Optional[str] = None,
+    ) -> Iterator[Page]:
+        """
+        Yield the comments of a post page by page, as they are fetched. See
+        `get_post_comments`.
+
+        :param start: Position to resume from, see `Page.next_start`
+        :type start: int, optional
+        :param pagination_token: Token to resume from, see `Page.pagination_token`
+        :type pagination_token: str, optional
+        :return: Pages of comments
+        :rtype: iterator of Page
+        """
+        url_params = self._post_comments_params(
+            post_urn, comment_count, start, pagination_token
+        )
+        fetched = 0
+        while True:
+            res = yield self._fetch(f"/feed/comments", params=url_params)
+            page = self._token_page(self._decode(res), url_params)
+            # past the last comment, the api returns empty pages
+            if fetched and not page.failed and not page.elements:
+                return
+            yield page
+            fetched += len(page)
+            if page.failed or not page.pagination_token or fetched >= comment_count:
+                return
+            url_params["count"] = self._MAX_POST_COUNT
+
+    def _search_params(self, params: Dict, count: int, start: int) -> Dict:
+        """Return the full parameter set for one page of a search."""
+        default_params = {
+            "count": str(count),
+            "filters": "List()",
+            "origin": "GLOBAL_SEARCH_HEADER",
+            "q": "all",
+            "start": start,
+            "queryContext": "List(spellCorrectionEnabled->true,relatedSearchesEnabled->true,kcardTypes->PROFILE|COMPANY)",
+            "includeWebMetadata": "true",
+        }
+        default_params.update(params)
+        return default_params
+
+    def _search_uri(self, default_params: Dict) -> str:
+        """Return the graphql URI for one page of a search."""
+        keywords = (
+            f"keywords:{default_params['keywords']},"
+            if "keywords" in default_params
+            else ""
+        )
+
+        return (
+            f"/graphql?variables=(start:{default_params['start']},origin:{default_params['origin']},"
+            f"query:("
+            f"{keywords}"
+            f"flagshipSearchIntent:SEARCH_SRP,"
+            f"queryParameters:{default_params['filters']},"
+            f"includeFiltersInResponse:false))&queryId=voyagerSearchDashClusters"
+            f".b0928897b71bd00a5a7291755dcd64f0"
+        )
+
+    def _parse_search_page(self, data: Dict) -> Optional[List]:
+        """Extract entity results from one page of search clusters.
+
+        :return: List of entity results, or None if the response is not a search response
+        :rtype: list
+        """
+        data_clusters = data.get("data", []).get("searchDashClustersByAll", [])
+
+        if not data_clusters:
+            return None
+
+        if (
+            not data_clusters.get("_type", [])
+            == "com.linkedin.restli.common.CollectionResponse"
+        ):
+            return None
+
+        new_elements = []
+        for it in data_clusters.get("elements", []):
+            if (
+                not it.get("_type", [])
+                == "com.linkedin.voyager.dash.search.SearchClusterViewModel"
+            ):
+                continue
+
+            for el in it.get("items", []):
+                if (
+                    not el.get("_type", [])
+                    == "com.linkedin.voyager.dash.search.SearchItem"
+                ):
+                    continue
+
+                e = el.get("item", []).get("entityResult", [])
+                if not e:
+                    continue
+                if (
+                    not e.get("_type", [])
+                    == "com.linkedin.voyager.dash.search.EntityResultViewModel"
+                ):
+                    continue
+                new_elements.append(e)
+
+        return new_elements
+
+    @planned
+    def search(self, params: Dict, limit=-1, offset=0, prefetch=0) -> List:
         """Perform a LinkedIn search.
 
         :param params: Search parameters (see code)
@@ -208,99 +701,177 @@ class Linkedin(object):
         :type limit: int, optional
         :param offset: Index to start searching from
         :type offset: int, optional
+        :param prefetch: Number of pages fetched in the background while the current one is parsed, see `PagePrefetcher`. Defaults to 0
+        :type prefetch: int, optional
 
 
         :return: List of search results
         :rtype: list
         """
+        results, failed = yield from self._collect(
+            self.iter_search(params, limit, offset, prefetch)
+        )
+        return [] if failed else results
+
+    @planned_pages
+    def iter_search(
+        self, params: Dict, limit=-1, offset=0, prefetch=0
+    ) -> Iterator[Page]:
+        """Yield the results of a LinkedIn search page by page, as they are fetched. See `search`.
+
+        :return: Pages of search results
+        :rtype: iterator of Page
+        """
         count = Linkedin._MAX_SEARCH_COUNT
         if limit is None:
             limit = -1
+        end = limit + offset if limit > -1 else None
+
+        def fetch_page(start: int, count: int) -> Plan:
+            default_params = self._search_params(params, count, start)
+            res = yield self._fetch(self._search_uri(default_params))
+            return self._parse_search_page(self._decode(res))
+
+        fetched = 0
+        with self._PREFETCHER(
+            lambda start, count: self._run(fetch_page(start, count)), prefetch
+        ) as pages:
+            while True:
+                # when we're close to the limit, only fetch what we need to
+                if limit > -1 and limit - fetched < count:
+                    count = limit - fetched
+                start = fetched + offset
+                new_elements = yield pages.get(start, count)
+                if new_elements is None:
+                    yield Page([], start, start, failed=True)
+                    return
+
+                fetched += len(new_elements)
+                if new_elements:
+                    # search URIs don't carry the count: Linkedin picks the page
+                    # size, so the next pages are guessed from this one's
+                    pages.prefetch(
+                        next_pages(start, count, prefetch, end, step=len(new_elements))
+                    )
+                    yield Page(new_elements, start, fetched + offset)
 
-        results = []
-        while True:
-            # when we're close to the limit, only fetch what we need to
-            if limit > -1 and limit - len(results) < count:
-                count = limit - len(results)
-            default_params = {
-                "count": str(count),
-                "filters": "List()",
-                "origin": "GLOBAL_SEARCH_HEADER",
-                "q": "all",
-                "start": len(results) + offset,
-                "queryContext": "List(spellCorrectionEnabled->true,relatedSearchesEnabled->true,kcardTypes->PROFILE|COMPANY)",
-                "includeWebMetadata": "true",
-            }
-            default_params.update(params)
-
-            keywords = (
-                f"keywords:{default_params['keywords']},"
-                if "keywords" in default_params
-                else ""
-            )
-
-            res = self._fetch(
-                f"/graphql?variables=(start:{default_params['start']},origin:{default_params['origin']},"
-                f"query:("
-                f"{keywords}"
-                f"flagshipSearchIntent:SEARCH_SRP,"
-                f"queryParameters:{default_params['filters']},"
-                f"includeFiltersInResponse:false))&queryId=voyagerSearchDashClusters"
-                f".b0928897b71bd00a5a7291755dcd64f0"
-            )
-            data = res.json()
+                # break the loop if we're done searching
+                # NOTE: we could also check for the `total` returned in the response.
+                # This is in data["data"]["paging"]["total"]
+                if (
+                    (-1 < limit <= fetched)  # if our results exceed set limit
+                    or fetched / count >= Linkedin._MAX_REPEATED_REQUESTS
+                ) or len(new_elements) == 0:
+                    return
 
-            data_clusters = data.get("data", []).get("searchDashClustersByAll", [])
+                self.logger.debug(f"results grew to {fetched}")
 
-            if not data_clusters:
-                return []
+    def _search_people_params(
+        self,
+        keywords: Optional[str] = None,
+        connection_of: Optional[str] = None,
+        network_depths: Optional[List[str]] = None,
+        current_company: Optional[List[str]] = None,
+        past_companies: Optional[List[str]] = None,
+        nonprofit_interests: Optional[List[str]] = None,
+        profile_languages: Optional[List[str]] = None,
+        regions: Optional[List[str]] = None,
+        industries: Optional[List[str]] = None,
+        schools: Optional[List[str]] = None,
+        contact_interests: Optional[List[str]] = None,
+        service_categories: Optional[List[str]] = None,
+        keyword_first_name: Optional[str] = None,
+        keyword_last_name: Optional[str] = None,
+        keyword_title: Optional[str] = None,
+        keyword_company: Optional[str] = None,
+        keyword_school: Optional[str] = None,
+        network_depth: Optional[str] = None,
+        title: Optional[str] = None,
+    ) -> Dict:
+        """Return the search parameters for a people search. See `search_people`."""
+        filters = ["(key:resultType,value:List(PEOPLE))"]
+        if connection_of:
+            filters.append(f"(key:connectionOf,value:List({connection_of}))")
+        if network_depths:
+            stringify = " | ".join(network_depths)
+            filters.append(f"(key:network,value:List({stringify}))")
+        elif network_depth:
+            filters.append(f"(key:network,value:List({network_depth}))")
+        if regions:
+            stringify = " | ".join(regions)
+            filters.append(f"(key:geoUrn,value:List({stringify}))")
+        if industries:
+            stringify = " | ".join(industries)
+            filters.append(f"(key:industry,value:List({stringify}))")
+        if current_company:
+            stringify = " | ".join(current_company)
+            filters.append(f"(key:currentCompany,value:List({stringify}))")
+        if past_companies:
+            stringify = " | ".join(past_companies)
+            filters.append(f"(key:pastCompany,value:List({stringify}))")
+        if profile_languages:
+            stringify = " | ".join(profile_languages)
+            filters.append(f"(key:profileLanguage,value:List({stringify}))")
+        if nonprofit_interests:
+            stringify = " | ".join(nonprofit_interests)
+            filters.append(f"(key:nonprofitInterest,value:List({stringify}))")
+        if schools:
+            stringify = " | ".join(schools)
+            filters.append(f"(key:schools,value:List({stringify}))")
+        if service_categories:
+            stringify = " | ".join(service_categories)
+            filters.append(f"(key:serviceCategory,value:List({stringify}))")
+        # `Keywords` filter
+        keyword_title = keyword_title if keyword_title else title
+        if keyword_first_name:
+            filters.append(f"(key:firstName,value:List({keyword_first_name}))")
+        if keyword_last_name:
+            filters.append(f"(key:lastName,value:List({keyword_last_name}))")
+        if keyword_title:
+            filters.append(f"(key:title,value:List({keyword_title}))")
+        if keyword_company:
+            filters.append(f"(key:company,value:List({keyword_company}))")
+        if keyword_school:
+            filters.append(f"(key:school,value:List({keyword_school}))")
 
-            if (
-                not data_clusters.get("_type", [])
-                == "com.linkedin.restli.common.CollectionResponse"
-            ):
-                return []
+        params = {"filters": "List({})".format(",".join(filters))}
 
-            new_elements = []
-            for it in data_clusters.get("elements", []):
-                if (
-                    not it.get("_type", [])
-                    == "com.linkedin.voyager.dash.search.SearchClusterViewModel"
-                ):
-                    continue
+        if keywords:
+            params["keywords"] = keywords
 
-                for el in it.get("items", []):
-                    if (
-                        not el.get("_type", [])
-                        == "com.linkedin.voyager.dash.search.SearchItem"
-                    ):
-                        continue
-
-                    e = el.get("item", []).get("entityResult", [])
-                    if not e:
-                        continue
-                    if (
-                        not e.get("_type", [])
-                        == "com.linkedin.voyager.dash.search.EntityResultViewModel"
-                    ):
-                        continue
-                    new_elements.append(e)
-
-            results.extend(new_elements)
+        return params
 
-            # break the loop if we're done searching
-            # NOTE: we could also check for the `total` returned in the response.
-            # This is in data["data"]["paging"]["total"]
+    def _parse_people_results(
+        self, data: List, include_private_profiles=False
+    ) -> List[Dict]:
+        """Map raw entity results of a people search to minimal profiles."""
+        results = []
+        for item in data:
             if (
-                (-1 < limit <= len(results))  # if our results exceed set limit
-                or len(results) / count >= Linkedin._MAX_REPEATED_REQUESTS
-            ) or len(new_elements) == 0:
-                break
-
-            self.logger.debug(f"results grew to {len(results)}")
+                not include_private_profiles
+                and (item.get("entityCustomTrackingInfo") or {}).get(
+                    "memberDistance", None
+                )
+                == "OUT_OF_NETWORK"
+            ):
+                continue
+            results.append(
+                {
+                    "urn_id": get_id_from_urn(
+                        get_urn_from_raw_update(item.get("entityUrn", None))
+                    ),
+                    "distance": (item.get("entityCustomTrackingInfo") or {}).get(
+                        "memberDistance", None
+                    ),
+                    "jobtitle": (item.get("primarySubtitle") or {}).get("text", None),
+                    "location": (item.get("secondarySubtitle") or {}).get("text", None),
+                    "name": (item.get("title") or {}).get("text", None),
+                }
+            )
 
-        return results
+        return self._compact(PersonResult, results)
 
+    @planned
     def search_people(
         self,
         keywords: Optional[str] = None,
@@ -375,84 +946,131 @@ class Linkedin(object):
         :return: List of profiles (minimal data only)
         :rtype: list
         """
-        filters = ["(key:resultType,value:List(PEOPLE))"]
-        if connection_of:
-            filters.append(f"(key:connectionOf,value:List({connection_of}))")
-        if network_depths:
-            stringify = " | ".join(network_depths)
-            filters.append(f"(key:network,value:List({stringify}))")
-        elif network_depth:
-            filters.append(f"(key:network,value:List({network_depth}))")
-        if regions:
-            stringify = " | ".join(regions)
-            filters.append(f"(key:geoUrn,value:List({stringify}))")
-        if industries:
-            stringify = " | ".join(industries)
-            filters.append(f"(key:industry,value:List({stringify}))")
-        if current_company:
-            stringify = " | ".join(current_company)
-            filters.append(f"(key:currentCompany,value:List({stringify}))")
-        if past_companies:
-            stringify = " | ".join(past_companies)
-            filters.append(f"(key:pastCompany,value:List({stringify}))")
-        if profile_languages:
-            stringify = " | ".join(profile_languages)
-            filters.append(f"(key:profileLanguage,value:List({stringify}))")
-        if nonprofit_interests:
-            stringify = " | ".join(nonprofit_interests)
-            filters.append(f"(key:nonprofitInterest,value:List({stringify}))")
-        if schools:
-            stringify = " | ".join(schools)
-            filters.append(f"(key:schools,value:List({stringify}))")
-        if service_categories:
-            stringify = " | ".join(service_categories)
-            filters.append(f"(key:serviceCategory,value:List({stringify}))")
-        # `Keywords` filter
-        keyword_title = keyword_title if keyword_title else title
-        if keyword_first_name:
-            filters.append(f"(key:firstName,value:List({keyword_first_name}))")
-        if keyword_last_name:
-            filters.append(f"(key:lastName,value:List({keyword_last_name}))")
-        if keyword_title:
-            filters.append(f"(key:title,value:List({keyword_title}))")
-        if keyword_company:
-            filters.append(f"(key:company,value:List({keyword_company}))")
-        if keyword_school:
-            filters.append(f"(key:school,value:List({keyword_school}))")
+        params = self._search_people_params(
+            keywords=keywords,
+            connection_of=connection_of,
+            network_depths=network_depths,
+            current_company=current_company,
+            past_companies=past_companies,
+            nonprofit_interests=nonprofit_interests,
+            profile_languages=profile_languages,
+            regions=regions,
+            industries=industries,
+            schools=schools,
+            contact_interests=contact_interests,
+            service_categories=service_categories,
+            keyword_first_name=keyword_first_name,
+            keyword_last_name=keyword_last_name,
+            keyword_title=keyword_title,
+            keyword_company=keyword_company,
+            keyword_school=keyword_school,
+            network_depth=network_depth,
+            title=title,
+        )
 
-        params = {"filters": "List({})".format(",".join(filters))}
+        # map each page as it comes, not to keep every raw result until the end
+        results, failed = yield from self._collect(
+            self.iter_search(params, **kwargs),
+            lambda page: self._parse_people_results(page, include_private_profiles),
+        )
+        return [] if failed else results
 
-        if keywords:
-            params["keywords"] = keywords
+    def _merge_partition(
+        self, people: Dict[str, Dict], result: PartitionResult, depth: int
+    ):
+        """Add the people of one sub-query of a partitioned search to [people], by URN ID."""
+        for person in result.results:
+            people.setdefault(person["urn_id"], person)
+        if result.capped and len(result.partition.facets) == depth:
+            self.logger.warning(
+                f"partition {dict(result.partition.facets)} has too many results "
+                "to split further, its results are truncated"
+            )
 
-        data = self.search(params, **kwargs)
+    @planned
+    def search_people_partitioned(
+        self,
+        partition_by: Dict[str, Iterable[str]],
+        max_concurrency=4,
+        cap: Optional[int] = None,
+        prefetch=0,
+        include_private_profiles=False,
+        **kwargs,
+    ) -> List[Dict]:
+        """Perform a LinkedIn search for people past the result cap of a single query.
+
+        The whole search runs first. If it returns as many results as a query
+        can (`cap`), it is split into one sub-query per value of the first
+        facet of [partition_by], e.g. one per region, and so on recursively:
+        only the sub-queries hitting the cap are split along the next facet.
+        Sub-queries run concurrently, and people found by many of them are
+        returned once.
+
+        :param partition_by: Facets to split the search along, in order, each with the values to split it into. Facets are the `regions`, `industries`, `network_depths`, `past_companies` and `schools` of `search_people`, and can't also filter the search
+        :type partition_by: dict
+        :param max_concurrency: Maximum number of sub-queries in flight
+        :type max_concurrency: int, optional
+        :param cap: Number of results after which a query is considered truncated. Defaults to 1000
+        :type cap: int, optional
+        :param prefetch: Pages prefetched by each sub-query, see `search`
+        :type prefetch: int, optional
+        :param include_private_profiles: See `search_people`
+        :type include_private_profiles: boolean, optional
 
+        Other keyword arguments are the filters of `search_people`.
+
+        :return: List of profiles (minimal data only), in no particular order
+        :rtype: list
+        """
+        partition_by = check_partition_by(partition_by, kwargs)
+        cap = cap or self._MAX_SEARCH_RESULTS
+
+        def search(partition: SearchPartition) -> Plan:
+            """Plan returning the results of [partition], and whether it is capped."""
+            params = self._search_people_params(**kwargs, **partition.filters())
+            fetched = 0
+
+            def parse(page: Page) -> List[Dict]:
+                nonlocal fetched
+                fetched += len(page)
+                return self._parse_people_results(page, include_private_profiles)
+
+            results, failed = yield from self._collect(
+                self.iter_search(params, limit=cap, prefetch=prefetch), parse
+            )
+            if failed:
+                self.logger.warning(f"partition {dict(partition.facets)} failed")
+            return results, fetched >= cap
+
+        people: Dict[str, Dict] = {}
+        yield self._consume(
+            self._iter_partitions(
+                lambda partition: self._run(search(partition)),
+                partition_by,
+                max_concurrency,
+            ),
+            lambda result: self._merge_partition(people, result, len(partition_by)),
+        )
+        return list(people.values())
+
+    def _parse_company_results(self, data: List) -> List[Dict]:
+        """Map raw entity results of a company search to minimal companies."""
         results = []
         for item in data:
-            if (
-                not include_private_profiles
-                and (item.get("entityCustomTrackingInfo") or {}).get(
-                    "memberDistance", None
-                )
-                == "OUT_OF_NETWORK"
-            ):
+            if "company" not in item.get("trackingUrn"):
                 continue
             results.append(
                 {
-                    "urn_id": get_id_from_urn(
-                        get_urn_from_raw_update(item.get("entityUrn", None))
-                    ),
-                    "distance": (item.get("entityCustomTrackingInfo") or {}).get(
-                        "memberDistance", None
-                    ),
-                    "jobtitle": (item.get("primarySubtitle") or {}).get("text", None),
-                    "location": (item.get("secondarySubtitle") or {}).get("text", None),
+                    "urn_id": get_id_from_urn(item.get("trackingUrn", None)),
                     "name": (item.get("title") or {}).get("text", None),
+                    "headline": (item.get("primarySubtitle") or {}).get("text", None),
+                    "subline": (item.get("secondarySubtitle") or {}).get("text", None),
                 }
             )
 
-        return results
+        return self._compact(CompanyResult, results)
 
+    @planned
     def search_companies(self, keywords: Optional[List[str]] = None, **kwargs) -> List:
         """Perform a LinkedIn search for companies.
 
@@ -462,6 +1080,16 @@ class Linkedin(object):
         :return: List of companies
         :rtype: list
         """
+        results, failed = yield from self._collect(
+            self.iter_search(self._search_companies_params(keywords), **kwargs),
+            self._parse_company_results,
+        )
+        return [] if failed else results
+
+    def _search_companies_params(
+        self, keywords: Optional[List[str]] = None
+    ) -> Dict[str, Union[str, List[str]]]:
+        """Return the search parameters of `search_companies`."""
         filters = ["(key:resultType,value:List(COMPANIES))"]
 
         params: Dict[str, Union[str, List[str]]] = {
@@ -472,23 +1100,98 @@ class Linkedin(object):
         if keywords:
             params["keywords"] = keywords
 
-        data = self.search(params, **kwargs)
+        return params
 
-        results = []
-        for item in data:
-            if "company" not in item.get("trackingUrn"):
-                continue
-            results.append(
-                {
-                    "urn_id": get_id_from_urn(item.get("trackingUrn", None)),
-                    "name": (item.get("title") or {}).get("text", None),
-                    "headline": (item.get("primarySubtitle") or {}).get("text", None),
-                    "subline": (item.get("secondarySubtitle") or {}).get("text", None),
-                }
-            )
+    def _search_jobs_query(
+        self,
+        keywords: Optional[str] = None,
+        companies: Optional[List[str]] = None,
+        experience: Optional[List[str]] = None,
+        job_type: Optional[List[str]] = None,
+        job_title: Optional[List[str]] = None,
+        industries: Optional[List[str]] = None,
+        location_name: Optional[str] = None,
+        remote: Optional[List[str]] = None,
+        listed_at=24 * 60 * 60,
+        distance: Optional[int] = None,
+    ) -> str:
+        """Return the `query` parameter for a job search. See `search_jobs`."""
+        query: Dict[str, Union[str, Dict[str, str]]] = {
+            "origin": "JOB_SEARCH_PAGE_QUERY_EXPANSION"
+        }
+        if keywords:
+            query["keywords"] = "KEYWORD_PLACEHOLDER"
+        if location_name:
+            query["locationFallback"] = "LOCATION_PLACEHOLDER"
 
-        return results
+        # In selectedFilters()
+        query["selectedFilters"] = {}
+        if companies:
+            query["selectedFilters"]["company"] = f"List({','.join(companies)})"
+        if experience:
+            query["selectedFilters"]["experience"] = f"List({','.join(experience)})"
+        if job_type:
+            query["selectedFilters"]["jobType"] = f"List({','.join(job_type)})"
+        if job_title:
+            query["selectedFilters"]["title"] = f"List({','.join(job_title)})"
+        if industries:
+            query["selectedFilters"]["industry"] = f"List({','.join(industries)})"
+        if distance:
+            query["selectedFilters"]["distance"] = f"List({distance})"
+        if remote:
+            query["selectedFilters"]["workplaceType"] = f"List({','.join(remote)})"
+
+        query["selectedFilters"]["timePostedRange"] = f"List(r{listed_at})"
+        query["spellCorrectionEnabled"] = "true"
 
+        # Query structure:
+        # "(
+        #    origin:JOB_SEARCH_PAGE_QUERY_EXPANSION,
+        #    keywords:marketing%20manager,
+        #    locationFallback:germany,
+        #    selectedFilters:(
+        #        distance:List(25),
+        #        company:List(163253),
+        #        salaryBucketV2:List(5),
+        #        timePostedRange:List(r2592000),
+        #        workplaceType:List(1)
+        #    ),
+        #    spellCorrectionEnabled:true
+        #  )"
+
+        query_string = (
+            str(query)
+            .replace(" ", "")
+            .replace("'", "")
+            .replace("KEYWORD_PLACEHOLDER", keywords or "")
+            .replace("LOCATION_PLACEHOLDER", location_name or "")
+            .replace("{", "(")
+            .replace("}", ")")
+        )
+        return query_string
+
+    def _search_jobs_uri(self, query_string: str, count: int, start: int) -> str:
+        """Return the URI for one page of a job search."""
+        default_params = {
+            "decorationId": "com.linkedin.voyager.dash.deco.jobs.search.JobSearchCardsCollection-174",
+            "count": count,
+            "q": "jobSearch",
+            "query": query_string,
+            "start": start,
+        }
+
+        return f"/voyagerJobsDashJobCards?{urlencode(default_params, safe='(),:')}"
+
+    def _parse_job_postings(self, elements: Iterable[Dict]) -> List[Dict]:
+        """Keep only the job postings of a job search `included` list."""
+        postings = [
+            i
+            for i in elements
+            if i["$type"] == "com.linkedin.voyager.dash.jobs.JobPosting"
+        ]
+        return self._compact(JobCard, postings)
+
+    @planned
     def search_jobs(
         self,
         keywords: Optional[str] = None,
@@ -526,6 +1229,7 @@ class Linkedin(object):
         distance: Optional[int] = None,
         limit=-1,
         offset=0,
+        prefetch=0,
         **kwargs,
     ) -> List[Dict]:
         """Perform a LinkedIn search for jobs.
@@ -554,124 +1258,103 @@ class Linkedin(object):
         :type limit: int, optional, default -1
         :param offset: indicates how many search results shall be skipped
         :type offset: int, optional
-        :return: List of jobs
-        :rtype: list
+        :param prefetch: Number of pages fetched in the background while the current one is parsed, see `PagePrefetcher`. Defaults to 0
+        :type prefetch: int, optional
+        :return: List of jobs
+        :rtype: list
+        """
+        jobs, _ = yield from self._collect(
+            self.iter_search_jobs(
+                limit=limit,
+                offset=offset,
+                prefetch=prefetch,
+                keywords=keywords,
+                companies=companies,
+                experience=experience,
+                job_type=job_type,
+                job_title=job_title,
+                industries=industries,
+                location_name=location_name,
+                remote=remote,
+                listed_at=listed_at,
+                distance=distance,
+            )
+        )
+        return jobs
+
+    @planned_pages
+    def iter_search_jobs(
+        self, limit=-1, offset=0, prefetch=0, **filters
+    ) -> Iterator[Page]:
+        """Yield the results of a LinkedIn search for jobs page by page, as they are fetched.
+
+        :param limit: maximum number of results, see `search_jobs`
+        :type limit: int, optional, default -1
+        :param offset: indicates how many search results shall be skipped
+        :type offset: int, optional
+        :param prefetch: Number of pages fetched in the background while the current one is parsed, see `PagePrefetcher`
+        :type prefetch: int, optional
+        :param filters: keywords, companies, experience... as taken by `search_jobs`
+        :return: Pages of jobs
+        :rtype: iterator of Page
         """
         count = Linkedin._MAX_SEARCH_COUNT
         if limit is None:
             limit = -1
-
-        query: Dict[str, Union[str, Dict[str, str]]] = {
-            "origin": "JOB_SEARCH_PAGE_QUERY_EXPANSION"
-        }
-        if keywords:
-            query["keywords"] = "KEYWORD_PLACEHOLDER"
-        if location_name:
-            query["locationFallback"] = "LOCATION_PLACEHOLDER"
-
-        # In selectedFilters()
-        query["selectedFilters"] = {}
-        if companies:
-            query["selectedFilters"]["company"] = f"List({','.join(companies)})"
-        if experience:
-            query["selectedFilters"]["experience"] = f"List({','.join(experience)})"
-        if job_type:
-            query["selectedFilters"]["jobType"] = f"List({','.join(job_type)})"
-        if job_title:
-            query["selectedFilters"]["title"] = f"List({','.join(job_title)})"
-        if industries:
-            query["selectedFilters"]["industry"] = f"List({','.join(industries)})"
-        if distance:
-            query["selectedFilters"]["distance"] = f"List({distance})"
-        if remote:
-            query["selectedFilters"]["workplaceType"] = f"List({','.join(remote)})"
-
-        query["selectedFilters"]["timePostedRange"] = f"List(r{listed_at})"
-        query["spellCorrectionEnabled"] = "true"
-
-        # Query structure:
-        # "(
-        #    origin:JOB_SEARCH_PAGE_QUERY_EXPANSION,
-        #    keywords:marketing%20manager,
-        #    locationFallback:germany,
-        #    selectedFilters:(
-        #        distance:List(25),
-        #        company:List(163253),
-        #        salaryBucketV2:List(5),
-        #        timePostedRange:List(r2592000),
-        #        workplaceType:List(1)
-        #    ),
-        #    spellCorrectionEnabled:true
-        #  )"
-
-        query_string = (
-            str(query)
-            .replace(" ", "")
-            .replace("'", "")
-            .replace("KEYWORD_PLACEHOLDER", keywords or "")
-            .replace("LOCATION_PLACEHOLDER", location_name or "")
-            .replace("{", "(")
-            .replace("}", ")")
-        )
-        results = []
-        while True:
-            # when we're close to the limit, only fetch what we need to
-            if limit > -1 and limit - len(results) < count:
-                count = limit - len(results)
-            default_params = {
-                "decorationId": "com.linkedin.voyager.dash.deco.jobs.search.JobSearchCardsCollection-174",
-                "count": count,
-                "q": "jobSearch",
-                "query": query_string,
-                "start": len(results) + offset,
-            }
-
-            res = self._fetch(
-                f"/voyagerJobsDashJobCards?{urlencode(default_params, safe='(),:')}",
-                headers={"accept": "application/vnd.linkedin.normalized+json+2.1"},
-            )
-            data = res.json()
-
+        end = limit + offset if limit > -1 else None
+
+        query_string = self._search_jobs_query(**filters)
+
+        def fetch_page(start: int, count: int) -> Plan:
+            """Plan returning the postings of a page, and its number of entities."""
+            uri = self._search_jobs_uri(query_string, count, start)
+            headers = {"accept": "application/vnd.linkedin.normalized+json+2.1"}
+            if self.stream_included:
+                page = yield self._stream(uri, JOB_POSTING_NEEDLES, headers=headers)
+                postings = []
+                while True:
+                    entities = yield page.next_batch()
+                    if entities is None:
+                        return postings, page.count
+                    postings.extend(
+                        self._parse_job_postings(self._store_included(entities))
+                    )
+            data = self._decode((yield self._fetch(uri, headers=headers)))
             elements = data.get("included", [])
-            new_data = [
-                i
-                for i in elements
-                if i["$type"] == "com.linkedin.voyager.dash.jobs.JobPosting"
-            ]
-            # break the loop if we're done searching or no results returned
-            if not new_data:
-                break
-            # NOTE: we could also check for the `total` returned in the response.
-            # This is in data["data"]["paging"]["total"]
-            results.extend(new_data)
-            if (
-                (-1 < limit <= len(results))  # if our results exceed set limit
-                or len(results) / count >= Linkedin._MAX_REPEATED_REQUESTS
-            ) or len(elements) == 0:
-                break
-
-            self.logger.debug(f"results grew to {len(results)}")
-
-        return results
-
-    def get_profile_contact_info(
-        self, public_id: Optional[str] = None, urn_id: Optional[str] = None
-    ) -> Dict:
-        """Fetch contact information for a given LinkedIn profile. Pass a [public_id] or a [urn_id].
+            return (
+                self._parse_job_postings(self._store_included(elements)),
+                len(elements),
+            )
 
-        :param public_id: LinkedIn public ID for a profile
-        :type public_id: str, optional
-        :param urn_id: LinkedIn URN ID for a profile
-        :type urn_id: str, optional
+        fetched = 0
+        with self._PREFETCHER(
+            lambda start, count: self._run(fetch_page(start, count)), prefetch
+        ) as pages:
+            while True:
+                # when we're close to the limit, only fetch what we need to
+                if limit > -1 and limit - fetched < count:
+                    count = limit - fetched
+                start = fetched + offset
+                new_data, included_count = yield pages.get(
+                    start, count, next_pages(start, count, prefetch, end)
+                )
+                # break the loop if we're done searching or no results returned
+                if not new_data:
+                    return
+                # NOTE: we could also check for the `total` returned in the response.
+                # This is in data["data"]["paging"]["total"]
+                fetched += len(new_data)
+                yield Page(new_data, start, fetched + offset)
+                if (
+                    (-1 < limit <= fetched)  # if our results exceed set limit
+                    or fetched / count >= Linkedin._MAX_REPEATED_REQUESTS
+                ) or included_count == 0:
+                    return
 
-        :return: Contact data
-        :rtype: dict
-        """
-        res = self._fetch(
-            f"/identity/profiles/{public_id or urn_id}/profileContactInfo"
-        )
-        data = res.json()
+                self.logger.debug(f"results grew to {fetched}")
 
+    def _parse_contact_info(self, data: Dict) -> Dict:
+        """Massage a profileContactInfo response. See `get_profile_contact_info`."""
         contact_info = {
             "email_address": data.get("emailAddress"),
             "websites": [],
@@ -698,6 +1381,34 @@ class Linkedin(object):
 
         return contact_info
 
+    @planned
+    def get_profile_contact_info(
+        self, public_id: Optional[str] = None, urn_id: Optional[str] = None
+    ) -> Dict:
+        """Fetch contact information for a given LinkedIn profile. Pass a [public_id] or a [urn_id].
+
+        :param public_id: LinkedIn public ID for a profile
+        :type public_id: str, optional
+        :param urn_id: LinkedIn URN ID for a profile
+        :type urn_id: str, optional
+
+        :return: Contact data
+        :rtype: dict
+        """
+        res = yield self._fetch(
+            f"/identity/profiles/{public_id or urn_id}/profileContactInfo"
+        )
+        return self._parse_contact_info(self._decode(res))
+
+    def _parse_skills(self, data: Dict) -> List:
+        """Massage a skills response. See `get_profile_skills`."""
+        skills = data.get("elements", [])
+        for item in skills:
+            del item["entityUrn"]
+
+        return skills
+
+    @planned
     def get_profile_skills(
         self, public_id: Optional[str] = None, urn_id: Optional[str] = None
     ) -> List:
@@ -713,19 +1424,22 @@ class Linkedin(object):
         :rtype: list
         """
         params = {"count": 100, "start": 0}
-        res = self._fetch(
+        res = yield self._fetch(
             f"/identity/profiles/{public_id or urn_id}/skills", params=params
         )
-        data = res.json()
+        return self._parse_skills(self._decode(res))
 
-        skills = data.get("elements", [])
-        for item in skills:
-            del item["entityUrn"]
+    def _parse_profile(self, data: Dict, lazy=False) -> Dict:
+        """Massage a profileView response. See `get_profile`."""
+        if data and "status" in data and data["status"] != 200:
+            self.logger.info("request failed: {}".format(data["message"]))
+            return {}
 
-        return skills
+        return LazyProfile(data) if lazy else massage_profile(data)
 
+    @planned
     def get_profile(
-        self, public_id: Optional[str] = None, urn_id: Optional[str] = None
+        self, public_id: Optional[str] = None, urn_id: Optional[str] = None, lazy=False
     ) -> Dict:
         """Fetch data for a given LinkedIn profile.
 
@@ -733,121 +1447,19 @@ class Linkedin(object):
         :type public_id: str, optional
         :param urn_id: LinkedIn URN ID for a profile
         :type urn_id: str, optional
+        :param lazy: Return a read-only `LazyProfile`, massaging each section of the profile the first time it is read. Defaults to False
+        :type lazy: bool, optional
 
         :return: Profile data
         :rtype: dict
         """
         # NOTE this still works for now, but will probably eventually have to be converted to
         # https://www.linkedin.com/voyager/api/identity/profiles/ACoAAAKT9JQBsH7LwKaE9Myay9WcX8OVGuDq9Uw
-        res = self._fetch(f"/identity/profiles/{public_id or urn_id}/profileView")
-
-        data = res.json()
-        if data and "status" in data and data["status"] != 200:
-            self.logger.info("request failed: {}".format(data["message"]))
-            return {}
-
-        # massage [profile] data
-        profile = data["profile"]
-        if "miniProfile" in profile:
-            if "picture" in profile["miniProfile"]:
-                profile["displayPictureUrl"] = profile["miniProfile"]["picture"][
-                    "com.linkedin.common.VectorImage"
-                ]["rootUrl"]
-
-                images_data = profile["miniProfile"]["picture"][
-                    "com.linkedin.common.VectorImage"
-                ]["artifacts"]
-                for img in images_data:
-                    w, h, url_segment = itemgetter(
-                        "width", "height", "fileIdentifyingUrlPathSegment"
-                    )(img)
-                    profile[f"img_{w}_{h}"] = url_segment
-
-            profile["profile_id"] = get_id_from_urn(profile["miniProfile"]["entityUrn"])
-            profile["profile_urn"] = profile["miniProfile"]["entityUrn"]
-            profile["member_urn"] = profile["miniProfile"]["objectUrn"]
-            profile["public_id"] = profile["miniProfile"]["publicIdentifier"]
-
-            del profile["miniProfile"]
-
-        del profile["defaultLocale"]
-        del profile["supportedLocales"]
-        del profile["versionTag"]
-        del profile["showEducationOnProfileTopCard"]
-
-        # massage [experience] data
-        experience = data["positionView"]["elements"]
-        for item in experience:
-            if "company" in item and "miniCompany" in item["company"]:
-                if "logo" in item["company"]["miniCompany"]:
-                    logo = item["company"]["miniCompany"]["logo"].get(
-                        "com.linkedin.common.VectorImage"
-                    )
-                    if logo:
-                        item["companyLogoUrl"] = logo["rootUrl"]
-                del item["company"]["miniCompany"]
-
-        profile["experience"] = experience
-
-        # massage [education] data
-        education = data["educationView"]["elements"]
-        for item in education:
-            if "school" in item:
-                if "logo" in item["school"]:
-                    item["school"]["logoUrl"] = item["school"]["logo"][
-                        "com.linkedin.common.VectorImage"
-                    ]["rootUrl"]
-                    del item["school"]["logo"]
-
-        profile["education"] = education
-
-        # massage [languages] data
-        languages = data["languageView"]["elements"]
-        for item in languages:
-            del item["entityUrn"]
-        profile["languages"] = languages
-
-        # massage [publications] data
-        publications = data["publicationView"]["elements"]
-        for item in publications:
-            del item["entityUrn"]
-            for author in item.get("authors", []):
-                del author["entityUrn"]
-        profile["publications"] = publications
-
-        # massage [certifications] data
-        certifications = data["certificationView"]["elements"]
-        for item in certifications:
-            del item["entityUrn"]
-        profile["certifications"] = certifications
-
-        # massage [volunteer] data
-        volunteer = data["volunteerExperienceView"]["elements"]
-        for item in volunteer:
-            del item["entityUrn"]
-        profile["volunteer"] = volunteer
-
-        # massage [honors] data
-        honors = data["honorView"]["elements"]
-        for item in honors:
-            del item["entityUrn"]
-        profile["honors"] = honors
-
-        # massage [projects] data
-        projects = data["projectView"]["elements"]
-        for item in projects:
-            del item["entityUrn"]
-        profile["projects"] = projects
-        # massage [skills] data
-        skills = data["skillView"]["elements"]
-        for item in skills:
-            del item["entityUrn"]
-        profile["skills"] = skills
-
-        profile["urn_id"] = profile["entityUrn"].replace("urn:li:fs_profile:", "")
+        res = yield self._fetch(f"/identity/profiles/{public_id or urn_id}/profileView")
 
-        return profile
+        return self._parse_profile(self._decode(res), lazy)
 
+    @planned
     def get_profile_connections(self, urn_id: str) -> List:
         """Fetch first-degree connections for a given LinkedIn profile.
 
@@ -857,8 +1469,43 @@ class Linkedin(object):
         :return: List of search results
         :rtype: list
         """
-        return self.search_people(connection_of=urn_id, network_depth="F")
+        return (yield self.search_people(connection_of=urn_id, network_depth="F"))
+
+    def _bulk_getter(self, getter: str):
+        """Return the bound per-profile method named [getter]"""
+        if getter not in self.PROFILE_GETTERS:
+            raise ValueError(
+                f"getter must be one of {', '.join(self.PROFILE_GETTERS)}, not {getter!r}"
+            )
+        return getattr(self, getter)
+
+    def get_profiles(
+        self,
+        ids: Iterable[Union[str, Dict]],
+        max_concurrency=4,
+        getter="get_profile",
+    ) -> Iterator[BulkResult]:
+        """Fetch many profiles concurrently, yielding results as they complete.
+
+        Each item of [ids] is passed to [getter] as its first argument (a public ID
+        for most getters), or as keyword arguments if it is a dict, e.g.
+        ``{"urn_id": "ACoAA..."}``. Delays of `default_evade` or the rate limiter
+        overlap between workers, so keep [max_concurrency] within the
+        `TransportConfig.pool_maxsize` of the client.
+
+        :param ids: Profiles to fetch
+        :type ids: iterable
+        :param max_concurrency: Maximum number of requests in flight
+        :type max_concurrency: int, optional
+        :param getter: Per-profile method to call, one of `PROFILE_GETTERS`
+        :type getter: str, optional
+
+        :return: Generator of `BulkResult`, in completion order. A failed item carries its exception in `error`
+        :rtype: generator
+        """
+        return self._iter_bulk(self._bulk_getter(getter), ids, max_concurrency)
 
+    @planned
     def get_company_updates(
         self,
         public_id: Optional[str] = None,
@@ -876,42 +1523,45 @@ class Linkedin(object):
         :return: List of company update objects
         :rtype: list
         """
-
         if results is None:
             results = []
+        yield self._consume(
+            self.iter_company_updates(
+                public_id, urn_id, max_results, start=len(results)
+            ),
+            results.extend,
+        )
+        return results
 
+    @planned_pages
+    def iter_company_updates(
+        self,
+        public_id: Optional[str] = None,
+        urn_id: Optional[str] = None,
+        max_results: Optional[int] = None,
+        start=0,
+    ) -> Iterator[Page]:
+        """Yield the updates of a LinkedIn company page by page, as they are fetched.
+        See `get_company_updates`.
+
+        The `Page.next_start` of each page is a cursor: passing it back as
+        `start` resumes an interrupted crawl after that page.
+
+        :param max_results: Position to stop the crawl at
+        :type max_results: int, optional
+        :param start: Position to start the crawl from
+        :type start: int, optional
+        :return: Pages of company update objects
+        :rtype: iterator of Page
+        """
         params = {
-            "companyUniversalName": {public_id or urn_id},
+            "companyUniversalName": public_id or urn_id,
             "q": "companyFeedByUniversalName",
             "moduleKey": "member-share",
-            "count": Linkedin._MAX_UPDATE_COUNT,
-            "start": len(results),
         }
+        return (yield from self._iter_updates(params, max_results, start))
 
-        res = self._fetch(f"/feed/updates", params=params)
-
-        data = res.json()
-
-        if (
-            len(data["elements"]) == 0
-            or (max_results is not None and len(results) >= max_results)
-            or (
-                max_results is not None
-                and len(results) / max_results >= Linkedin._MAX_REPEATED_REQUESTS
-            )
-        ):
-            return results
-
-        results.extend(data["elements"])
-        self.logger.debug(f"results grew: {len(results)}")
-
-        return self.get_company_updates(
-            public_id=public_id,
-            urn_id=urn_id,
-            results=results,
-            max_results=max_results,
-        )
-
+    @planned
     def get_profile_updates(
         self, public_id=None, urn_id=None, max_results=None, results=None
     ):
@@ -925,51 +1575,59 @@ class Linkedin(object):
         :return: List of profile update objects
         :rtype: list
         """
-
         if results is None:
             results = []
+        yield self._consume(
+            self.iter_profile_updates(
+                public_id, urn_id, max_results, start=len(results)
+            ),
+            results.extend,
+        )
+        return results
+
+    @planned_pages
+    def iter_profile_updates(
+        self, public_id=None, urn_id=None, max_results=None, start=0
+    ) -> Iterator[Page]:
+        """Yield the updates of a LinkedIn profile page by page, as they are fetched.
+        See `get_profile_updates`, and `iter_company_updates` for resuming a crawl.
 
+        :return: Pages of profile update objects
+        :rtype: iterator of Page
+        """
         params = {
-            "profileId": {public_id or urn_id},
+            "profileId": public_id or urn_id,
             "q": "memberShareFeed",
             "moduleKey": "member-share",
-            "count": Linkedin._MAX_UPDATE_COUNT,
-            "start": len(results),
         }
-
-        res = self._fetch(f"/feed/updates", params=params)
-
-        data = res.json()
-
-        if (
-            len(data["elements"]) == 0
-            or (max_results is not None and len(results) >= max_results)
-            or (
-                max_results is not None
-                and len(results) / max_results >= Linkedin._MAX_REPEATED_REQUESTS
+        return (yield from self._iter_updates(params, max_results, start))
+
+    def _iter_updates(
+        self, params: Dict, max_results: Optional[int], start: int
+    ) -> Plan:
+        """Paginated plan of a `/feed/updates` crawl from `start`."""
+        while max_results is None or start < max_results:
+            res = yield self._fetch(
+                f"/feed/updates",
+                params={**params, "count": Linkedin._MAX_UPDATE_COUNT, "start": start},
             )
-        ):
-            return results
-
-        results.extend(data["elements"])
-        self.logger.debug(f"results grew: {len(results)}")
-
-        return self.get_profile_updates(
-            public_id=public_id,
-            urn_id=urn_id,
-            results=results,
-            max_results=max_results,
-        )
-
+            elements = self._decode(res)["elements"]
+            if not elements:
+                return
+            yield Page(elements, start, start + len(elements))
+            start += len(elements)
+            self.logger.debug(f"results grew: {start}")
+
+    @planned
     def get_current_profile_views(self):
         """Get profile view statistics, including chart data.
 
         :return: Profile view data
         :rtype: dict
         """
-        res = self._fetch(f"/identity/wvmpCards")
+        res = yield self._fetch(f"/identity/wvmpCards")
 
-        data = res.json()
+        data = self._decode(res)
 
         return data["elements"][0]["value"][
             "com.linkedin.voyager.identity.me.wvmpOverview.WvmpViewersCard"
@@ -979,6 +1637,7 @@ class Linkedin(object):
             "numViews"
         ]
 
+    @planned
     def get_school(self, public_id):
         """Fetch data about a given LinkedIn school.
 
@@ -994,9 +1653,9 @@ class Linkedin(object):
             "universalName": public_id,
         }
 
-        res = self._fetch(f"/organization/companies?{urlencode(params)}")
+        res = yield self._fetch(f"/organization/companies?{urlencode(params)}")
 
-        data = res.json()
+        data = self._decode(res)
 
         if data and "status" in data and data["status"] != 200:
             self.logger.info("request failed: {}".format(data))
@@ -1006,6 +1665,7 @@ class Linkedin(object):
 
         return school
 
+    @planned
     def get_company(self, public_id):
         """Fetch data about a given LinkedIn company.
 
@@ -1021,9 +1681,9 @@ class Linkedin(object):
             "universalName": public_id,
         }
 
-        res = self._fetch(f"/organization/companies", params=params)
+        res = yield self._fetch(f"/organization/companies", params=params)
 
-        data = res.json()
+        data = self._decode(res)
 
         if data and "status" in data and data["status"] != 200:
             self.logger.info("request failed: {}".format(data["message"]))
@@ -1033,6 +1693,7 @@ class Linkedin(object):
 
         return company
 
+    @planned
     def get_conversation_details(self, profile_urn_id):
         """Fetch conversation (message thread) details for a given LinkedIn profile.
 
@@ -1044,12 +1705,12 @@ class Linkedin(object):
         """
         # passing `params` doesn't work properly, think it's to do with List().
         # Might be a bug in `requests`?
-        res = self._fetch(
+        res = yield self._fetch(
             f"/messaging/conversations?\
             keyVersion=LEGACY_INBOX&q=participants&recipients=List({profile_urn_id})"
         )
 
-        data = res.json()
+        data = self._decode(res)
 
         if data["elements"] == []:
             return {}
@@ -1059,6 +1720,7 @@ class Linkedin(object):
 
         return item
 
+    @planned
     def get_conversations(self):
         """Fetch list of conversations the user is in.
 
@@ -1067,10 +1729,11 @@ class Linkedin(object):
         """
         params = {"keyVersion": "LEGACY_INBOX"}
 
-        res = self._fetch(f"/messaging/conversations", params=params)
+        res = yield self._fetch(f"/messaging/conversations", params=params)
 
-        return res.json()
+        return self._decode(res)
 
+    @planned
     def get_conversation(self, conversation_urn_id: str):
         """Fetch data about a given conversation.
 
@@ -1080,10 +1743,32 @@ class Linkedin(object):
         :return: Conversation data
         :rtype: dict
         """
-        res = self._fetch(f"/messaging/conversations/{conversation_urn_id}/events")
+        res = yield self._fetch(
+            f"/messaging/conversations/{conversation_urn_id}/events"
+        )
+
+        return self._decode(res)
 
-        return res.json()
+    def _message_event(self, message_body: str) -> Dict:
+        """Return the event payload for sending `message_body`. See `send_message`."""
+        return {
+            "eventCreate": {
+                "originToken": str(uuid.uuid4()),
+                "value": {
+                    "com.linkedin.voyager.messaging.create.MessageCreate": {
+                        "attributedBody": {
+                            "text": message_body,
+                            "attributes": [],
+                        },
+                        "attachments": [],
+                    }
+                },
+                "trackingId": generate_trackingId_as_charString(),
+            },
+            "dedupeByClientGeneratedToken": False,
+        }
 
+    @planned
     def send_message(
         self,
         message_body: str,
@@ -1108,25 +1793,10 @@ class Linkedin(object):
             self.logger.debug("Must provide [conversation_urn_id] or [recipients].")
             return True
 
-        message_event = {
-            "eventCreate": {
-                "originToken": str(uuid.uuid4()),
-                "value": {
-                    "com.linkedin.voyager.messaging.create.MessageCreate": {
-                        "attributedBody": {
-                            "text": message_body,
-                            "attributes": [],
-                        },
-                        "attachments": [],
-                    }
-                },
-                "trackingId": generate_trackingId_as_charString(),
-            },
-            "dedupeByClientGeneratedToken": False,
-        }
+        message_event = self._message_event(message_body)
 
         if conversation_urn_id and not recipients:
-            res = self._post(
+            res = yield self._post(
                 f"/messaging/conversations/{conversation_urn_id}/events",
                 params=params,
                 data=json.dumps(message_event),
@@ -1138,7 +1808,7 @@ class Linkedin(object):
                 "keyVersion": "LEGACY_INBOX",
                 "conversationCreate": message_event,
             }
-            res = self._post(
+            res = yield self._post(
                 f"/messaging/conversations",
                 params=params,
                 data=json.dumps(payload),
@@ -1146,6 +1816,7 @@ class Linkedin(object):
 
         return res.status_code != 201
 
+    @planned
     def mark_conversation_as_seen(self, conversation_urn_id: str):
         """Send 'seen' to a given conversation.
 
@@ -1157,12 +1828,13 @@ class Linkedin(object):
         """
         payload = json.dumps({"patch": {"$set": {"read": True}}})
 
-        res = self._post(
+        res = yield self._post(
             f"/messaging/conversations/{conversation_urn_id}", data=payload
         )
 
         return res.status_code != 200
 
+    @planned
     def get_user_profile(self, use_cache=True) -> Dict:
         """Get the current user profile. If not cached, a network request will be fired.
 
@@ -1171,13 +1843,14 @@ class Linkedin(object):
         """
         me_profile = self.client.metadata.get("me", {})
         if not self.client.metadata.get("me") or not use_cache:
-            res = self._fetch(f"/me")
-            me_profile = res.json()
+            res = yield self._fetch(f"/me")
+            me_profile = self._decode(res)
             # cache profile
             self.client.metadata["me"] = me_profile
 
         return me_profile
 
+    @planned
     def get_invitations(self, start=0, limit=3):
         """Fetch connection invitations for the currently logged in user.
 
@@ -1196,7 +1869,7 @@ class Linkedin(object):
             "q": "receivedInvitation",
         }
 
-        res = self._fetch(
+        res = yield self._fetch(
             "/relationships/invitationViews",
             params=params,
         )
@@ -1204,9 +1877,10 @@ class Linkedin(object):
         if res.status_code != 200:
             return []
 
-        response_payload = res.json()
+        response_payload = self._decode(res)
         return [element["invitation"] for element in response_payload["elements"]]
 
+    @planned
     def reply_invitation(
         self, invitation_entity_urn: str, invitation_shared_secret: str, action="accept"
     ):
@@ -1232,14 +1906,16 @@ class Linkedin(object):
             }
         )
 
-        res = self._post(
+        res = yield self._post(
             f"/relationships/invitations/{invitation_id}",
             params=params,
             data=payload,
         )
+        self._invalidate("/relationships/", "/graphql")
 
         return res.status_code == 200
 
+    @planned
     def add_connection(self, profile_public_id: str, message="", profile_urn=None):
         """Add a given profile id as a connection.
 
@@ -1260,9 +1936,8 @@ class Linkedin(object):
             return False
 
         if not profile_urn:
-            profile_urn_string = self.get_profile(public_id=profile_public_id)[
-                "profile_urn"
-            ]
+            profile = yield self.get_profile(public_id=profile_public_id, lazy=True)
+            profile_urn_string = profile["profile_urn"]
             # Returns string of the form 'urn:li:fs_miniProfile:ACoAACX1hoMBvWqTY21JGe0z91mnmjmLy9Wen4w'
             # We extract the last part of the string
             profile_urn = profile_urn_string.split(":")[-1]
@@ -1279,14 +1954,25 @@ class Linkedin(object):
                 }
             },
         }
-        res = self._post(
+        res = yield self._post(
             "/growth/normInvitations",
             data=json.dumps(payload),
             headers={"accept": "application/vnd.linkedin.normalized+json+2.1"},
         )
+        # the invitee's network info, and every list of connection states
+        self._invalidate(
+            *(
+                f"/identity/profiles/{id}/"
+                for id in (profile_public_id, profile_urn)
+                if id
+            ),
+            "/relationships/",
+            "/graphql",
+        )
 
         return res.status_code != 201
 
+    @planned
     def remove_connection(self, public_profile_id: str):
         """Remove a given profile as a connection.
 
@@ -1296,16 +1982,20 @@ class Linkedin(object):
         :return: Error state. True if error occurred
         :rtype: boolean
         """
-        res = self._post(
+        res = yield self._post(
             f"/identity/profiles/{public_profile_id}/profileActions?action=disconnect",
             headers={"accept": "application/vnd.linkedin.normalized+json+2.1"},
         )
+        self._invalidate(
+            f"/identity/profiles/{public_profile_id}/", "/relationships/", "/graphql"
+        )
 
         return res.status_code != 200
 
+    @planned
     def track(self, eventBody, eventInfo):
         payload = {"eventBody": eventBody, "eventInfo": eventInfo}
-        res = self._post(
+        res = yield self._post(
             "/li/track",
             base_request=True,
             headers={
@@ -1317,6 +2007,21 @@ class Linkedin(object):
 
         return res.status_code != 200
 
+    def _get_normalized_data(self, uri: str) -> Plan:
+        """Plan fetching a normalized+json resource and returning its `data` part."""
+        res = yield self._fetch(
+            uri,
+            headers={"accept": "application/vnd.linkedin.normalized+json+2.1"},
+        )
+        if res.status_code != 200:
+            return {}
+
+        data = self._decode(res)
+        if self.entity_store is not None:
+            self.entity_store.add_all(data.get("included", []))
+        return data.get("data", {})
+
+    @planned
     def get_profile_privacy_settings(self, public_profile_id: str):
         """Fetch privacy settings for a given LinkedIn profile.
 
@@ -1326,16 +2031,13 @@ class Linkedin(object):
         :return: Privacy settings data
         :rtype: dict
         """
-        res = self._fetch(
-            f"/identity/profiles/{public_profile_id}/privacySettings",
-            headers={"accept": "application/vnd.linkedin.normalized+json+2.1"},
+        return (
+            yield from self._get_normalized_data(
+                f"/identity/profiles/{public_profile_id}/privacySettings"
+            )
         )
-        if res.status_code != 200:
-            return {}
-
-        data = res.json()
-        return data.get("data", {})
 
+    @planned
     def get_profile_member_badges(self, public_profile_id: str):
         """Fetch badges for a given LinkedIn profile.
 
@@ -1345,16 +2047,13 @@ class Linkedin(object):
         :return: Badges data
         :rtype: dict
         """
-        res = self._fetch(
-            f"/identity/profiles/{public_profile_id}/memberBadges",
-            headers={"accept": "application/vnd.linkedin.normalized+json+2.1"},
+        return (
+            yield from self._get_normalized_data(
+                f"/identity/profiles/{public_profile_id}/memberBadges"
+            )
         )
-        if res.status_code != 200:
-            return {}
-
-        data = res.json()
-        return data.get("data", {})
 
+    @planned
     def get_profile_network_info(self, public_profile_id: str):
         """Fetch network information for a given LinkedIn profile.
 
@@ -1364,16 +2063,13 @@ class Linkedin(object):
         :return: Network data
         :rtype: dict
         """
-        res = self._fetch(
-            f"/identity/profiles/{public_profile_id}/networkinfo",
-            headers={"accept": "application/vnd.linkedin.normalized+json+2.1"},
+        return (
+            yield from self._get_normalized_data(
+                f"/identity/profiles/{public_profile_id}/networkinfo"
+            )
         )
-        if res.status_code != 200:
-            return {}
-
-        data = res.json()
-        return data.get("data", {})
 
+    @planned
     def unfollow_entity(self, urn_id: str):
         """Unfollow a given entity.
 
@@ -1384,11 +2080,12 @@ class Linkedin(object):
         :rtype: boolean
         """
         payload = {"urn": f"urn:li:fs_followingInfo:{urn_id}"}
-        res = self._post(
+        res = yield self._post(
             "/feed/follows?action=unfollowByEntityUrn",
             headers={"accept": "application/vnd.linkedin.normalized+json+2.1"},
             data=json.dumps(payload),
         )
+        self._invalidate(urn_id, "/networkinfo", "/feed/")
 
         err = False
         if res.status_code != 200:
@@ -1396,11 +2093,14 @@ class Linkedin(object):
 
         return err
 
+    @planned
     def _get_list_feed_posts_and_list_feed_urns(
         self, limit=-1, offset=0, exclude_promoted_posts=True
     ):
         """Get a list of URNs from feed sorted by 'Recent' and a list of yet
-        unsorted posts, each one of them containing a dict per post.
+        unsorted posts, each one of them containing a dict per post. Promoted
+        posts are included: `get_list_posts_sorted_without_promoted` sorts
+        the posts and leaves them out.
 
         :param limit: Maximum length of the returned list, defaults to -1 (no limit)
         :type limit: int, optional
@@ -1412,34 +2112,63 @@ class Linkedin(object):
         :return: List of posts and list of URNs
         :rtype: (list, list)
         """
-        _PROMOTED_STRING = "Promoted"
-        _PROFILE_URL = f"{self.client.LINKEDIN_BASE_URL}/in/"
+        posts_by_urn, l_urns = yield from self._get_feed_posts_by_urn(
+            limit, offset, exclude_promoted=False
+        )
+        return list(posts_by_urn.values()), l_urns
 
-        l_posts = []
+    def _get_feed_posts_by_urn(self, limit=-1, offset=0, exclude_promoted=True) -> Plan:
+        """Plan getting the posts of the feed keyed by URN, without the promoted
+        ones unless [exclude_promoted] is False, and the list of URNs sorted by 'Recent'.
+        """
+        posts_by_urn = {}
         l_urns = []
 
+        def add(page_posts: Dict, l_new_urns: List[str], start: int):
+            for urn, post in page_posts.items():
+                posts_by_urn.setdefault(urn, post)
+            l_urns.extend(l_new_urns)
+
+        yield from self._feed_pages(limit, offset, exclude_promoted, add)
+        return posts_by_urn, l_urns
+
+    def _feed_posts_page(
+        self, page_posts: Dict, l_new_urns: List[str], start: int
+    ) -> Optional[Page]:
+        """Return the `Page` of the posts of a feed page sorted by 'Recent', if any."""
+        posts = get_feed_posts_in_order(l_new_urns, page_posts)
+        if posts:
+            return Page(posts, start, start + len(l_new_urns))
+        return None
+
+    def _feed_pages(
+        self,
+        limit: int,
+        offset: int,
+        exclude_promoted: bool,
+        on_page: Callable[[Dict, List[str], int], Optional[Page]],
+    ) -> Plan:
+        """Plan fetching the pages of the feed, calling [on_page] with the posts
+        by URN (see `index_feed_posts`), the URNs and the position of each, and
+        yielding the `Page` it returns, if any."""
         # If count>100 API will return HTTP 400
         count = Linkedin._MAX_UPDATE_COUNT
         if limit == -1:
             limit = Linkedin._MAX_UPDATE_COUNT
 
-        # 'l_urns' equivalent to other functions 'results' variable
-        l_urns = []
+        # 'fetched' equivalent to other functions 'len(results)'
+        fetched = 0
 
         while True:
             # when we're close to the limit, only fetch what we need to
-            if limit > -1 and limit - len(l_urns) < count:
-                count = limit - len(l_urns)
+            if limit > -1 and limit - fetched < count:
+                count = limit - fetched
             params = {
                 "count": str(count),
                 "q": "chronFeed",
-                "start": len(l_urns) + offset,
+                "start": fetched + offset,
             }
-            res = self._fetch(
-                f"/feed/updatesV2",
-                params=params,
-                headers={"accept": "application/vnd.linkedin.normalized+json+2.1"},
-            )
+            headers = {"accept": "application/vnd.linkedin.normalized+json+2.1"}
             """
             Response includes two keya:
             - ['Data']['*elements']. It includes the posts URNs always
@@ -1450,29 +2179,67 @@ class Linkedin(object):
             - ['included']. List with all the posts attributes, but not sorted as
             'Recent' and including promoted posts
             """
-            l_raw_posts = res.json().get("included", {})
-            l_raw_urns = res.json().get("data", {}).get("*elements", [])
-
-            l_new_posts = parse_list_raw_posts(
-                l_raw_posts, self.client.LINKEDIN_BASE_URL
-            )
-            l_posts.extend(l_new_posts)
-
-            l_urns.extend(parse_list_raw_urns(l_raw_urns))
+            if self.stream_included:
+                page = yield self._stream(
+                    "/feed/updatesV2", FEED_NEEDLES, params=params, headers=headers
+                )
+                page_posts = {}
+                while True:
+                    entities = yield page.next_batch()
+                    if entities is None:
+                        break
+                    index_feed_posts(
+                        self._store_included(entities),
+                        self.client.LINKEDIN_BASE_URL,
+                        page_posts,
+                        exclude_promoted=exclude_promoted,
+                    )
+                data = page.data
+            else:
+                res = yield self._fetch(
+                    "/feed/updatesV2", params=params, headers=headers
+                )
+                data = self._decode(res)
+                page_posts = index_feed_posts(
+                    self._store_included(data.get("included", [])),
+                    self.client.LINKEDIN_BASE_URL,
+                    exclude_promoted=exclude_promoted,
+                )
+            if self.compact_results:
+                page_posts = {
+                    urn: FeedPost.from_dict(post) for urn, post in page_posts.items()
+                }
+            l_raw_urns = data.get("data", {}).get("*elements", [])
+            l_new_urns = parse_list_raw_urns(l_raw_urns)
+            page = on_page(page_posts, l_new_urns, params["start"])
+            if page is not None:
+                yield page
+            fetched += len(l_new_urns)
 
             # break the loop if we're done searching
             # NOTE: we could also check for the `total` returned in the response.
             # This is in data["data"]["paging"]["total"]
             if (
-                (limit > -1 and len(l_urns) >= limit)  # if our results exceed set limit
-                or len(l_urns) / count >= Linkedin._MAX_REPEATED_REQUESTS
+                (limit > -1 and fetched >= limit)  # if our results exceed set limit
+                or fetched / count >= Linkedin._MAX_REPEATED_REQUESTS
             ) or len(l_raw_urns) == 0:
-                break
+                return
 
-            self.logger.debug(f"results grew to {len(l_urns)}")
+            self.logger.debug(f"results grew to {fetched}")
 
-        return l_posts, l_urns
+    @planned_pages
+    def iter_feed_posts(
+        self, limit=-1, offset=0, exclude_promoted_posts=True
+    ) -> Iterator[Page]:
+        """Yield the posts of the feed sorted by 'Recent' page by page, as they
+        are fetched. See `get_feed_posts`.
+
+        :return: Pages of posts
+        :rtype: iterator of Page
+        """
+        return (yield from self._feed_pages(limit, offset, True, self._feed_posts_page))
 
+    @planned
     def get_feed_posts(self, limit=-1, offset=0, exclude_promoted_posts=True):
         """Get a list of URNs from feed sorted by 'Recent'
 
@@ -1486,11 +2253,10 @@ class Linkedin(object):
         :return: List of URNs
         :rtype: list
         """
-        l_posts, l_urns = self._get_list_feed_posts_and_list_feed_urns(
-            limit, offset, exclude_promoted_posts
-        )
-        return get_list_posts_sorted_without_promoted(l_urns, l_posts)
+        posts_by_urn, l_urns = yield from self._get_feed_posts_by_urn(limit, offset)
+        return get_feed_posts_in_order(l_urns, posts_by_urn)
 
+    @planned
     def get_job(self, job_id: str) -> Dict:
         """Fetch data about a given job.
         :param job_id: LinkedIn job ID
@@ -1503,9 +2269,9 @@ class Linkedin(object):
             "decorationId": "com.linkedin.voyager.deco.jobs.web.shared.WebLightJobPosting-23",
         }
 
-        res = self._fetch(f"/jobs/jobPostings/{job_id}", params=params)
+        res = yield self._fetch(f"/jobs/jobPostings/{job_id}", params=params)
 
-        data = res.json()
+        data = self._decode(res)
 
         if data and "status" in data and data["status"] != 200:
             self.logger.info("request failed: {}".format(data["message"]))
@@ -1513,6 +2279,7 @@ class Linkedin(object):
 
         return data
 
+    @planned
     def get_job_skills(self, job_id: str) -> Dict:
         """Fetch skills associated with a given job.
         :param job_id: LinkedIn job ID
@@ -1525,11 +2292,11 @@ class Linkedin(object):
             "decorationId": "com.linkedin.voyager.dash.deco.assessments.FullJobSkillMatchInsight-17",
         }
         # https://www.linkedin.com/voyager/api/voyagerAssessmentsDashJobSkillMatchInsight/urn%3Ali%3Afsd_jobSkillMatchInsight%3A3894460323?decorationId=com.linkedin.voyager.dash.deco.assessments.FullJobSkillMatchInsight-17
-        res = self._fetch(
+        res = yield self._fetch(
             f"/voyagerAssessmentsDashJobSkillMatchInsight/urn%3Ali%3Afsd_jobSkillMatchInsight%3A{job_id}",
             params=params,
         )
-        data = res.json()
+        data = self._decode(res)
 
         if data and "status" in data and data["status"] != 200:
             self.logger.info("request failed: {}".format(data.get("message")))
@@ -0,0 +1,60 @@
+"""
+Provides incremental extraction of <meta> tags from an HTML page
+"""
+
+import html
+import re
+from typing import Dict, Iterable
+
+META_CHUNK_SIZE = 16 * 1024
+
+_META = re.compile(rb"<meta\b[^>]*>", re.IGNORECASE)
+_ATTRIBUTE = re.compile(r"""([^\s=/>]+)\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+))""")
+
+
+def parse_attributes(tag: str) -> Dict[str, str]:
+    """Return the attributes of an HTML tag, unescaped, by lowercase name."""
+    return {
+        match.group(1).lower(): html.unescape(
+            next(value for value in match.groups()[1:] if value is not None)
+        )
+        for match in _ATTRIBUTE.finditer(tag)
+    }
+
+
+class MetaTagScanner(object):
+    """
+    Finds the ``content`` of the <meta> tags named `names` in an HTML page fed
+    chunk by chunk, without building a document tree.
+
+    `feed` returns True once every tag was found, so the rest of the page can
+    be left unread.
+
+    :param names: ``name`` attributes of the <meta> tags to find
+    :type names: iterable of str
+    """
+
+    def __init__(self, names: Iterable[str]):
+        self.names = frozenset(names)
+        self.found: Dict[str, str] = {}
+        self._buf = b""
+
+    @property
+    def done(self) -> bool:
+        return len(self.found) == len(self.names)
+
+    def feed(self, chunk: bytes) -> bool:
+        """Scan the next chunk of the page, and return whether every tag was found."""
+        buf = self._buf + chunk
+        end = 0
+        for match in _META.finditer(buf):
+            end = match.end()
+            attributes = parse_attributes(match.group().decode("utf-8", "replace"))
+            name = attributes.get("name")
+            if name in self.names and "content" in attributes:
+                self.found.setdefault(name, attributes["content"])
+        # keep the start of a tag cut by the end of the chunk
+        start = buf.rfind(b"<", end)
+        unterminated = start != -1 and buf.find(b">", start) == -1
+        self._buf = buf[start:] if unterminated else b""
+        return self.done
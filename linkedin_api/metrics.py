@@ -0,0 +1,239 @@
+"""
+Provides per-endpoint request metrics for the Linkedin API clients
+"""
+
+import re
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Tuple
+from urllib.parse import urlsplit
+
+# path segments following these are identifiers
+ID_COLLECTIONS = frozenset(
+    (
+        "profiles",
+        "conversations",
+        "invitations",
+        "jobPostings",
+        "voyagerAssessmentsDashJobSkillMatchInsight",
+    )
+)
+API_PATH_PREFIX = "/voyager/api"
+TIMINGS = ("evade", "network", "decode")
+
+
+def endpoint_template(uri: str) -> str:
+    """
+    Return the endpoint template of a URI or URL, with identifiers replaced by
+    ``{id}`` and the query string dropped, e.g.
+    ``/identity/profiles/{id}/profileView``. GraphQL requests keep the name of
+    their query: ``/graphql?queryId=voyagerSearchDashClusters``.
+    """
+    parts = urlsplit(uri)
+    path = parts.path
+    if path.startswith(API_PATH_PREFIX):
+        path = path[len(API_PATH_PREFIX) :]
+
+    segments = path.split("/")
+    for i in range(1, len(segments)):
+        if segments[i - 1] in ID_COLLECTIONS or "urn:li:" in segments[i]:
+            segments[i] = "{id}"
+    template = "/".join(segments)
+
+    if template == "/graphql":
+        query_id = re.search(r"queryId=([A-Za-z]+)", parts.query)
+        if query_id:
+            template += f"?queryId={query_id.group(1)}"
+    return template
+
+
+class Histogram(object):
+    """
+    Cumulative histogram of durations, Prometheus style.
+
+    :param buckets: Upper bounds of the buckets, in seconds
+    :type buckets: iterable
+    """
+
+    def __init__(self, buckets: Iterable[float]):
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * len(self.buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        self.count += 1
+        self.sum += value
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+
+    def snapshot(self) -> Dict:
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "buckets": dict(zip(self.buckets, self.counts)),
+        }
+
+
+class EndpointMetrics(object):
+    """Counters and timings of one endpoint."""
+
+    def __init__(self, buckets: Iterable[float]):
+        self.requests = 0
+        self.errors = 0
+        self.bytes = 0
+        self.status_codes = defaultdict(int)
+        self.timings = {name: Histogram(buckets) for name in TIMINGS}
+
+    def snapshot(self) -> Dict:
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "bytes": self.bytes,
+            "status_codes": dict(self.status_codes),
+            **{
+                f"{name}_seconds": histogram.snapshot()
+                for name, histogram in self.timings.items()
+            },
+        }
+
+
+class MetricsRegistry(object):
+    """
+    Records, per method and endpoint template (see `endpoint_template`), the
+    number of requests sent, their status codes and bytes received, and
+    separate histograms of the time spent in the evade delay, on the network
+    and decoding JSON.
+
+    :param buckets: Upper bounds of the histogram buckets, in seconds
+    :type buckets: iterable, optional
+    :param clock: Clock used by `timer`. Defaults to `time.perf_counter`
+    :type clock: callable, optional
+    """
+
+    DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+    PROMETHEUS_PREFIX = "linkedin_api"
+
+    def __init__(
+        self,
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        self.buckets = tuple(sorted(buckets))
+        self.clock = clock
+        self._endpoints: Dict[Tuple[str, str], EndpointMetrics] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, method: str, endpoint: str) -> EndpointMetrics:
+        key = (method.upper(), endpoint)
+        metrics = self._endpoints.get(key)
+        if metrics is None:
+            metrics = self._endpoints.setdefault(key, EndpointMetrics(self.buckets))
+        return metrics
+
+    def record_response(
+        self, method: str, endpoint: str, status_code: int, nbytes: int
+    ):
+        """Count a response received from `endpoint`."""
+        with self._lock:
+            metrics = self._get(method, endpoint)
+            metrics.requests += 1
+            metrics.status_codes[status_code] += 1
+            metrics.bytes += nbytes
+
+    def record_error(self, method: str, endpoint: str):
+        """Count a request to `endpoint` that failed without a response."""
+        with self._lock:
+            metrics = self._get(method, endpoint)
+            metrics.requests += 1
+            metrics.errors += 1
+
+    def observe(self, timing: str, method: str, endpoint: str, seconds: float):
+        """Record `seconds` spent in `timing` (one of `TIMINGS`) for `endpoint`."""
+        with self._lock:
+            self._get(method, endpoint).timings[timing].observe(seconds)
+
+    @contextmanager
+    def timer(self, timing: str, method: str, endpoint: str):
+        """Context manager recording the time spent in its block."""
+        start = self.clock()
+        try:
+            yield
+        finally:
+            self.observe(timing, method, endpoint, self.clock() - start)
+
+    def reset(self):
+        """Forget everything recorded so far."""
+        with self._lock:
+            self._endpoints.clear()
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """
+        Return the metrics recorded so far as plain data, keyed on
+        ``"<METHOD> <endpoint>"``.
+        """
+        with self._lock:
+            return {
+                f"{method} {endpoint}": metrics.snapshot()
+                for (method, endpoint), metrics in sorted(self._endpoints.items())
+            }
+
+    def to_prometheus(self) -> str:
+        """Return the metrics recorded so far in the Prometheus text format."""
+        prefix = self.PROMETHEUS_PREFIX
+        requests_lines = []
+        errors_lines = []
+        bytes_lines = []
+        timing_lines = {name: [] for name in TIMINGS}
+
+        with self._lock:
+            for (method, endpoint), metrics in sorted(self._endpoints.items()):
+                labels = f'method="{method}",endpoint="{_escape(endpoint)}"'
+                for status, count in sorted(metrics.status_codes.items()):
+                    requests_lines.append(
+                        f'{prefix}_requests_total{{{labels},status="{status}"}} {count}'
+                    )
+                errors_lines.append(
+                    f"{prefix}_errors_total{{{labels}}} {metrics.errors}"
+                )
+                bytes_lines.append(
+                    f"{prefix}_response_bytes_total{{{labels}}} {metrics.bytes}"
+                )
+                for name, histogram in metrics.timings.items():
+                    timing_lines[name].extend(
+                        _histogram_lines(f"{prefix}_{name}_seconds", labels, histogram)
+                    )
+
+        lines = [
+            f"# HELP {prefix}_requests_total Responses received, by status code.",
+            f"# TYPE {prefix}_requests_total counter",
+            *requests_lines,
+            f"# HELP {prefix}_errors_total Requests that failed without a response.",
+            f"# TYPE {prefix}_errors_total counter",
+            *errors_lines,
+            f"# HELP {prefix}_response_bytes_total Bytes of response bodies received.",
+            f"# TYPE {prefix}_response_bytes_total counter",
+            *bytes_lines,
+        ]
+        for name in TIMINGS:
+            lines += [
+                f"# HELP {prefix}_{name}_seconds Time spent in {name}.",
+                f"# TYPE {prefix}_{name}_seconds histogram",
+                *timing_lines[name],
+            ]
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _histogram_lines(name: str, labels: str, histogram: Histogram):
+    for bound, count in zip(histogram.buckets, histogram.counts):
+        yield f'{name}_bucket{{{labels},le="{bound}"}} {count}'
+    yield f'{name}_bucket{{{labels},le="+Inf"}} {histogram.count}'
+    yield f"{name}_sum{{{labels}}} {histogram.sum}"
+    yield f"{name}_count{{{labels}}} {histogram.count}"
@@ -0,0 +1,296 @@
+"""
+Provides compact models of search, job search and feed results, and lazy profiles
+"""
+
+import json
+import sys
+from collections.abc import Mapping
+from operator import itemgetter
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+from linkedin_api.utils.helpers import get_id_from_urn
+
+
+class CompactResult(Mapping):
+    """
+    A result held in ``__slots__`` instead of a dict, read like the dict it
+    replaces: ``result["name"]``, ``result.get("name")``, ``dict(result)``
+    and comparisons with dicts work as before. Results are read-only, and
+    `to_dict` returns a plain dict, e.g. for `json.dumps`.
+
+    The fields of ``_INTERNED`` are interned: their values repeat across
+    results (locations, distances, authors...) and are then stored once.
+    """
+
+    __slots__ = ()
+    # keys of the dict, each stored in the slot of the same name
+    _KEYS: Tuple[str, ...] = ()
+    _INTERNED = frozenset()
+
+    @classmethod
+    def from_dict(cls, d: Dict) -> "CompactResult":
+        """Return the compact result of the dict `d`, as built by the parsers."""
+        result = cls.__new__(cls)
+        for key in cls._KEYS:
+            if key in d:
+                value = d[key]
+                if key in cls._INTERNED and type(value) is str:
+                    value = sys.intern(value)
+                setattr(result, key, value)
+        return result
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._KEYS:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                pass
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return (key for key in self._KEYS if hasattr(self, key))
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def to_dict(self) -> Dict:
+        return dict(self.items())
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+
+class PersonResult(CompactResult):
+    """A result of `Linkedin.search_people`."""
+
+    __slots__ = _KEYS = ("urn_id", "distance", "jobtitle", "location", "name")
+    _INTERNED = frozenset(("distance", "jobtitle", "location"))
+
+
+class CompanyResult(CompactResult):
+    """A result of `Linkedin.search_companies`."""
+
+    __slots__ = _KEYS = ("urn_id", "name", "headline", "subline")
+    _INTERNED = frozenset(("headline", "subline"))
+
+
+class FeedPost(CompactResult):
+    """A post of `Linkedin.get_feed_posts`."""
+
+    __slots__ = _KEYS = ("author_name", "author_profile", "old", "content", "url")
+    _INTERNED = frozenset(("author_name", "author_profile", "old"))
+
+
+class JobCard(CompactResult):
+    """
+    A job posting of `Linkedin.search_jobs`.
+
+    Only ``$type``, ``entityUrn`` and ``title`` are kept as objects, the
+    ``$type`` interned and the URN stored as its id. The other fields of
+    the posting are kept as compact JSON, decoded when they are read.
+    """
+
+    __slots__ = ("_type", "_urn_id", "title", "_source")
+    URN_PREFIX = "urn:li:fsd_jobPosting:"
+
+    @classmethod
+    def from_dict(cls, d: Dict) -> "JobCard":
+        result = cls.__new__(cls)
+        rest = dict(d)
+        if "$type" in rest:
+            type_ = rest.pop("$type")
+            result._type = sys.intern(type_) if type(type_) is str else type_
+        if "entityUrn" in rest:
+            urn = rest.pop("entityUrn")
+            # any other value is kept whole, in a tuple
+            result._urn_id = (
+                urn[len(cls.URN_PREFIX) :]
+                if isinstance(urn, str) and urn.startswith(cls.URN_PREFIX)
+                else (urn,)
+            )
+        if "title" in rest:
+            result.title = rest.pop("title")
+        result._source = (
+            json.dumps(rest, separators=(",", ":")).encode() if rest else None
+        )
+        return result
+
+    def _rest(self) -> Dict:
+        return json.loads(self._source) if self._source is not None else {}
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            if key == "$type":
+                return self._type
+            if key == "entityUrn":
+                urn_id = self._urn_id
+                if isinstance(urn_id, tuple):
+                    return urn_id[0]
+                return self.URN_PREFIX + urn_id
+            if key == "title":
+                return self.title
+        except AttributeError:
+            raise KeyError(key) from None
+        return self._rest()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        for key, slot in (("$type", "_type"), ("entityUrn", "_urn_id")):
+            if hasattr(self, slot):
+                yield key
+        if hasattr(self, "title"):
+            yield "title"
+        yield from self._rest()
+
+    def to_dict(self) -> Dict:
+        d = {key: self[key] for key in ("$type", "entityUrn", "title") if key in self}
+        d.update(self._rest())
+        return d
+
+
+def _massage_profile(profile: Dict) -> Dict:
+    """Massage the [profile] of a profileView response, in place."""
+    if "miniProfile" in profile:
+        if "picture" in profile["miniProfile"]:
+            profile["displayPictureUrl"] = profile["miniProfile"]["picture"][
+                "com.linkedin.common.VectorImage"
+            ]["rootUrl"]
+
+            images_data = profile["miniProfile"]["picture"][
+                "com.linkedin.common.VectorImage"
+            ]["artifacts"]
+            for img in images_data:
+                w, h, url_segment = itemgetter(
+                    "width", "height", "fileIdentifyingUrlPathSegment"
+                )(img)
+                profile[f"img_{w}_{h}"] = url_segment
+
+        profile["profile_id"] = get_id_from_urn(profile["miniProfile"]["entityUrn"])
+        profile["profile_urn"] = profile["miniProfile"]["entityUrn"]
+        profile["member_urn"] = profile["miniProfile"]["objectUrn"]
+        profile["public_id"] = profile["miniProfile"]["publicIdentifier"]
+
+        del profile["miniProfile"]
+
+    del profile["defaultLocale"]
+    del profile["supportedLocales"]
+    del profile["versionTag"]
+    del profile["showEducationOnProfileTopCard"]
+    return profile
+
+
+def _massage_experience(experience: List[Dict]):
+    for item in experience:
+        if "company" in item and "miniCompany" in item["company"]:
+            if "logo" in item["company"]["miniCompany"]:
+                logo = item["company"]["miniCompany"]["logo"].get(
+                    "com.linkedin.common.VectorImage"
+                )
+                if logo:
+                    item["companyLogoUrl"] = logo["rootUrl"]
+            del item["company"]["miniCompany"]
+
+
+def _massage_education(education: List[Dict]):
+    for item in education:
+        if "school" in item:
+            if "logo" in item["school"]:
+                item["school"]["logoUrl"] = item["school"]["logo"][
+                    "com.linkedin.common.VectorImage"
+                ]["rootUrl"]
+                del item["school"]["logo"]
+
+
+def _massage_publications(publications: List[Dict]):
+    for item in publications:
+        del item["entityUrn"]
+        for author in item.get("authors", []):
+            del author["entityUrn"]
+
+
+def _drop_entity_urns(elements: List[Dict]):
+    for item in elements:
+        del item["entityUrn"]
+
+
+# section of the profile: view of the profileView response holding it, and its massage
+PROFILE_SECTIONS: Dict[str, Tuple[str, Callable[[List[Dict]], None]]] = {
+    "experience": ("positionView", _massage_experience),
+    "education": ("educationView", _massage_education),
+    "languages": ("languageView", _drop_entity_urns),
+    "publications": ("publicationView", _massage_publications),
+    "certifications": ("certificationView", _drop_entity_urns),
+    "volunteer": ("volunteerExperienceView", _drop_entity_urns),
+    "honors": ("honorView", _drop_entity_urns),
+    "projects": ("projectView", _drop_entity_urns),
+    "skills": ("skillView", _drop_entity_urns),
+}
+
+
+def massage_profile(data: Dict) -> Dict:
+    """
+    Massage a profileView response in place, and return its profile with
+    every section. See `Linkedin.get_profile`.
+    """
+    profile = _massage_profile(data["profile"])
+    for name, (view, massage) in PROFILE_SECTIONS.items():
+        elements = data[view]["elements"]
+        massage(elements)
+        profile[name] = elements
+    profile["urn_id"] = profile["entityUrn"].replace("urn:li:fs_profile:", "")
+    return profile
+
+
+class LazyProfile(Mapping):
+    """
+    A profile of `Linkedin.get_profile`, read like the dict it returns, that
+    massages each section of the profileView response the first time it is
+    read. Reading the top card, e.g. ``profile["profile_urn"]``, leaves the
+    sections untouched. `to_dict` returns the dict of `massage_profile`.
+
+    :param data: Decoded profileView response, massaged in place
+    :type data: dict
+    """
+
+    __slots__ = ("_data", "_profile", "_sections")
+
+    def __init__(self, data: Dict):
+        self._data = data
+        self._profile = _massage_profile(data["profile"])
+        self._sections: Dict[str, List[Dict]] = {}
+
+    def section(self, name: str) -> List[Dict]:
+        """Return the section `name` of the profile, massaged on first read."""
+        try:
+            return self._sections[name]
+        except KeyError:
+            pass
+        view, massage = PROFILE_SECTIONS[name]
+        elements = self._data[view]["elements"]
+        massage(elements)
+        self._sections[name] = elements
+        return elements
+
+    def __getitem__(self, key: str) -> Any:
+        if key in PROFILE_SECTIONS:
+            return self.section(key)
+        if key == "urn_id":
+            return self._profile["entityUrn"].replace("urn:li:fs_profile:", "")
+        return self._profile[key]
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._profile
+        yield from PROFILE_SECTIONS
+        yield "urn_id"
+
+    def __len__(self) -> int:
+        return len(self._profile) + len(PROFILE_SECTIONS) + 1
+
+    def to_dict(self) -> Dict:
+        profile = dict(self._profile)
+        for name in PROFILE_SECTIONS:
+            profile[name] = self.section(name)
+        profile["urn_id"] = self["urn_id"]
+        return profile
+
+    def __repr__(self):
+        return f"LazyProfile({self._profile.get('public_id')!r})"
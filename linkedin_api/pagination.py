@@ -0,0 +1,189 @@
+"""
+Provides the pages yielded by the paginated `iter_*` methods, and their prefetching
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+
+class Page(object):
+    """
+    One page of results of a paginated request, as yielded by the `iter_*`
+    methods of `Linkedin`. Iterating a page iterates its results.
+
+    `next_start`, and `pagination_token` for the endpoints using one, are the
+    position of the next page: passing them back (as ``offset``, or ``start``
+    and ``pagination_token``) resumes the pagination after this page.
+
+    :param elements: Results of the page
+    :type elements: list
+    :param start: Position of the first result of the page
+    :type start: int
+    :param next_start: Position of the next page
+    :type next_start: int
+    :param pagination_token: Token of the next page, for the endpoints using one
+    :type pagination_token: str, optional
+    :param failed: Linkedin answered an error instead of the page, which ends the pagination
+    :type failed: bool, optional
+    """
+
+    def __init__(
+        self,
+        elements: List[Any],
+        start: int,
+        next_start: int,
+        pagination_token: Optional[str] = None,
+        failed=False,
+    ):
+        self.elements = elements
+        self.start = start
+        self.next_start = next_start
+        self.pagination_token = pagination_token
+        self.failed = failed
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.elements)
+
+    def __len__(self) -> int:
+        return len(self.elements)
+
+    def __repr__(self):
+        return (
+            f"Page({len(self.elements)} elements, start={self.start}, "
+            f"next_start={self.next_start}, failed={self.failed})"
+        )
+
+
+def next_pages(
+    start: int,
+    count: int,
+    depth: int,
+    end: Optional[int] = None,
+    step: Optional[int] = None,
+) -> List[Tuple[int, int]]:
+    """
+    Return the ``(start, count)`` of the `depth` pages following the page of
+    `count` results from `start`, assuming every page is full, and stopping
+    at the position `end`.
+
+    For endpoints choosing their own page size, `step` is the number of
+    results of the page from `start`, once received: the next pages are
+    guessed to start `step` results apart.
+    """
+    if step is None:
+        step = count
+    pages = []
+    for k in range(1, depth + 1):
+        next_start = start + k * step
+        if end is not None and next_start >= end:
+            break
+        pages.append(
+            (next_start, count if end is None else min(count, end - next_start))
+        )
+    return pages
+
+
+class PagePrefetcher(object):
+    """
+    Fetches the next pages of an offset pagination in background threads,
+    while the current page is consumed.
+
+    The position of a page depends on the results of the previous ones, so
+    the next pages are guessed (see `next_pages`): a page fetched for a
+    wrong guess is thrown away. With a `depth` of 0, pages are fetched when
+    they are asked for, in the calling thread.
+
+    :param fetch: Returns the page of `count` results from `start`, parsed
+    :type fetch: callable
+    :param depth: Number of pages fetched ahead
+    :type depth: int
+    """
+
+    def __init__(self, fetch: Callable[[int, int], Any], depth: int):
+        self._fetch = fetch
+        self.depth = depth
+        self._executor = ThreadPoolExecutor(max_workers=depth + 1) if depth else None
+        self._pending: Dict[Tuple[int, int], Future] = {}
+
+    def get(
+        self, start: int, count: int, ahead: Optional[List[Tuple[int, int]]] = None
+    ):
+        """
+        Return the page of `count` results from `start`, and start fetching
+        the pages `ahead` of it, if given (see `prefetch`).
+        """
+        if not self.depth:
+            return self._fetch(start, count)
+        future = self._pending.pop((start, count), None)
+        if future is None:
+            future = self._executor.submit(self._fetch, start, count)
+        if ahead is not None:
+            self.prefetch(ahead)
+        return future.result()
+
+    def prefetch(self, ahead: List[Tuple[int, int]]):
+        """
+        Start fetching the ``(start, count)`` pages `ahead`, and cancel the
+        pending pages not among them.
+        """
+        if not self.depth:
+            return
+        for key in list(self._pending):
+            if key not in ahead:
+                self._pending.pop(key).cancel()
+        for key in ahead:
+            if key not in self._pending:
+                self._pending[key] = self._executor.submit(self._fetch, *key)
+
+    def close(self):
+        for future in self._pending.values():
+            future.cancel()
+        self._pending.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class AsyncPagePrefetcher(PagePrefetcher):
+    """Async counterpart of `PagePrefetcher`, fetching pages in tasks."""
+
+    def __init__(self, fetch, depth: int):
+        self._fetch = fetch
+        self.depth = depth
+        self._pending = {}
+
+    async def get(
+        self, start: int, count: int, ahead: Optional[List[Tuple[int, int]]] = None
+    ):
+        import asyncio
+
+        if not self.depth:
+            return await self._fetch(start, count)
+        task = self._pending.pop((start, count), None)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(start, count))
+        if ahead is not None:
+            self.prefetch(ahead)
+        return await task
+
+    def prefetch(self, ahead: List[Tuple[int, int]]):
+        import asyncio
+
+        if not self.depth:
+            return
+        for key in list(self._pending):
+            if key not in ahead:
+                self._pending.pop(key).cancel()
+        for key in ahead:
+            if key not in self._pending:
+                self._pending[key] = asyncio.ensure_future(self._fetch(*key))
+
+    def close(self):
+        for task in self._pending.values():
+            task.cancel()
+        self._pending.clear()
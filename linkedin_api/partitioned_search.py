@@ -0,0 +1,140 @@
+"""
+Provides the planning of searches partitioned along their filter facets
+"""
+
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Tuple
+
+# facets of `Linkedin.search_people` a search can be partitioned along
+PARTITION_FACETS = (
+    "network_depths",
+    "regions",
+    "industries",
+    "past_companies",
+    "schools",
+)
+
+
+class SearchPartition(NamedTuple):
+    """
+    One sub-query of a partitioned search: the ``(facet, value)`` pairs it
+    is restricted to, one per facet it was split along.
+    """
+
+    facets: Tuple[Tuple[str, str], ...] = ()
+
+    def refine(self, partition_by: Dict[str, List[str]]) -> List["SearchPartition"]:
+        """
+        Return the sub-queries splitting this one along the next facet of
+        `partition_by`, one per value, or none if it is split along every
+        facet already.
+        """
+        if len(self.facets) >= len(partition_by):
+            return []
+        facet = list(partition_by)[len(self.facets)]
+        return [
+            SearchPartition(self.facets + ((facet, value),))
+            for value in partition_by[facet]
+        ]
+
+    def filters(self) -> Dict[str, List[str]]:
+        """Return the filters of the sub-query, as keyword arguments of the search."""
+        return {facet: [value] for facet, value in self.facets}
+
+
+class PartitionResult(NamedTuple):
+    """
+    Outcome of one sub-query of a partitioned search.
+
+    :param partition: Sub-query searched
+    :param results: Results it returned
+    :param capped: Whether it returned as many results as a query can, and may be truncated
+    """
+
+    partition: SearchPartition
+    results: List
+    capped: bool
+
+
+def check_partition_by(
+    partition_by: Dict[str, Iterable[str]], filters: Dict
+) -> Dict[str, List[str]]:
+    """
+    Return `partition_by` with lists of values, raising ValueError for a
+    facet that can't partition a search with `filters`.
+    """
+    checked = {}
+    for facet, values in partition_by.items():
+        if facet not in PARTITION_FACETS:
+            raise ValueError(
+                f"facet must be one of {', '.join(PARTITION_FACETS)}, not {facet!r}"
+            )
+        if filters.get(facet) or (
+            facet == "network_depths" and filters.get("network_depth")
+        ):
+            raise ValueError(f"the search is already filtered by {facet!r}")
+        checked[facet] = list(values)
+    return checked
+
+
+def iter_partitions(
+    search: Callable[[SearchPartition], Tuple[List, bool]],
+    partition_by: Dict[str, List[str]],
+    max_concurrency: int = 4,
+) -> Iterator[PartitionResult]:
+    """
+    Search the whole query, then refine every sub-query hitting the result
+    cap along the next facet of `partition_by`, yielding results as they
+    complete.
+
+    `search(partition)` returns the results of a sub-query and whether it
+    was capped. Up to `max_concurrency` sub-queries run at once, on a
+    thread pool.
+    """
+    queue = deque([SearchPartition()])
+    executor = ThreadPoolExecutor(max_workers=max_concurrency)
+    pending = {}
+    try:
+        while queue or pending:
+            while queue and len(pending) < max_concurrency:
+                partition = queue.popleft()
+                pending[executor.submit(search, partition)] = partition
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                partition = pending.pop(future)
+                results, capped = future.result()
+                if capped:
+                    queue.extend(partition.refine(partition_by))
+                yield PartitionResult(partition, results, capped)
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+async def aiter_partitions(
+    search: Callable, partition_by: Dict[str, List[str]], max_concurrency: int = 4
+):
+    """
+    Async counterpart of `iter_partitions`, for a coroutine function `search`.
+    """
+    import asyncio
+
+    queue = deque([SearchPartition()])
+    pending = {}
+    try:
+        while queue or pending:
+            while queue and len(pending) < max_concurrency:
+                partition = queue.popleft()
+                pending[asyncio.ensure_future(search(partition))] = partition
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                partition = pending.pop(task)
+                results, capped = task.result()
+                if capped:
+                    queue.extend(partition.refine(partition_by))
+                yield PartitionResult(partition, results, capped)
+    finally:
+        for task in pending:
+            task.cancel()
@@ -0,0 +1,127 @@
+"""
+Provides the methods written once for both `Linkedin` and `AsyncLinkedin`
+"""
+
+import functools
+import inspect
+from contextlib import closing
+from typing import Any, Callable, Generator, Iterator
+
+from linkedin_api.pagination import Page
+
+# A generator yielding the I/O calls of a method, and getting their results back
+Plan = Generator[Any, Any, Any]
+
+
+def planned(method: Callable[..., Plan]):
+    """
+    Turn a plan, a generator method building requests and parsing their
+    responses, into a method of both clients.
+
+    The plan yields each I/O call it makes and is sent back its result, as
+    in ``res = yield self._fetch(uri)``. `Linkedin` runs it with `run_plan`:
+    its calls are done by the time they are yielded. `AsyncLinkedin` runs it
+    with `arun_plan`, which awaits them, so the method returns a coroutine.
+    """
+
+    @functools.wraps(method)
+    def run(self, *args, **kwargs):
+        return self._run(method(self, *args, **kwargs))
+
+    return run
+
+
+def planned_pages(method: Callable[..., Plan]):
+    """
+    Like `planned`, for a paginated plan, which also yields its `Page`
+    objects: the method returns an iterator of them, with `iter_plan`, or
+    an async iterator, with `aiter_plan`.
+    """
+
+    @functools.wraps(method)
+    def iterate(self, *args, **kwargs):
+        return self._iterate(method(self, *args, **kwargs))
+
+    return iterate
+
+
+def run_plan(plan: Plan):
+    """Run `plan`, whose yielded values are the results of its calls."""
+    result = None
+    while True:
+        try:
+            result = plan.send(result)
+        except StopIteration as stop:
+            return stop.value
+
+
+def iter_plan(plan: Plan) -> Iterator[Page]:
+    """Run the paginated `plan`, yielding its pages."""
+    result = None
+    with closing(plan):
+        while True:
+            try:
+                result = plan.send(result)
+            except StopIteration:
+                return
+            if isinstance(result, Page):
+                yield result
+                result = None
+
+
+def consume(items: Iterator, on_item: Callable[[Any], Any]):
+    """Call `on_item` with each item of `items`, e.g. the pages of `iter_plan`."""
+    with closing(items):
+        for item in items:
+            on_item(item)
+
+
+async def _settle(plan: Plan, call):
+    """
+    Await `call`, returning the method of `plan` to resume it with and the
+    outcome: the result of the call, or the exception it raised.
+    """
+    if not inspect.isawaitable(call):
+        return plan.send, call
+    try:
+        return plan.send, await call
+    except BaseException as e:
+        return plan.throw, e
+
+
+async def arun_plan(plan: Plan):
+    """Async counterpart of `run_plan`, awaiting the calls `plan` yields."""
+    resume, outcome = plan.send, None
+    while True:
+        try:
+            call = resume(outcome)
+        except StopIteration as stop:
+            return stop.value
+        resume, outcome = await _settle(plan, call)
+
+
+async def aiter_plan(plan: Plan):
+    """Async counterpart of `iter_plan`."""
+    resume, outcome = plan.send, None
+    try:
+        while True:
+            try:
+                call = resume(outcome)
+            except StopIteration:
+                return
+            if isinstance(call, Page):
+                yield call
+                resume, outcome = plan.send, None
+            else:
+                resume, outcome = await _settle(plan, call)
+    finally:
+        plan.close()
+
+
+async def aconsume(items, on_item: Callable[[Any], Any]):
+    """Async counterpart of `consume`, for an async generator `items`."""
+    try:
+        async for item in items:
+            on_item(item)
+    finally:
+        await items.aclose()
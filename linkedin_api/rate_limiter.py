@@ -0,0 +1,133 @@
+"""
+Provides request pacing for the Linkedin API
+"""
+
+import random
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+from linkedin_api.utils.helpers import async_sleep
+
+
+class TokenBucket(object):
+    """
+    Token bucket allowing bursts of `burst` requests and a sustained `rate`.
+
+    :param rate: Sustained number of requests per second
+    :type rate: float
+    :param burst: Maximum number of requests that may go through back to back
+    :type burst: int
+    :param jitter: Maximum random seconds added to a wait, to avoid a regular pattern
+    :type jitter: float, optional
+    :param clock: Monotonic clock returning seconds. Defaults to `time.monotonic`
+    :type clock: callable, optional
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        jitter: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.rate = rate
+        self.burst = burst
+        self.jitter = jitter
+        self._clock = clock
+        self._tokens = float(burst)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = self._clock()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    @property
+    def tokens(self) -> float:
+        """Number of requests that can currently go through without waiting."""
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+    def reserve(self, tokens: int = 1) -> float:
+        """Take `tokens` from the bucket.
+
+        :return: Seconds to wait before the reserved request may be sent
+        :rtype: float
+        """
+        with self._lock:
+            self._refill()
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate + random.uniform(0, self.jitter)
+
+
+class RateLimiter(object):
+    """
+    Paces requests with one token bucket per endpoint family (see
+    `linkedin_api.utils.helpers.get_endpoint_family`). Requests go straight
+    through while a family has budget left and only wait once its bucket is empty.
+
+    :param limits: Per-family overrides of `DEFAULT_LIMITS`, e.g. ``{"search": {"rate": 0.1, "burst": 2}}``
+    :type limits: dict, optional
+    :param clock: Monotonic clock returning seconds. Defaults to `time.monotonic`
+    :type clock: callable, optional
+    :param sleep: Blocking sleep used by `acquire`. Defaults to `time.sleep`
+    :type sleep: callable, optional
+    :param async_sleep: Coroutine sleep used by `acquire_async`. Defaults to `asyncio.sleep`
+    :type async_sleep: callable, optional
+    """
+
+    DEFAULT_LIMITS = {
+        "default": {"rate": 0.5, "burst": 10, "jitter": 1.0},
+        "search": {"rate": 0.25, "burst": 5, "jitter": 2.0},
+        "profile": {"rate": 0.5, "burst": 10, "jitter": 1.0},
+        "messaging": {"rate": 0.2, "burst": 3, "jitter": 2.0},
+        "write": {"rate": 0.1, "burst": 2, "jitter": 3.0},
+    }
+
+    def __init__(
+        self,
+        limits: Optional[Dict[str, Dict]] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+        async_sleep=async_sleep,
+    ):
+        self._sleep = sleep
+        self._async_sleep = async_sleep
+        self._buckets = {}
+        for family, default_limit in RateLimiter.DEFAULT_LIMITS.items():
+            limit = {**default_limit, **(limits or {}).get(family, {})}
+            self._buckets[family] = TokenBucket(clock=clock, **limit)
+        for family, limit in (limits or {}).items():
+            if family not in self._buckets:
+                self._buckets[family] = TokenBucket(clock=clock, **limit)
+
+    def bucket(self, family: str) -> TokenBucket:
+        """Return the bucket of `family`, falling back to the "default" one."""
+        return self._buckets.get(family, self._buckets["default"])
+
+    def remaining(self, family: str = "default") -> float:
+        """Return the number of requests `family` can send without waiting."""
+        return self.bucket(family).tokens
+
+    def acquire(self, family: str = "default") -> float:
+        """Block until a request of `family` may be sent.
+
+        :return: Seconds waited
+        :rtype: float
+        """
+        delay = self.bucket(family).reserve()
+        if delay > 0:
+            self._sleep(delay)
+        return delay
+
+    async def acquire_async(self, family: str = "default") -> float:
+        """Awaitable counterpart of `acquire`."""
+        delay = self.bucket(family).reserve()
+        if delay > 0:
+            await self._async_sleep(delay)
+        return delay
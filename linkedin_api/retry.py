@@ -0,0 +1,105 @@
+"""
+Provides retry and backoff of failed Linkedin API requests
+"""
+
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, Iterable, Optional
+
+from linkedin_api.utils.helpers import async_sleep, get_endpoint_family
+
+
+def get_retry_after(headers) -> Optional[float]:
+    """Return the delay requested by a `Retry-After` header, in seconds.
+
+    Both the delay-seconds and the HTTP-date forms are supported.
+    """
+    value = headers.get("Retry-After") if headers else None
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryPolicy(object):
+    """
+    Retry policy with exponential backoff, jitter and `Retry-After` support.
+
+    Only idempotent requests are retried: every GET, plus the POST endpoints
+    listed in `idempotent_posts`. Writes such as `send_message` are never replayed.
+
+    :param max_retries: Retries allowed per request
+    :type max_retries: int, optional
+    :param budgets: Per endpoint family overrides of `max_retries`, e.g. ``{"search": 5}``
+    :type budgets: dict, optional
+    :param backoff_base: Delay before the first retry, doubled on every attempt
+    :type backoff_base: float, optional
+    :param backoff_max: Upper bound of a single delay, `Retry-After` included
+    :type backoff_max: float, optional
+    :param jitter: Fraction of the delay that is randomized, between 0 and 1
+    :type jitter: float, optional
+    :param retry_statuses: HTTP status codes worth retrying
+    :type retry_statuses: iterable, optional
+    :param idempotent_posts: URI prefixes of POST endpoints that are safe to replay
+    :type idempotent_posts: iterable, optional
+    :param sleep: Blocking sleep. Defaults to `time.sleep`
+    :type sleep: callable, optional
+    :param async_sleep: Coroutine sleep. Defaults to `asyncio.sleep`
+    :type async_sleep: callable, optional
+    """
+
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+    def __init__(
+        self,
+        max_retries=3,
+        budgets: Optional[Dict[str, int]] = None,
+        backoff_base=1.0,
+        backoff_max=60.0,
+        jitter=0.5,
+        retry_statuses: Iterable[int] = RETRY_STATUSES,
+        idempotent_posts: Iterable[str] = (),
+        sleep: Callable[[float], None] = time.sleep,
+        async_sleep=async_sleep,
+    ):
+        self.max_retries = max_retries
+        self.budgets = budgets or {}
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+        self.idempotent_posts = tuple(idempotent_posts)
+        self.sleep = sleep
+        self.async_sleep = async_sleep
+
+    def is_idempotent(self, method: str, uri: str) -> bool:
+        """Return True if a request may be sent again without side effects."""
+        if method.upper() in ("GET", "HEAD", "OPTIONS"):
+            return True
+        return bool(self.idempotent_posts) and uri.startswith(self.idempotent_posts)
+
+    def retries_for(self, method: str, uri: str) -> int:
+        """Return how many times a request may be retried."""
+        if not self.is_idempotent(method, uri):
+            return 0
+        return self.budgets.get(get_endpoint_family(method, uri), self.max_retries)
+
+    def should_retry(self, res) -> bool:
+        """Return True if a response is a transient failure."""
+        return res.status_code in self.retry_statuses
+
+    def backoff(self, attempt: int, res=None) -> float:
+        """Return the delay before retry number `attempt` (starting at 0)."""
+        retry_after = get_retry_after(res.headers) if res is not None else None
+        if retry_after is not None:
+            return min(retry_after, self.backoff_max)
+
+        delay = min(self.backoff_base * 2**attempt, self.backoff_max)
+        return delay * (1 - self.jitter * random.random())
@@ -0,0 +1,92 @@
+"""
+Provides coalescing of identical in-flight Linkedin API requests
+"""
+
+import copy
+import threading
+from typing import TYPE_CHECKING, Awaitable, Callable, Dict
+
+if TYPE_CHECKING:
+    import asyncio
+
+
+class _Call(object):
+    """A call in flight and, once done, its outcome."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight(object):
+    """
+    Runs at most one call per key at a time. Threads asking for a key that is
+    already in flight wait for that call and get a copy of its result (or its
+    exception) instead of running their own.
+
+    Nothing is kept once a call completes: the next caller runs a new one.
+
+    :param clone: Returns the copy handed to waiting callers. Defaults to `copy.copy`
+    :type clone: callable, optional
+    """
+
+    def __init__(self, clone: Callable = copy.copy):
+        self._clone = clone
+        self._calls: Dict[str, _Call] = {}
+        self._lock = threading.Lock()
+        self.coalesced = 0
+
+    def do(self, key: str, fn: Callable):
+        """Return `fn()`, or the result of the identical call already in flight."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return self._clone(call.result)
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+
+class AsyncSingleFlight(object):
+    """
+    Async counterpart of `SingleFlight`, for coroutine functions.
+
+    The shared call runs as its own task, so cancelling one of the callers
+    does not cancel it for the others.
+    """
+
+    def __init__(self, clone: Callable = copy.copy):
+        self._clone = clone
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self.coalesced = 0
+
+    async def do(self, key: str, fn: Callable[[], Awaitable]):
+        """Return `await fn()`, or the result of the identical call already in flight."""
+        import asyncio
+
+        task = self._tasks.get(key)
+        if task is not None:
+            self.coalesced += 1
+            return self._clone(await asyncio.shield(task))
+
+        task = self._tasks[key] = asyncio.ensure_future(fn())
+        task.add_done_callback(lambda _: self._tasks.pop(key, None))
+        return await asyncio.shield(task)
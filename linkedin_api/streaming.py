@@ -0,0 +1,272 @@
+"""
+Provides incremental parsing of normalized Linkedin API responses
+"""
+
+import re
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+)
+
+from linkedin_api.decoder import default_json_decoder
+
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# entities a feed page needs: anything else yields no post field
+FEED_NEEDLES = (b'"actor"', b'"commentary"', b'"updateMetadata"')
+JOB_POSTING_NEEDLES = (b'"com.linkedin.voyager.dash.jobs.JobPosting"',)
+
+_STRUCTURE = re.compile(rb'[{}\[\]"]')
+_STRING = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"')
+# everything up to the next bracket, or the next incomplete string
+_SKIP = re.compile(rb'(?:[^{}\[\]"]+|"[^"\\]*(?:\\.[^"\\]*)*")*')
+_SPACE = re.compile(rb"[ \t\n\r]*")
+_SEPARATOR = re.compile(rb"[ \t\n\r,]*")
+_SCALAR = re.compile(rb"[^ \t\n\r,\]]+")
+
+
+class IncludedParser(object):
+    """
+    Incremental parser of a normalized Voyager response, fed its body chunk by
+    chunk.
+
+    The entities of the top-level `key` array are decoded one at a time, as
+    soon as they are complete, and entities containing none of `needles` are
+    skipped without being decoded. The rest of the response is kept, and
+    decoded by `close`. Memory use is bounded by the largest entity instead of
+    the whole body.
+
+    :param key: Top-level array to stream. Defaults to ``"included"``
+    :type key: str, optional
+    :param needles: Byte strings one of which an entity must contain to be decoded. Defaults to decoding every entity
+    :type needles: tuple, optional
+    :param decoder: Turns raw JSON into Python objects. Defaults to `default_json_decoder()`
+    :type decoder: callable, optional
+    """
+
+    def __init__(
+        self,
+        key="included",
+        needles: Optional[Iterable[bytes]] = None,
+        decoder: Optional[Callable[[bytes], Any]] = None,
+    ):
+        self._key = b'"' + key.encode() + b'"'
+        self._needles = tuple(needles) if needles is not None else None
+        self._decode = decoder or default_json_decoder()
+        self._buf = b""
+        self._rest: List[bytes] = []
+        self._depth = 0
+        self._in_array = False
+        # progress through the entity at the start of the buffer
+        self._scanned = 0
+        self._entity_depth = 0
+        self.count = 0
+
+    def feed(self, chunk: bytes) -> List:
+        """Parse the next chunk of the body, and return the entities it completed."""
+        self._buf += chunk
+        entities: List = []
+        pos = 0
+        while True:
+            if self._in_array:
+                end = self._scan_entities(pos, entities)
+            else:
+                end = self._scan_outside(pos)
+            if end is None:
+                break
+            pos = end
+        return entities
+
+    def _consume(self, end: int, keep=True):
+        if keep:
+            self._rest.append(self._buf[:end])
+        self._buf = self._buf[end:]
+
+    def _scan_outside(self, pos: int) -> Optional[int]:
+        """Scan the response outside of `key`, returning None when out of data."""
+        buf = self._buf
+        while True:
+            match = _STRUCTURE.search(buf, pos)
+            if match is None:
+                self._consume(len(buf))
+                return None
+            start = match.start()
+            char = buf[start : start + 1]
+            if char != b'"':
+                self._depth += 1 if char in b"{[" else -1
+                pos = start + 1
+                continue
+
+            string = _STRING.match(buf, start)
+            if string is None:
+                self._consume(start)
+                return None
+            pos = string.end()
+            if self._depth != 1 or string.group() != self._key:
+                continue
+
+            colon = _SPACE.match(buf, pos).end()
+            bracket = _SPACE.match(buf, colon + 1).end()
+            if bracket >= len(buf):
+                self._consume(start)
+                return None
+            if buf[colon : colon + 1] == b":" and buf[bracket : bracket + 1] == b"[":
+                self._consume(bracket + 1)
+                self._depth += 1
+                self._in_array = True
+                return 0
+
+    def _scan_entities(self, pos: int, entities: List) -> Optional[int]:
+        """Scan the entities of `key`, returning None when out of data."""
+        buf = self._buf
+        while True:
+            if self._scanned == 0:
+                pos = _SEPARATOR.match(buf, pos).end()
+                if pos >= len(buf):
+                    self._consume(pos, keep=False)
+                    return None
+                if buf[pos : pos + 1] == b"]":
+                    self._consume(pos, keep=False)
+                    self._in_array = False
+                    return 0
+                self._consume(pos, keep=False)
+                buf, pos = self._buf, 0
+
+            end = self._entity_end(buf)
+            if end is None:
+                return None
+            self._scanned = 0
+            self._entity_depth = 0
+            self.count += 1
+            entity = buf[:end]
+            if self._needles is None or any(n in entity for n in self._needles):
+                entities.append(self._decode(entity))
+            pos = end
+
+    def _entity_end(self, buf: bytes) -> Optional[int]:
+        """Return the end of the entity at the start of the buffer, if complete."""
+        first = buf[:1]
+        if first == b'"':
+            string = _STRING.match(buf)
+            return string.end() if string is not None else None
+        if first not in (b"{", b"["):
+            scalar = _SCALAR.match(buf)
+            return scalar.end() if scalar.end() < len(buf) else None
+
+        pos = max(self._scanned, 1)
+        if self._entity_depth == 0:
+            self._entity_depth = 1
+        while True:
+            pos = _SKIP.match(buf, pos).end()
+            char = buf[pos : pos + 1]
+            if not char or char == b'"':
+                self._scanned = pos
+                return None
+            self._entity_depth += 1 if char in b"{[" else -1
+            pos += 1
+            if self._entity_depth == 0:
+                return pos
+
+    def close(self) -> Dict:
+        """Return the rest of the response, with an empty `key` array."""
+        if self._in_array:
+            raise ValueError("Truncated response: the array was never closed")
+        self._rest.append(self._buf)
+        self._buf = b""
+        return self._decode(b"".join(self._rest))
+
+
+class StreamedPage(object):
+    """
+    A normalized Voyager response, parsed as it downloads.
+
+    Iterating it yields the wanted `included` entities one at a time, and
+    `next_batch` returns those completed by the next chunks. Once done,
+    `data` holds the rest of the response, with an empty ``included``, and
+    `count` the number of entities, wanted or not.
+
+    :param chunks: The response body, as it arrives
+    :type chunks: iterable of bytes
+    :param needles: See `IncludedParser`
+    :type needles: tuple, optional
+    :param decoder: See `IncludedParser`
+    :type decoder: callable, optional
+    """
+
+    def __init__(
+        self,
+        chunks: Iterable[bytes],
+        needles: Optional[Iterable[bytes]] = None,
+        decoder: Optional[Callable[[bytes], Any]] = None,
+    ):
+        self._chunks = iter(chunks)
+        self._parser = IncludedParser(needles=needles, decoder=decoder)
+        self.data: Optional[Dict] = None
+
+    @property
+    def count(self) -> int:
+        return self._parser.count
+
+    def _close(self):
+        if self.data is None:
+            self.data = self._parser.close()
+
+    def next_batch(self) -> Optional[List]:
+        """
+        Return the wanted entities completed by the next chunks of the body,
+        or None once it is read.
+        """
+        for chunk in self._chunks:
+            entities = self._parser.feed(chunk)
+            if entities:
+                return entities
+        self._close()
+        return None
+
+    def __iter__(self) -> Iterator:
+        for chunk in self._chunks:
+            yield from self._parser.feed(chunk)
+        self._close()
+
+
+class AsyncStreamedPage(StreamedPage):
+    """
+    Async counterpart of `StreamedPage`, for a body arriving as an async
+    iterable of chunks: iterate it with ``async for``, and await `next_batch`.
+    """
+
+    def __init__(
+        self,
+        chunks: AsyncIterable[bytes],
+        needles: Optional[Iterable[bytes]] = None,
+        decoder: Optional[Callable[[bytes], Any]] = None,
+    ):
+        self._chunks = chunks.__aiter__()
+        self._parser = IncludedParser(needles=needles, decoder=decoder)
+        self.data = None
+
+    async def next_batch(self) -> Optional[List]:
+        async for chunk in self._chunks:
+            entities = self._parser.feed(chunk)
+            if entities:
+                return entities
+        self._close()
+        return None
+
+    async def __aiter__(self) -> AsyncIterator:
+        while True:
+            entities = await self.next_batch()
+            if entities is None:
+                return
+            for entity in entities:
+                yield entity
+
+    def __iter__(self):
+        raise TypeError("AsyncStreamedPage is iterated with async for")
@@ -0,0 +1,75 @@
+"""
+Provides connection pooling settings for the Linkedin API clients
+"""
+
+import logging
+
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+
+class TransportConfig(object):
+    """
+    Connection pooling settings shared by `Client` and `AsyncClient`.
+
+    :param pool_connections: Number of per-host connection pools to keep (requests only)
+    :type pool_connections: int, optional
+    :param pool_maxsize: Maximum number of connections kept open per host
+    :type pool_maxsize: int, optional
+    :param max_connections: Maximum number of concurrent connections (httpx only)
+    :type max_connections: int, optional
+    :param keep_alive: Reuse connections between requests. Defaults to True
+    :type keep_alive: bool, optional
+    :param keepalive_expiry: Seconds an idle connection is kept open (httpx only)
+    :type keepalive_expiry: float, optional
+    :param http2: Multiplex requests over HTTP/2. Only supported by `AsyncClient`, requires `h2`
+    :type http2: bool, optional
+    :param prewarm: Number of connections to open to LinkedIn when the client starts
+    :type prewarm: int, optional
+    """
+
+    def __init__(
+        self,
+        pool_connections=10,
+        pool_maxsize=10,
+        max_connections=100,
+        keep_alive=True,
+        keepalive_expiry=5.0,
+        http2=False,
+        prewarm=0,
+    ):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.max_connections = max_connections
+        self.keep_alive = keep_alive
+        self.keepalive_expiry = keepalive_expiry
+        self.http2 = http2
+        self.prewarm = prewarm
+
+    def build_adapter(self) -> HTTPAdapter:
+        """Return a `requests` adapter sized according to this config."""
+        return HTTPAdapter(
+            pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize
+        )
+
+    def configure_session(self, session):
+        """Mount pooled adapters on a `requests.Session`."""
+        if self.http2:
+            logger.warning("HTTP/2 is only supported by AsyncClient, using HTTP/1.1")
+
+        adapter = self.build_adapter()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        if not self.keep_alive:
+            session.headers["Connection"] = "close"
+
+    def httpx_limits(self):
+        """Return the `httpx.Limits` matching this config."""
+        import httpx
+
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.pool_maxsize if self.keep_alive else 0,
+            keepalive_expiry=self.keepalive_expiry,
+        )
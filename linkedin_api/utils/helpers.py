@@ -1,6 +1,16 @@
 import random
 import base64
-from typing import Dict, List
+from typing import Dict, Iterable, List, Optional
+
+
+async def async_sleep(seconds: float):
+    """
+    `asyncio.sleep`, importing asyncio on first use: sync-only callers never
+    pay for it.
+    """
+    import asyncio
+
+    await asyncio.sleep(seconds)
 
 
 def get_id_from_urn(urn: str):
@@ -12,6 +22,29 @@ def get_id_from_urn(urn: str):
     return urn.split(":")[3]
 
 
+def get_endpoint_family(method: str, uri: str) -> str:
+    """
+    Return the family of a Voyager endpoint, used to pace and budget requests.
+
+    One of "messaging", "write", "search", "profile" or "default".
+
+    Example: ("GET", "/identity/profiles/<id>/profileView") -> "profile"
+    """
+    if uri.startswith("/messaging"):
+        return "messaging"
+    if method.upper() != "GET":
+        return "write"
+    if (
+        "voyagerSearchDash" in uri
+        or uri.startswith("/voyagerJobsDashJobCards")
+        or uri.startswith("/search")
+    ):
+        return "search"
+    if uri.startswith(("/identity/profile", "/me")):
+        return "profile"
+    return "default"
+
+
 def get_urn_from_raw_update(raw_string: str) -> str:
     """
     Return the URN of a raw group update
@@ -176,12 +209,14 @@ def parse_list_raw_urns(l_raw_urns: List[str]) -> List[str]:
     return l_urns
 
 
-def parse_list_raw_posts(l_raw_posts: List[Dict], linkedin_base_url: str) -> List[Dict]:
+def parse_list_raw_posts(
+    l_raw_posts: Iterable[Dict], linkedin_base_url: str
+) -> List[Dict]:
     """Iterates a unsorted list containing post fields and assemble a
     list of dicts, each one of them contains a post
 
     :param l_raw_posts: Unsorted list containing posts information
-    :type l_raw_posts: list
+    :type l_raw_posts: iterable
     :param linkedin_base_url: Linkedin URL
     :type linkedin_base_url: str
 
@@ -233,17 +268,93 @@ def get_list_posts_sorted_without_promoted(
     :return: List of dicts, each one of them is a post
     :rtype: list
     """
-    l_posts_sorted_without_promoted = []
     l_posts[:] = [d for d in l_posts if "Promoted" not in d.get("old", "")]
-    for urn in l_urns:
-        for post in l_posts:
-            if urn in post["url"]:
-                l_posts_sorted_without_promoted.append(post)
-                l_posts[:] = [d for d in l_posts if urn not in d.get("url", "")]
-                break
+    posts_by_urn: Dict[str, Dict] = {}
+    for post in l_posts:
+        urn = post.get("url", "").rsplit("/feed/update/", 1)[-1]
+        posts_by_urn.setdefault(urn, post)
+    l_posts_sorted_without_promoted = get_feed_posts_in_order(l_urns, posts_by_urn)
+    sorted_urns = {post["url"] for post in l_posts_sorted_without_promoted}
+    l_posts[:] = [d for d in l_posts if d.get("url") not in sorted_urns]
     return l_posts_sorted_without_promoted
 
 
+def parse_feed_post(d_included: Dict, linkedin_base_url: str) -> Dict:
+    """Parse one update of a feed page into a post, holding the fields
+    present in the update
+
+    :param d_included: a dict, as returned by res.json().get("included", {})
+    :type d_included: dict
+    :param linkedin_base_url: Linkedin URL
+    :type linkedin_base_url: str
+
+    :return: Post
+    :rtype: dict
+    """
+    fields = (
+        ("author_name", get_update_author_name(d_included)),
+        ("author_profile", get_update_author_profile(d_included, linkedin_base_url)),
+        ("old", get_update_old(d_included)),
+        ("content", get_update_content(d_included, linkedin_base_url)),
+        ("url", get_update_url(d_included, linkedin_base_url)),
+    )
+    return {key: value for key, value in fields if value}
+
+
+def index_feed_posts(
+    l_raw_posts: Iterable[Dict],
+    linkedin_base_url: str,
+    posts_by_urn: Optional[Dict[str, Dict]] = None,
+    exclude_promoted=True,
+) -> Dict[str, Dict]:
+    """Parse the updates of a feed page in one pass, keyed by their URN.
+    Promoted posts are left out unless [exclude_promoted] is False, and only
+    the first update of a URN is kept.
+
+    :param l_raw_posts: Unsorted list containing posts information
+    :type l_raw_posts: iterable
+    :param linkedin_base_url: Linkedin URL
+    :type linkedin_base_url: str
+    :param posts_by_urn: Posts of the previous pages, to add the page to
+    :type posts_by_urn: dict, optional
+    :param exclude_promoted: Leave promoted posts out
+    :type exclude_promoted: bool, optional
+
+    :return: Dict of posts by URN
+    :rtype: dict
+    """
+    if posts_by_urn is None:
+        posts_by_urn = {}
+    for i in l_raw_posts:
+        try:
+            urn = i["updateMetadata"]["urn"]
+        except (KeyError, TypeError):
+            continue
+        if urn in posts_by_urn or (
+            exclude_promoted and "Promoted" in get_update_old(i)
+        ):
+            continue
+        posts_by_urn[urn] = parse_feed_post(i, linkedin_base_url)
+    return posts_by_urn
+
+
+def get_feed_posts_in_order(
+    l_urns: List[str], posts_by_urn: Dict[str, Dict]
+) -> List[Dict]:
+    """Return the posts of `posts_by_urn` in the order of l_urns, each one once.
+    The returned posts are removed from `posts_by_urn`.
+
+    :param l_urns: List of posts URNs
+    :type l_urns: list
+    :param posts_by_urn: Dict of posts by URN, see `index_feed_posts`
+    :type posts_by_urn: dict
+
+    :return: List of dicts, each one of them is a post
+    :rtype: list
+    """
+    return [posts_by_urn.pop(urn) for urn in l_urns if urn in posts_by_urn]
+
+
 def generate_trackingId_as_charString() -> str:
     """Generates and returns a random trackingId
 
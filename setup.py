@@ -32,7 +32,8 @@ setuptools.setup(
     url="https://github.com/tomquirk/linkedin-api",
     license="MIT",
     packages=setuptools.find_packages(),
-    install_requires=["requests", "beautifulsoup4", "lxml"],
+    install_requires=["requests"],
+    extras_require={"async": ["httpx"], "fast": ["orjson"]},
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
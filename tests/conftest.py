@@ -0,0 +1,132 @@
+import json
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+from requests.cookies import RequestsCookieJar
+
+from linkedin_api import Linkedin
+
+
+class FakeClock(object):
+    """A clock moved by hand, or by the sleeps it records."""
+
+    def __init__(self, now=0.0):
+        self.now = now
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+    async def async_sleep(self, seconds):
+        self.sleep(seconds)
+
+
+class FakeAdapter(BaseAdapter):
+    """
+    Stands in for LinkedIn, recording every request it is sent.
+
+    Requests are answered by `respond(request)`, or by the next of `answers`.
+    An answer is a body, a ``(status_code, body)`` or a
+    ``(status_code, body, headers)`` tuple, or an exception to raise. Bodies
+    other than bytes are sent as JSON. Every response sets `cookies`.
+    """
+
+    def __init__(self, respond=None, answers=None, cookies=None):
+        super().__init__()
+        self.respond = respond
+        self.answers = list(answers or ())
+        self.cookies = cookies or {}
+        self.requests = []
+
+    def send(self, request, **kwargs):
+        self.requests.append(request)
+        if self.respond is not None:
+            answer = self.respond(request)
+        elif self.answers:
+            answer = self.answers.pop(0)
+        else:
+            answer = {}
+        if isinstance(answer, Exception):
+            raise answer
+
+        status_code, body, headers = 200, answer, {}
+        if isinstance(answer, tuple):
+            status_code, body, headers = (answer + ({},))[:3]
+        res = requests.Response()
+        res.status_code = status_code
+        res.headers["Content-Type"] = "application/json"
+        res.headers.update(headers)
+        res._content = body if isinstance(body, bytes) else json.dumps(body).encode()
+        res._content_consumed = True
+        res.request = request
+        res.url = request.url
+        res.cookies = RequestsCookieJar()
+        for name, value in self.cookies.items():
+            res.cookies.set(name, value, expires=4102444800)
+        return res
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def fake_adapter():
+    """Return a factory of `FakeAdapter`."""
+    return FakeAdapter
+
+
+@pytest.fixture
+def make_api():
+    """
+    Return a factory of unauthenticated `Linkedin` instances talking to a
+    `FakeAdapter`, returning both.
+    """
+
+    def make(respond=None, answers=None, **kwargs):
+        api = Linkedin("test", "test", authenticate=False, **kwargs)
+        adapter = FakeAdapter(respond, answers)
+        api.client.session.mount("https://", adapter)
+        return api, adapter
+
+    return make
+
+
+@pytest.fixture
+def make_async_api():
+    """
+    Return a factory of unauthenticated `AsyncLinkedin` instances whose
+    requests are answered by `handler(request)`, an ``httpx.Response``.
+    """
+    httpx = pytest.importorskip("httpx")
+    from linkedin_api import AsyncLinkedin
+
+    def make(handler, **kwargs):
+        api = AsyncLinkedin("test", "test", authenticate=False, **kwargs)
+        api.client.session = httpx.AsyncClient(
+            transport=httpx.MockTransport(handler), headers=api.client.session.headers
+        )
+        return api
+
+    return make
+
+
+@pytest.fixture
+def no_evade():
+    return lambda: None
+
+
+@pytest.fixture
+def no_async_evade():
+    async def evade():
+        pass
+
+    return evade
@@ -0,0 +1,159 @@
+import random
+import threading
+import time
+import pytest
+
+from linkedin_api import AccountPool, Linkedin, RateLimiter
+from linkedin_api.account_pool import NoAccountAvailable, get_method_family
+from linkedin_api.client import ChallengeException, UnauthorizedException
+
+
+def make_pool(names, **kwargs):
+    return AccountPool(
+        {name: Linkedin(name, "test", authenticate=False, **kwargs) for name in names}
+    )
+
+
+def test_get_method_family():
+    assert get_method_family("search_people") == "search"
+    assert get_method_family("get_profile_skills") == "profile"
+    assert get_method_family("get_company") == "default"
+
+
+def test_calls_are_spread_over_accounts():
+    pool = make_pool(["a", "b", "c"])
+    served = []
+    for name in "abc":
+        pool.account(name).get_company = lambda public_id, name=name: served.append(
+            name
+        )
+
+    for _ in range(6):
+        pool.get_company("linkedin")
+
+    assert sorted(served) == ["a", "a", "b", "b", "c", "c"]
+
+
+def test_get_profiles_runs_one_call_per_account_at_once():
+    pool = make_pool(["a", "b", "c"])
+    lock = threading.Lock()
+    in_flight = {"current": 0, "peak": 0}
+    served = []
+
+    def getter(name):
+        def get_profile(public_id=None, urn_id=None):
+            with lock:
+                in_flight["current"] += 1
+                in_flight["peak"] = max(in_flight["peak"], in_flight["current"])
+                served.append(name)
+            time.sleep(0.01)
+            with lock:
+                in_flight["current"] -= 1
+            return {"public_id": public_id, "account": name}
+
+        return get_profile
+
+    for name in "abc":
+        pool.account(name).get_profile = getter(name)
+
+    results = list(pool.get_profiles([str(i) for i in range(9)]))
+
+    assert all(r.ok for r in results)
+    assert sorted(r.id for r in results) == [str(i) for i in range(9)]
+    assert in_flight["peak"] <= 3
+    assert {name: served.count(name) for name in "abc"} == {"a": 3, "b": 3, "c": 3}
+
+
+def test_accounts_with_more_rate_budget_are_preferred(clock):
+    pool = make_pool(["a", "b"], rate_limiter=RateLimiter(clock=clock))
+    # give "a" its own limiter, with most of the search budget spent
+    pool.account("a").rate_limiter = RateLimiter(clock=clock)
+    for _ in range(4):
+        pool.account("a").rate_limiter.acquire("search")
+    served = []
+    for name in "ab":
+        pool.account(name).search_people = lambda name=name, **kw: served.append(name)
+
+    pool.search_people(keywords="python")
+    pool.search_people(keywords="python")
+
+    assert served == ["b", "b"]
+
+
+def test_account_methods_must_be_pinned():
+    pool = make_pool(["a", "b"])
+    pool.account("b").get_invitations = lambda: ["invitation"]
+
+    with pytest.raises(ValueError):
+        pool.get_invitations()
+    assert pool.get_invitations(account="b") == ["invitation"]
+
+
+def test_conversations_are_remembered_with_their_account(make_api, monkeypatch):
+    monkeypatch.setattr(random, "randint", lambda a, b: 0)
+    pool = AccountPool()
+    for name in "ab":
+        api, _ = make_api(
+            answers=[
+                {"elements": [{"entityUrn": f"urn:li:fs_conversation:{name}-1"}]},
+                {"elements": []},
+            ]
+        )
+        pool.add(name, api)
+
+    pool.get_conversations(account="b")
+    pool.get_conversation("b-1")
+
+    requests_b = pool.account("b").client.session.adapters["https://"].requests
+    requests_a = pool.account("a").client.session.adapters["https://"].requests
+    assert len(requests_b) == 2 and "/conversations/b-1/events" in requests_b[1].url
+    assert requests_a == []
+    with pytest.raises(ValueError):
+        pool.get_conversation("unknown")
+
+
+@pytest.mark.parametrize("error", [UnauthorizedException(), ChallengeException("x")])
+def test_failing_account_is_taken_out_of_rotation(error):
+    pool = make_pool(["a", "b"])
+
+    def fail(public_id):
+        raise error
+
+    pool.account("a").get_company = fail
+    pool.account("b").get_company = lambda public_id: {"account": "b"}
+
+    assert pool.get_company("linkedin") == {"account": "b"}
+    assert pool.healthy == ["b"]
+    with pytest.raises(NoAccountAvailable):
+        pool.get_invitations(account="a")
+
+    pool.account("b").get_company = fail
+    with pytest.raises(NoAccountAvailable):
+        pool.get_company("linkedin")
+
+    pool.enable("a")
+    assert pool.healthy == ["a"]
+
+
+@pytest.mark.parametrize(
+    "answer, error",
+    [
+        ((401, {}), UnauthorizedException),
+        ((999, b""), UnauthorizedException),
+        (
+            (302, b"", {"Location": "https://www.linkedin.com/checkpoint/challenge/x"}),
+            ChallengeException,
+        ),
+    ],
+)
+def test_account_refused_by_an_api_call_is_taken_out_of_rotation(
+    make_api, monkeypatch, answer, error
+):
+    monkeypatch.setattr(random, "randint", lambda a, b: 0)
+    company = {"elements": [{"name": "LinkedIn"}]}
+    refused, _ = make_api(answers=[answer])
+    pool = AccountPool({"a": refused, "b": make_api(answers=[company])[0]})
+
+    assert pool.get_company("linkedin") == {"name": "LinkedIn"}
+    assert pool.healthy == ["b"]
+    assert isinstance(pool._accounts["a"].error, error)
@@ -0,0 +1,133 @@
+import asyncio
+import json
+import random
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from linkedin_api import AsyncLinkedin, Linkedin
+
+
+def profile_view(public_id):
+    return {
+        "profile": {
+            "entityUrn": f"urn:li:fs_profile:{public_id}-urn",
+            "miniProfile": {
+                "entityUrn": f"urn:li:fs_miniProfile:{public_id}-urn",
+                "objectUrn": f"urn:li:member:{public_id}",
+                "publicIdentifier": public_id,
+            },
+            "defaultLocale": {},
+            "supportedLocales": [],
+            "versionTag": "1",
+            "showEducationOnProfileTopCard": True,
+        },
+        "positionView": {"elements": []},
+        "educationView": {"elements": []},
+        "languageView": {"elements": []},
+        "publicationView": {"elements": []},
+        "certificationView": {"elements": []},
+        "volunteerExperienceView": {"elements": []},
+        "honorView": {"elements": []},
+        "projectView": {"elements": []},
+        "skillView": {"elements": [{"entityUrn": "urn:li:skill:1", "name": "Python"}]},
+    }
+
+
+@pytest.fixture
+def api(monkeypatch):
+    # no evade delay in tests
+    monkeypatch.setattr(random, "randint", lambda a, b: 0)
+    return AsyncLinkedin("test", "test", authenticate=False)
+
+
+def mock_session(api, handler):
+    api.client.session = httpx.AsyncClient(
+        transport=httpx.MockTransport(handler), headers=api.client.session.headers
+    )
+
+
+def test_constructor(api):
+    assert api.client.session
+
+
+def test_concurrent_get_profile(api):
+    in_flight = 0
+    max_in_flight = 0
+
+    async def handler(request):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        public_id = request.url.path.split("/")[-2]
+        return httpx.Response(200, json=profile_view(public_id))
+
+    async def run():
+        mock_session(api, handler)
+        async with api:
+            return await asyncio.gather(
+                *(api.get_profile(public_id=f"user-{i}") for i in range(10))
+            )
+
+    profiles = asyncio.run(run())
+
+    assert [p["public_id"] for p in profiles] == [f"user-{i}" for i in range(10)]
+    assert profiles[0]["skills"] == [{"name": "Python"}]
+    assert max_in_flight > 1
+
+
+def test_post_sends_raw_body(api):
+    seen = {}
+
+    def handler(request):
+        seen["body"] = json.loads(request.content)
+        return httpx.Response(201)
+
+    async def run():
+        mock_session(api, handler)
+        async with api:
+            return await api.send_message("hi", conversation_urn_id="123")
+
+    err = asyncio.run(run())
+
+    assert not err
+    assert (
+        seen["body"]["eventCreate"]["value"][
+            "com.linkedin.voyager.messaging.create.MessageCreate"
+        ]["attributedBody"]["text"]
+        == "hi"
+    )
+
+
+def test_endpoints_are_the_sync_plans():
+    endpoints = {name for name in vars(Linkedin) if not name.startswith("_")}
+
+    assert not endpoints & set(vars(AsyncLinkedin))
+
+
+def test_plan_awaits_nested_calls_and_raises_their_errors(api):
+    invited = []
+
+    def handler(request):
+        if request.url.path.endswith("/profileView"):
+            return httpx.Response(200, json=profile_view("jane"))
+        invited.append(json.loads(request.content))
+        return httpx.Response(201)
+
+    def refuse(request):
+        raise httpx.ConnectError("refused", request=request)
+
+    mock_session(api, handler)
+    assert not asyncio.run(api.add_connection("jane"))
+    assert (
+        invited[0]["invitee"]["com.linkedin.voyager.growth.invitation.InviteeProfile"][
+            "profileId"
+        ]
+        == "jane-urn"
+    )
+
+    mock_session(api, refuse)
+    with pytest.raises(httpx.ConnectError):
+        asyncio.run(api.add_connection("jane"))
@@ -0,0 +1,156 @@
+import random
+import pytest
+
+import linkedin_api
+from benchmarks import imports, parsers, payloads
+from linkedin_api import Linkedin
+from linkedin_api.client import Client
+from linkedin_api.utils.helpers import (
+    get_feed_posts_in_order,
+    get_list_posts_sorted_without_promoted,
+    index_feed_posts,
+    parse_list_raw_posts,
+    parse_list_raw_urns,
+)
+
+
+def test_feed_page_round_trips_through_feed_parsers():
+    page = payloads.feed_page(50, promoted_ratio=0.2)
+    posts = parse_list_raw_posts(page["included"], Client.LINKEDIN_BASE_URL)
+    urns = parse_list_raw_urns(page["data"]["*elements"])
+    promoted = {
+        i["updateMetadata"]["urn"]
+        for i in page["included"]
+        if "actor" in i and i["actor"]["subDescription"]["text"] == "Promoted"
+    }
+
+    sorted_posts = get_list_posts_sorted_without_promoted(urns, posts)
+
+    assert promoted
+    assert [post["url"].split("/")[-1] for post in sorted_posts] == [
+        urn for urn in urns if urn not in promoted
+    ]
+
+
+def original_posts_sorted_without_promoted(l_urns, l_posts):
+    """Frozen copy of the quadratic `get_list_posts_sorted_without_promoted`
+    the feed assembly replaced, as the reference of its output."""
+    l_posts_sorted_without_promoted = []
+    l_posts[:] = [d for d in l_posts if "Promoted" not in d.get("old", "")]
+    for urn in l_urns:
+        for post in l_posts:
+            if urn in post["url"]:
+                l_posts_sorted_without_promoted.append(post)
+                l_posts[:] = [d for d in l_posts if urn not in d.get("url", "")]
+                break
+    return l_posts_sorted_without_promoted
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_feed_assembler_matches_sorting_parsed_posts(seed):
+    page = payloads.feed_page(200, promoted_ratio=0.2, seed=seed)
+    # an update repeated in a page is only returned once
+    page["included"] += page["included"][:20]
+    urns = parse_list_raw_urns(page["data"]["*elements"])
+
+    def parsed_posts():
+        return parse_list_raw_posts(page["included"], Client.LINKEDIN_BASE_URL)
+
+    assembled = get_feed_posts_in_order(
+        urns, index_feed_posts(page["included"], Client.LINKEDIN_BASE_URL)
+    )
+
+    expected = original_posts_sorted_without_promoted(urns, parsed_posts())
+    assert assembled == expected
+    assert get_list_posts_sorted_without_promoted(urns, parsed_posts()) == expected
+    assert len({post["url"] for post in assembled}) == len(assembled)
+
+
+def test_feed_posts_and_urns_keep_promoted_posts(make_api, monkeypatch):
+    monkeypatch.setattr(random, "randint", lambda a, b: 0)
+    page = payloads.feed_page(50, promoted_ratio=0.2)
+    api, _ = make_api(answers=[page, page])
+
+    l_posts, l_urns = api._get_list_feed_posts_and_list_feed_urns(50)
+
+    assert any("Promoted" in post["old"] for post in l_posts)
+    assert original_posts_sorted_without_promoted(
+        l_urns, l_posts
+    ) == api.get_feed_posts(limit=50)
+
+
+def test_payloads_parse():
+    api = Linkedin("", "", authenticate=False)
+
+    assert len(api._parse_search_page(payloads.search_page(25))) == 25
+    assert len(api._parse_profile(payloads.profile_view(90))["skills"]) == 10
+    jobs = payloads.job_search_page(100)["included"]
+    assert 0 < len(api._parse_job_postings(jobs)) < 100
+
+
+def test_payloads_are_deterministic():
+    assert payloads.to_bytes(payloads.feed_page(10)) == payloads.to_bytes(
+        payloads.feed_page(10)
+    )
+
+
+def test_run_and_check_regressions():
+    results = parsers.run(sizes=(10,), min_time=0.001, repeat=1)
+
+    assert {result.name for result in results} == set(parsers.BENCHMARKS)
+    assert all(result.ops_per_sec > 0 for result in results)
+
+    baselines = {
+        result.key: {"ops_per_sec": result.ops_per_sec, "peak_bytes": 1}
+        for result in results
+    }
+    assert len(parsers.regressions(results, baselines)) == len(results)
+
+
+def test_regressions_scale_out_the_machine_speed():
+    results = [parsers.Result(f"b{i}", 10, 100.0, 1000) for i in range(5)]
+    # from a machine twice as fast
+    baselines = {
+        result.key: {"ops_per_sec": 200.0, "peak_bytes": 1000} for result in results
+    }
+    assert parsers.machine_speed(results, baselines) == 0.5
+    assert parsers.regressions(results, baselines) == []
+
+    results[0] = parsers.Result("b0", 10, 50.0, 1000)
+    assert [r.split(":")[0] for r in parsers.regressions(results, baselines)] == [
+        "b0[10]"
+    ]
+
+
+def test_baselines_are_stored_per_python_version(tmp_path):
+    path = str(tmp_path / "baselines.json")
+    parsers.save_baselines([parsers.Result("b", 10, 100.0, 1000)], path, "3.8")
+    parsers.save_baselines([parsers.Result("b", 10, 300.0, 900)], path, "3.11")
+
+    assert parsers.load_baselines(path, "3.8") == {
+        "b[10]": {"ops_per_sec": 100.0, "peak_bytes": 1000}
+    }
+    assert parsers.load_baselines(path, "3.11")["b[10]"]["ops_per_sec"] == 300.0
+    assert parsers.load_baselines(path, "3.12") == {}
+
+
+def test_imports_defer_heavy_dependencies():
+    results = imports.run(["linkedin_api", "linkedin_api.linkedin"], repeat=1)
+
+    assert imports.violations(results) == []
+    assert [result.heavy for result in results] == [frozenset(), {"requests"}]
+
+
+def test_violations_name_early_imports():
+    result = imports.Result("linkedin_api", 1000, frozenset({"httpx", "requests"}))
+
+    assert imports.violations([result]) == ["linkedin_api: imports httpx, requests"]
+
+
+def test_public_names_load_on_access():
+    from linkedin_api.linkedin import Linkedin
+
+    assert linkedin_api.Linkedin is Linkedin
+    assert set(linkedin_api.__all__) <= set(dir(linkedin_api))
+    with pytest.raises(AttributeError):
+        linkedin_api.Nope
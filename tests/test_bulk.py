@@ -0,0 +1,104 @@
+import asyncio
+import itertools
+import threading
+import time
+import pytest
+
+from linkedin_api import AsyncLinkedin, BulkResult, Linkedin
+from linkedin_api.bulk import iter_bulk
+
+
+class InFlight(object):
+    """Counts concurrent calls of a fake getter."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.current = 0
+        self.peak = 0
+
+    def __enter__(self):
+        with self.lock:
+            self.current += 1
+            self.peak = max(self.peak, self.current)
+
+    def __exit__(self, *exc_info):
+        with self.lock:
+            self.current -= 1
+
+
+def test_get_profiles_bounds_concurrency_and_reports_errors():
+    api = Linkedin("test", "test", authenticate=False)
+    in_flight = InFlight()
+
+    def get_profile(public_id=None, urn_id=None):
+        with in_flight:
+            time.sleep(0.01)
+        if public_id == "bad":
+            raise KeyError("profile")
+        return {"public_id": public_id, "urn_id": urn_id}
+
+    api.get_profile = get_profile
+    ids = ["a", "bad", "c", "d", "e", "f", {"urn_id": "ACoAA"}]
+
+    results = list(api.get_profiles(ids, max_concurrency=3))
+
+    assert in_flight.peak <= 3
+    assert sorted(map(str, (r.id for r in results))) == sorted(map(str, ids))
+    by_id = {str(r.id): r for r in results}
+    assert isinstance(by_id["bad"].error, KeyError)
+    assert not by_id["bad"].ok
+    assert by_id["a"] == BulkResult("a", {"public_id": "a", "urn_id": None})
+    assert by_id[str({"urn_id": "ACoAA"})].value["urn_id"] == "ACoAA"
+
+
+def test_get_profiles_other_getters():
+    api = Linkedin("test", "test", authenticate=False)
+    api.get_profile_skills = lambda public_id: [{"name": public_id}]
+
+    results = list(api.get_profiles(["a"], getter="get_profile_skills"))
+
+    assert results == [BulkResult("a", [{"name": "a"}])]
+    with pytest.raises(ValueError):
+        api.get_profiles(["a"], getter="send_message")
+
+
+def test_iter_bulk_consumes_lazily():
+    seen = []
+
+    def fn(item):
+        seen.append(item)
+        return item
+
+    results = iter_bulk(fn, itertools.count(), max_concurrency=2)
+    first = [next(results) for _ in range(3)]
+    results.close()
+
+    assert len(first) == 3
+    assert len(seen) <= 5
+
+
+def test_async_get_profiles():
+    pytest.importorskip("httpx")
+    peak = current = 0
+
+    async def get_profile(public_id=None, urn_id=None):
+        nonlocal peak, current
+        current += 1
+        peak = max(peak, current)
+        await asyncio.sleep(0.01)
+        current -= 1
+        if public_id == "bad":
+            raise KeyError("profile")
+        return {"public_id": public_id}
+
+    async def run():
+        api = AsyncLinkedin("test", "test", authenticate=False)
+        api.get_profile = get_profile
+        async with api:
+            return [r async for r in api.get_profiles(list("abcdef") + ["bad"], 2)]
+
+    results = asyncio.run(run())
+
+    assert peak == 2
+    assert len(results) == 7
+    assert [r.id for r in results if not r.ok] == ["bad"]
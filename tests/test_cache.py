@@ -0,0 +1,162 @@
+import asyncio
+import gzip
+import json
+import pytest
+import requests
+
+from linkedin_api import ResponseCache
+from linkedin_api.cache import cache_key, is_failed_response
+
+
+def path_of(request):
+    return {"path": request.path_url}
+
+
+def test_cache_key_normalizes_params():
+    url = "https://www.linkedin.com/voyager/api/feed/updates"
+
+    assert cache_key("get", url, {"b": 1, "a": 2}) == cache_key(
+        "GET", url, {"a": 2, "b": 1}
+    )
+    assert cache_key("GET", url, {"a": 2}) != cache_key(
+        "GET", url, {"a": 2}, {"accept": "application/vnd.linkedin.normalized+json+2.1"}
+    )
+
+
+def test_is_failed_response():
+    assert is_failed_response(404, b"")
+    assert is_failed_response(200, b'{"status": 403, "message": "nope"}')
+    assert not is_failed_response(200, b'{"status": 200}')
+    assert not is_failed_response(500, b"")
+
+
+def test_ttls_and_expiry(clock):
+    cache = ResponseCache(
+        ttl=10, ttls={"/identity": 100, "/identity/wvmp": 1}, clock=clock
+    )
+    cache.set("a", "/identity/profiles/x", "u", 200, {}, b"{}")
+    cache.set("b", "/identity/wvmpCards", "u", 200, {}, b"{}")
+    cache.set("c", "/messaging/conversations", "u", 200, {}, b"{}")
+
+    clock.now += 5
+
+    assert cache.get("a") is not None
+    assert cache.get("b") is None
+    assert cache.get("c") is None
+    assert cache.ttl_for("/jobs") == 10
+
+
+def test_negative_caching(clock):
+    cache = ResponseCache(negative_ttl=5, clock=clock)
+
+    cache.set("missing", "/identity/profiles/x", "u", 404, {}, b"")
+    cache.set("throttled", "/identity/profiles/y", "u", 429, {}, b"")
+
+    assert cache.get("missing").status_code == 404
+    assert cache.get("throttled") is None
+    clock.now += 6
+    assert cache.get("missing") is None
+
+
+def test_lru_eviction():
+    cache = ResponseCache(max_entries=2)
+    cache.set("a", "/x", "u", 200, {}, b"")
+    cache.set("b", "/x", "u", 200, {}, b"")
+    cache.get("a")
+    cache.set("c", "/x", "u", 200, {}, b"")
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert len(cache) == 2
+
+
+def test_disk_tier(tmp_path):
+    ResponseCache(cache_dir=str(tmp_path)).set(
+        "a", "/identity/profiles/x", "u", 200, {"X": "1"}, b"{}"
+    )
+
+    cache = ResponseCache(cache_dir=str(tmp_path))
+    assert cache.get("a").headers == {"X": "1"}
+
+    cache.invalidate("a")
+    assert ResponseCache(cache_dir=str(tmp_path)).get("a") is None
+
+
+def test_fetch_is_served_from_cache(make_api):
+    api, adapter = make_api(path_of, cache=ResponseCache())
+    evaded = []
+
+    first = api._fetch(
+        "/identity/profiles/x/profileView", evade=lambda: evaded.append(1)
+    ).json()
+    second = api._fetch(
+        "/identity/profiles/x/profileView", evade=lambda: evaded.append(1)
+    ).json()
+
+    assert first == second == {"path": "/voyager/api/identity/profiles/x/profileView"}
+    assert len(adapter.requests) == 1
+    assert len(evaded) == 1
+    assert api.cache.hits == 1
+
+
+def test_posts_are_not_cached(make_api, no_evade):
+    api, adapter = make_api(path_of, cache=ResponseCache())
+
+    api._post("/li/track", evade=no_evade, base_request=True)
+    api._post("/li/track", evade=no_evade, base_request=True)
+
+    assert len(adapter.requests) == 2
+
+
+def test_writes_invalidate_cache(make_api, no_evade):
+    api, adapter = make_api(path_of, cache=ResponseCache())
+    api._fetch("/identity/profiles/x/profileView", evade=no_evade)
+    api._fetch("/identity/profiles/y/profileView", evade=no_evade)
+
+    api._post = lambda *args, **kwargs: requests.Response()
+    api.remove_connection("x")
+
+    assert len(api.cache) == 1
+    api._fetch("/identity/profiles/x/profileView", evade=no_evade)
+    assert len(adapter.requests) == 3
+
+
+def test_async_fetch_is_served_from_cache(make_async_api, no_async_evade):
+    httpx = pytest.importorskip("httpx")
+    seen = []
+
+    def handler(request):
+        seen.append(request)
+        return httpx.Response(
+            200,
+            headers={"Content-Encoding": "gzip"},
+            content=gzip.compress(json.dumps({"n": len(seen)}).encode()),
+        )
+
+    api = make_async_api(handler, cache=ResponseCache())
+
+    async def run():
+        async with api:
+            first = await api._fetch("/me", evade=no_async_evade)
+            second = await api._fetch("/me", evade=no_async_evade)
+        return first.json(), second.json()
+
+    assert asyncio.run(run()) == ({"n": 1}, {"n": 1})
+    assert len(seen) == 1
+
+
+def test_add_connection_invalidates_cache(make_api, no_evade):
+    api, adapter = make_api(path_of, cache=ResponseCache())
+    for uri in (
+        "/identity/profiles/x/networkinfo",
+        "/identity/profiles/ACoAAx/profileView",
+        "/relationships/invitationViews",
+        "/graphql?queryId=voyagerSearchDashClusters.b0",
+        "/identity/profiles/y/networkinfo",
+    ):
+        api._fetch(uri, evade=no_evade)
+
+    api._post = lambda *args, **kwargs: requests.Response()
+    api.add_connection("x", profile_urn="ACoAAx")
+
+    assert len(api.cache) == 1
@@ -0,0 +1,89 @@
+import asyncio
+import json
+import pytest
+
+import linkedin_api.linkedin
+from linkedin_api import Cassette, Linkedin
+from linkedin_api.cassette import CassetteError, match_key
+
+SKILLS = {"elements": [{"name": "Python", "entityUrn": "urn:li:fs_skill:(x,1)"}]}
+
+
+@pytest.fixture
+def record(fake_adapter):
+    def record(path):
+        with Cassette(path, mode="record") as cassette:
+            api = Linkedin("test", "test", authenticate=False, cassette=cassette)
+            adapter = fake_adapter(
+                answers=[(200, SKILLS, {"Set-Cookie": "li_at=secret"})]
+            )
+            api.client.session.mount("https://", cassette.adapter(adapter))
+            api.get_profile_skills("billy-g")
+
+    return record
+
+
+@pytest.fixture(autouse=True)
+def sleeps(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(linkedin_api.linkedin, "sleep", sleeps.append)
+    return sleeps
+
+
+def test_match_key_normalizes_params():
+    assert match_key("get", "https://x/voyager/api/a?start=0&count=100") == match_key(
+        "GET", "https://x/voyager/api/a?count=100&start=0"
+    )
+
+
+@pytest.mark.parametrize("name", ["cassette.json", "cassette.json.gz"])
+def test_record_then_replay(tmp_path, record, sleeps, name):
+    path = str(tmp_path / name)
+    record(path)
+    sleeps.clear()
+
+    api = Linkedin("test", "test", authenticate=False, cassette=Cassette(path))
+
+    assert api.get_profile_skills("billy-g") == [{"name": "Python"}]
+    assert sleeps == []
+    with pytest.raises(CassetteError):
+        api.get_profile_skills("someone-else")
+
+
+def test_cookies_are_not_recorded(tmp_path, record):
+    path = str(tmp_path / "cassette.json")
+    record(path)
+
+    with open(path) as f:
+        assert "secret" not in f.read()
+
+
+def test_identical_requests_replay_in_order(tmp_path):
+    cassette = Cassette(str(tmp_path / "cassette.json"), mode="record")
+    for n in range(2):
+        cassette.record("GET", "https://x/a?b=1", 200, {}, str(n).encode())
+    cassette.save()
+
+    replay = Cassette(cassette.path)
+
+    assert [replay.play("GET", "https://x/a?b=1")[2] for _ in range(3)] == [
+        b"0",
+        b"1",
+        b"1",
+    ]
+
+
+def test_async_replay(tmp_path, record):
+    pytest.importorskip("httpx")
+    from linkedin_api import AsyncLinkedin
+
+    path = str(tmp_path / "cassette.json")
+    record(path)
+
+    async def run():
+        async with AsyncLinkedin(
+            "test", "test", authenticate=False, cassette=Cassette(path)
+        ) as api:
+            return await api.get_profile_skills("billy-g")
+
+    assert asyncio.run(run()) == [{"name": "Python"}]
@@ -1,3 +1,4 @@
+import multiprocessing
 import os
 import sys
 import pytest
@@ -7,6 +8,7 @@ from datetime import datetime
 from linkedin_api.cookie_repository import (
     CookieRepository,
     LinkedinSessionExpired,
+    SQLiteCookieRepository,
 )
 
 
@@ -51,3 +53,68 @@ def test_get_expired():
         assert False
     except LinkedinSessionExpired:
         assert True
+
+
+def test_metadata_round_trip(tmp_path):
+    repo = CookieRepository(cookies_dir=f"{tmp_path}/")
+    assert repo.get_metadata("testuser") is None
+
+    repo.save_metadata({"clientPageInstanceId": "page-1"}, "testuser")
+
+    assert repo.get_metadata("testuser") == {"clientPageInstanceId": "page-1"}
+
+
+def save_sessions(path, prefix, count):
+    repo = SQLiteCookieRepository(path)
+    for i in range(count):
+        repo.save(mock_cookies(), f"{prefix}{i}")
+        repo.save_metadata({"n": i}, f"{prefix}{i}")
+
+
+def test_sqlite_round_trip(tmp_path):
+    repo = SQLiteCookieRepository(f"{tmp_path}/sessions.sqlite3")
+    assert repo.get("testuser") is None
+
+    repo.save(mock_cookies(), "testuser")
+    repo.save_metadata({"clientPageInstanceId": "page-1"}, "testuser")
+
+    assert repo.get("testuser") == mock_cookies()
+    assert repo.get_metadata("testuser") == {"clientPageInstanceId": "page-1"}
+    assert repo.is_valid("testuser")
+
+
+def test_sqlite_expired(tmp_path):
+    repo = SQLiteCookieRepository(f"{tmp_path}/sessions.sqlite3")
+    repo.save(mock_cookies(datetime(2001, 5, 4)), "testuserex")
+
+    assert not repo.is_valid("testuserex")
+    with pytest.raises(LinkedinSessionExpired):
+        repo.get("testuserex")
+
+
+def test_sqlite_bulk_load_skips_expired(tmp_path):
+    repo = SQLiteCookieRepository(f"{tmp_path}/sessions.sqlite3")
+    repo.save(mock_cookies(), "b")
+    repo.save(mock_cookies(), "a")
+    repo.save(mock_cookies(datetime(2001, 5, 4)), "expired")
+
+    assert repo.valid_usernames() == ["a", "b"]
+    assert repo.get_all() == {"a": mock_cookies(), "b": mock_cookies()}
+
+
+def test_sqlite_concurrent_processes(tmp_path):
+    path = f"{tmp_path}/sessions.sqlite3"
+    SQLiteCookieRepository(path)
+    workers = [
+        multiprocessing.Process(target=save_sessions, args=(path, f"w{w}-", 20))
+        for w in range(4)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    repo = SQLiteCookieRepository(path)
+    assert [worker.exitcode for worker in workers] == [0] * 4
+    assert len(repo.get_all()) == 80
+    assert repo.get_metadata("w3-19") == {"n": 19}
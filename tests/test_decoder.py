@@ -0,0 +1,72 @@
+import json
+import requests
+
+import linkedin_api.linkedin
+from linkedin_api.decoder import clone_response, decode_response, default_json_decoder
+
+
+def comment_pages(pages):
+    """Answer `/feed/comments` with `pages` pages of two comments."""
+
+    sent = 0
+
+    def respond(request):
+        nonlocal sent
+        sent += 1
+        return {
+            "metadata": {"paginationToken": "" if sent == pages else f"t{sent}"},
+            "elements": [{"n": 2 * sent}, {"n": 2 * sent + 1}],
+            "paging": {"start": 2 * sent},
+        }
+
+    return respond
+
+
+class CountingDecoder(object):
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, body: bytes):
+        self.calls += 1
+        return json.loads(body)
+
+
+def response(body: bytes) -> requests.Response:
+    res = requests.Response()
+    res._content = body
+    return res
+
+
+def test_default_decoder_matches_stdlib():
+    body = json.dumps({"a": [1, 2.5, None, "é"], "b": {"c": True}}).encode()
+
+    assert default_json_decoder()(body) == json.loads(body)
+
+
+def test_decode_response_decodes_once():
+    decoder = CountingDecoder()
+    res = response(b'{"a": 1}')
+
+    data = decode_response(res, decoder)
+
+    assert decode_response(res, decoder) is data
+    assert decoder.calls == 1
+
+
+def test_clone_response_decodes_again():
+    res = response(b'{"a": 1}')
+    data = decode_response(res)
+    data["a"] = 2
+
+    assert decode_response(clone_response(res)) == {"a": 1}
+
+
+def test_get_post_comments_decodes_each_page_once(monkeypatch, make_api):
+    monkeypatch.setattr(linkedin_api.linkedin, "sleep", lambda seconds: None)
+    decoder = CountingDecoder()
+    api, adapter = make_api(comment_pages(3), json_decoder=decoder)
+
+    comments = api.get_post_comments("123", comment_count=10)
+
+    assert [comment["n"] for comment in comments] == [2, 3, 4, 5, 6, 7]
+    assert decoder.calls == len(adapter.requests) == 3
@@ -0,0 +1,126 @@
+import asyncio
+import random
+import pytest
+
+from benchmarks import payloads
+from linkedin_api import EntityStore
+from linkedin_api.entity_store import entity_size
+
+
+@pytest.fixture(autouse=True)
+def no_evade(monkeypatch):
+    monkeypatch.setattr(random, "randint", lambda a, b: 0)
+
+
+def entity(urn, **fields):
+    return {"entityUrn": urn, **fields}
+
+
+def test_least_recently_used_entities_are_dropped_over_the_size_limit():
+    store = EntityStore(max_bytes=25, size_of=lambda e: 10)
+    store.add_all([entity("urn:a"), entity("urn:b")])
+    store.get("urn:a")
+
+    store.add(entity("urn:c"))
+
+    assert "urn:b" not in store
+    assert [urn in store for urn in ("urn:a", "urn:c")] == [True, True]
+    assert store.size == 20
+    store.add(entity("urn:c", name="new"))
+    assert store.get("urn:c") == {"entityUrn": "urn:c", "name": "new"}
+    assert (len(store), store.size, store.hits, store.misses) == (2, 20, 2, 0)
+
+
+def test_entities_are_bounded_by_count_without_measuring_them():
+    def size_of(entity):
+        raise AssertionError("sized without max_bytes")
+
+    store = EntityStore(max_entities=2, size_of=size_of)
+    store.add_all([entity("urn:a"), entity("urn:b"), entity("urn:c")])
+
+    assert "urn:a" not in store and len(store) == 2 and store.size == 0
+
+
+def test_entities_too_large_or_without_urn_are_not_stored():
+    store = EntityStore(max_bytes=200)
+
+    store.add(entity("urn:big", text="x" * 500))
+    store.add({"$type": "com.linkedin.voyager.common.Me"})
+
+    assert len(store) == 0 and store.size == 0
+    assert entity_size({"a": ["bc"]}) > entity_size({"a": []})
+
+
+def test_references_resolve_to_stored_entities():
+    store = EntityStore()
+    company = entity("urn:li:company:1", name="Linkedin", **{"*logo": "urn:li:logo:1"})
+    store.add_all([company, entity("urn:li:logo:1", url="logo.png")])
+    update = {
+        "entityUrn": "urn:li:update:1",
+        "actor": {"*company": "urn:li:company:1"},
+        "*mentions": ["urn:li:company:1", "urn:li:company:1"],
+        "*unknown": "urn:li:company:2",
+    }
+
+    resolved = store.resolve(update)
+
+    assert resolved["actor"]["company"]["name"] == "Linkedin"
+    assert "logo" not in resolved["actor"]["company"]
+    assert [c["entityUrn"] for c in resolved["mentions"]] == ["urn:li:company:1"] * 2
+    assert "unknown" not in resolved
+    assert (
+        store.resolve(update, depth=2)["actor"]["company"]["logo"]["url"] == "logo.png"
+    )
+    assert "logo" not in company and "company" not in update["actor"]
+
+
+def test_job_searches_fill_the_store(make_api):
+    body = payloads.job_search_page(100)
+    urns = [e["entityUrn"] for e in body["included"]]
+    postings = [e["entityUrn"] for e in body["included"] if "posterId" in e]
+    store = EntityStore()
+    api, _ = make_api(answers=[body], entity_store=store)
+    streamed_store = EntityStore()
+    streamed_api, _ = make_api(
+        answers=[body], entity_store=streamed_store, stream_included=True
+    )
+
+    jobs = api.search_jobs(keywords="python", limit=25)
+    streamed_api.search_jobs(keywords="python", limit=25)
+
+    assert set(urns) == {urn for urn in urns if urn in store}
+    assert store.get(postings[0]) is jobs[0]
+    # streaming only decodes the job postings
+    assert [urn for urn in urns if urn in streamed_store] == postings
+
+
+def test_normalized_getters_fill_the_store(make_api):
+    network_info = {
+        "data": {"*entityUrn": "urn:li:fs_profileNetworkInfo:billy", "distance": 2},
+        "included": [entity("urn:li:fs_profileNetworkInfo:billy", followable=True)],
+    }
+    store = EntityStore()
+    api, _ = make_api(answers=[network_info], entity_store=store)
+
+    data = api.get_profile_network_info("billy-g")
+
+    assert store.resolve(data)["entityUrn"]["followable"] is True
+
+
+def test_async_feed_fills_the_store(make_async_api):
+    import httpx
+
+    body = payloads.to_bytes(payloads.feed_page(20))
+    store = EntityStore()
+    api = make_async_api(
+        lambda request: httpx.Response(200, content=body), entity_store=store
+    )
+
+    posts = asyncio.run(api.get_feed_posts(limit=20))
+
+    data = payloads.feed_page(20)["data"]
+    updates = store.resolve(data)["elements"]
+    assert len(updates) == 20
+    assert {p["url"].split("/")[-1] for p in posts} <= {
+        u["updateMetadata"]["urn"] for u in updates
+    }
@@ -2,7 +2,7 @@ import os
 import sys
 import pytest
 
-from linkedin_api import Linkedin
+from linkedin_api import Cassette, Linkedin
 from linkedin_api.utils.helpers import get_id_from_urn
 
 TEST_LINKEDIN_USERNAME = os.getenv("LINKEDIN_USERNAME")
@@ -10,10 +10,12 @@ TEST_LINKEDIN_PASSWORD = os.getenv("LINKEDIN_PASSWORD")
 TEST_PROFILE_ID = os.getenv("TEST_PROFILE_ID")
 TEST_PUBLIC_PROFILE_ID = os.getenv("TEST_PUBLIC_PROFILE_ID")
 TEST_CONVERSATION_ID = os.getenv("TEST_CONVERSATION_ID")
+# record to this cassette when it does not exist yet, replay it offline otherwise
+TEST_CASSETTE = os.getenv("LINKEDIN_CASSETTE")
+TEST_REPLAY = bool(TEST_CASSETTE) and os.path.exists(TEST_CASSETTE)
 
 if not (
-    TEST_LINKEDIN_USERNAME
-    and TEST_LINKEDIN_PASSWORD
+    (TEST_REPLAY or (TEST_LINKEDIN_USERNAME and TEST_LINKEDIN_PASSWORD))
     and TEST_PROFILE_ID
     and TEST_PUBLIC_PROFILE_ID
     and TEST_CONVERSATION_ID
@@ -24,9 +26,21 @@ if not (
 
 @pytest.fixture(scope="module")
 def linkedin():
-    return Linkedin(
-        TEST_LINKEDIN_USERNAME, TEST_LINKEDIN_PASSWORD, refresh_cookies=True
-    )
+    if not TEST_CASSETTE:
+        yield Linkedin(
+            TEST_LINKEDIN_USERNAME, TEST_LINKEDIN_PASSWORD, refresh_cookies=True
+        )
+        return
+
+    mode = "replay" if TEST_REPLAY else "record"
+    with Cassette(TEST_CASSETTE, mode=mode) as cassette:
+        yield Linkedin(
+            TEST_LINKEDIN_USERNAME or "",
+            TEST_LINKEDIN_PASSWORD or "",
+            authenticate=not TEST_REPLAY,
+            refresh_cookies=True,
+            cassette=cassette,
+        )
 
 
 def test_get_profile(linkedin):
@@ -0,0 +1,43 @@
+import json
+import pytest
+
+from linkedin_api.meta_tags import MetaTagScanner, parse_attributes
+
+NAMES = ("applicationInstance", "clientPageInstanceId")
+INSTANCE = {"applicationUrn": "urn:li:fs_application:(voyager-web)", "version": "1.2"}
+PAGE = (
+    "<!DOCTYPE html><html><head><metadata>ignored</metadata>"
+    '<meta name="description" content="LinkedIn">'
+    f'<META content="{json.dumps(INSTANCE).replace(chr(34), "&quot;")}" '
+    'name="applicationInstance">'
+    "<meta name='clientPageInstanceId' content='ab&amp;cd'/>"
+    "</head><body>"
+).encode() + b"<div>" * 10000
+
+
+def test_parse_attributes():
+    assert parse_attributes(
+        """<meta NAME="a" content='b &lt;c&gt;' data-x=y async>"""
+    ) == {"name": "a", "content": "b <c>", "data-x": "y"}
+
+
+@pytest.mark.parametrize("size", [1, 5, 64, len(PAGE)])
+def test_scanner_stops_once_every_tag_is_found(size):
+    scanner = MetaTagScanner(NAMES)
+
+    read = 0
+    for start in range(0, len(PAGE), size):
+        read += size
+        if scanner.feed(PAGE[start : start + size]):
+            break
+
+    assert json.loads(scanner.found["applicationInstance"]) == INSTANCE
+    assert scanner.found["clientPageInstanceId"] == "ab&cd"
+    assert read < len(PAGE) / 10 or size == len(PAGE)
+
+
+def test_scanner_reports_missing_tags():
+    scanner = MetaTagScanner(NAMES)
+
+    assert not scanner.feed(b'<meta name="clientPageInstanceId" content="p"><body>')
+    assert scanner.found == {"clientPageInstanceId": "p"}
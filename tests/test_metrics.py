@@ -0,0 +1,89 @@
+import pytest
+
+from linkedin_api import MetricsRegistry
+from linkedin_api.metrics import endpoint_template
+
+
+@pytest.mark.parametrize(
+    "uri, expected",
+    [
+        (
+            "/identity/profiles/billy-g/profileView",
+            "/identity/profiles/{id}/profileView",
+        ),
+        (
+            "https://www.linkedin.com/voyager/api/identity/profiles/ACoAA/skills?count=100",
+            "/identity/profiles/{id}/skills",
+        ),
+        (
+            "/graphql?variables=(start:0,origin:GLOBAL_SEARCH_HEADER)&queryId=voyagerSearchDashClusters.b0928897",
+            "/graphql?queryId=voyagerSearchDashClusters",
+        ),
+        (
+            "/messaging/conversations/2-abc==/events",
+            "/messaging/conversations/{id}/events",
+        ),
+        (
+            "/voyagerAssessmentsDashJobSkillMatchInsight/urn%3Ali%3Afsd_jobSkillMatchInsight%3A123",
+            "/voyagerAssessmentsDashJobSkillMatchInsight/{id}",
+        ),
+        ("/me", "/me"),
+    ],
+)
+def test_endpoint_template(uri, expected):
+    assert endpoint_template(uri) == expected
+
+
+def test_snapshot_and_prometheus():
+    metrics = MetricsRegistry(buckets=(0.1, 1))
+    metrics.record_response("get", "/me", 200, 10)
+    metrics.record_response("GET", "/me", 429, 5)
+    metrics.record_error("GET", "/me")
+    metrics.observe("network", "GET", "/me", 0.5)
+
+    snapshot = metrics.snapshot()["GET /me"]
+
+    assert snapshot["requests"] == 3
+    assert snapshot["errors"] == 1
+    assert snapshot["bytes"] == 15
+    assert snapshot["status_codes"] == {200: 1, 429: 1}
+    assert snapshot["network_seconds"] == {
+        "count": 1,
+        "sum": 0.5,
+        "buckets": {0.1: 0, 1: 1},
+    }
+
+    text = metrics.to_prometheus()
+    assert (
+        'linkedin_api_requests_total{method="GET",endpoint="/me",status="429"} 1'
+        in text
+    )
+    assert (
+        'linkedin_api_network_seconds_bucket{method="GET",endpoint="/me",le="+Inf"} 1'
+        in text
+    )
+    assert "# TYPE linkedin_api_decode_seconds histogram" in text
+
+
+def test_linkedin_records_evade_network_and_decode(make_api, clock):
+    metrics = MetricsRegistry(clock=clock)
+
+    def respond(request):
+        clock.now += 0.25
+        return {"elements": []}
+
+    api, adapter = make_api(respond, metrics=metrics)
+
+    def evade():
+        clock.now += 3
+
+    res = api._fetch("/identity/profiles/billy-g/skills", evade=evade)
+    api._decode(res)
+
+    snapshot = metrics.snapshot()["GET /identity/profiles/{id}/skills"]
+    assert snapshot["requests"] == 1
+    assert snapshot["status_codes"] == {200: 1}
+    assert snapshot["bytes"] == len(b'{"elements": []}')
+    assert snapshot["evade_seconds"]["sum"] == 3
+    assert snapshot["network_seconds"]["sum"] == 0.25
+    assert snapshot["decode_seconds"]["count"] == 1
@@ -0,0 +1,120 @@
+import json
+import pickle
+import random
+import tracemalloc
+from urllib.parse import unquote
+import pytest
+
+from benchmarks import payloads
+from linkedin_api.models import FeedPost, JobCard, LazyProfile, PersonResult
+
+
+@pytest.fixture(autouse=True)
+def no_evade(monkeypatch):
+    monkeypatch.setattr(random, "randint", lambda a, b: 0)
+
+
+def allocated(build):
+    """Return the bytes allocated by `build` and still held by its result."""
+    tracemalloc.start()
+    kept = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size
+
+
+def test_compact_search_people_matches_dicts(make_api):
+    body = payloads.search_page(49)
+    api, _ = make_api(lambda request: body, compact_results=True)
+    dict_api, _ = make_api(lambda request: body)
+
+    people = api.search_people(keywords="python", limit=49)
+
+    assert all(type(person) is PersonResult for person in people)
+    assert people == dict_api.search_people(keywords="python", limit=49)
+    assert people[0]["name"] == people[0].name
+    assert json.loads(json.dumps(people[0].to_dict())) == dict(people[0])
+    assert pickle.loads(pickle.dumps(people[0])) == people[0]
+    with pytest.raises(KeyError):
+        people[0]["raw"]
+
+
+def test_compact_people_use_less_memory(make_api):
+    api, _ = make_api(compact_results=True)
+    raw = payloads.to_bytes(payloads.search_page(49))
+
+    def parse(api):
+        return lambda: [
+            api._parse_people_results(api._parse_search_page(json.loads(raw)))
+            for _ in range(20)
+        ]
+
+    dict_api, _ = make_api()
+    assert allocated(parse(api)) < allocated(parse(dict_api)) * 0.6
+
+
+def test_job_cards_decode_other_fields_on_access(make_api):
+    body = payloads.job_search_page(100)
+    api, _ = make_api(lambda request: body, compact_results=True)
+    dict_api, _ = make_api(lambda request: body)
+
+    jobs = api.search_jobs(keywords="python", limit=25)
+
+    assert jobs == dict_api.search_jobs(keywords="python", limit=25)
+    job = jobs[0]
+    assert isinstance(job, JobCard)
+    assert job["entityUrn"].startswith(JobCard.URN_PREFIX)
+    assert job._urn_id == job["entityUrn"].split(":")[-1]
+    assert job["posterId"] == json.loads(job._source)["posterId"]
+    assert list(job) == ["$type", "entityUrn", "title", *json.loads(job._source)]
+
+    other = JobCard.from_dict({"entityUrn": "urn:li:fs_normalized_jobPosting:1"})
+    assert other.to_dict() == {"entityUrn": "urn:li:fs_normalized_jobPosting:1"}
+
+
+def test_compact_feed_posts_intern_their_authors(make_api):
+    body = payloads.feed_page(50, promoted_ratio=0.2)
+    api, _ = make_api(lambda request: body, compact_results=True)
+    dict_api, _ = make_api(lambda request: body)
+
+    posts = api.get_feed_posts(limit=50)
+
+    assert all(isinstance(post, FeedPost) for post in posts)
+    assert posts == dict_api.get_feed_posts(limit=50)
+    olds = [post["old"] for post in posts if post["old"].startswith("1h")]
+    assert len(olds) > 1 and all(old is olds[0] for old in olds)
+
+
+def test_lazy_profile_matches_the_massaged_profile(make_api):
+    api, _ = make_api()
+    raw = payloads.to_bytes(payloads.profile_view(90))
+
+    profile = api._parse_profile(json.loads(raw), lazy=True)
+
+    assert isinstance(profile, LazyProfile)
+    assert profile == api._parse_profile(json.loads(raw))
+    assert list(profile) == list(api._parse_profile(json.loads(raw)))
+    assert json.loads(json.dumps(profile.to_dict())) == profile.to_dict()
+
+
+def test_lazy_profile_massages_sections_when_read(make_api):
+    decoded = []
+
+    def decoder(raw: bytes):
+        decoded.append(json.loads(raw))
+        return decoded[-1]
+
+    posts = {"metadata": {"paginationToken": ""}, "elements": [{"n": 1}]}
+    api, adapter = make_api(
+        answers=[payloads.profile_view(90), posts], json_decoder=decoder
+    )
+
+    assert api.get_profile_posts(public_id="billy-g", post_count=1) == [{"n": 1}]
+    assert "fsd_profile:ACoAABQ11fIB" in unquote(adapter.requests[1].url)
+    # resolving the URN left the sections of the profile untouched
+    assert "entityUrn" in decoded[0]["skillView"]["elements"][0]
+
+    profile = LazyProfile(payloads.profile_view(90))
+    assert "entityUrn" not in profile["skills"][0]
+    assert profile.section("skills") is profile["skills"]
+    assert "entityUrn" in profile._data["languageView"]["elements"][0]
@@ -0,0 +1,251 @@
+import asyncio
+import json
+import random
+import re
+import sys
+import threading
+from urllib.parse import unquote
+import pytest
+
+from benchmarks import payloads
+from linkedin_api.pagination import next_pages
+
+
+def search_results(total, per_page=49):
+    """Answer searches with `total` results, `per_page` per page."""
+
+    def respond(request):
+        start = int(re.search(r"start:(\d+)", unquote(str(request.url))).group(1))
+        return payloads.search_page(max(0, min(per_page, total - start)), seed=start)
+
+    return respond
+
+
+def comment_pages(pages):
+    """Answer `/feed/comments` with `pages` pages of two comments."""
+
+    def respond(request):
+        start = int(re.search(r"start=(\d+)", request.url).group(1)) // 100
+        last = start == pages - 1
+        return {
+            "metadata": {"paginationToken": "" if last else f"t{start + 1}"},
+            "elements": [{"n": 2 * start}, {"n": 2 * start + 1}],
+            "paging": {"start": start},
+        }
+
+    return respond
+
+
+@pytest.fixture(autouse=True)
+def no_evade(monkeypatch):
+    monkeypatch.setattr(random, "randint", lambda a, b: 0)
+
+
+def test_iter_search_yields_each_page_before_fetching_the_next(make_api):
+    api, adapter = make_api(search_results(60))
+
+    pages = api.iter_search({"keywords": "python"})
+    first = next(pages)
+
+    assert len(adapter.requests) == 1
+    assert (len(first), first.start, first.next_start) == (49, 0, 49)
+    rest = list(pages)
+    assert [(len(p), p.start, p.next_start) for p in rest] == [(11, 49, 60)]
+    assert [r for p in [first, *rest] for r in p] == api.search({"keywords": "python"})
+
+
+def test_iter_search_resumes_from_a_page_position(make_api):
+    api, adapter = make_api(search_results(60))
+    first = next(api.iter_search({"keywords": "python"}, limit=55))
+
+    resumed = list(
+        api.iter_search({"keywords": "python"}, limit=6, offset=first.next_start)
+    )
+
+    assert [(len(p), p.start, p.next_start) for p in resumed] == [(11, 49, 60)]
+    assert "start:49," in adapter.requests[-1].url
+
+
+def test_search_drops_results_when_a_page_is_not_a_search_response(make_api):
+    api, _ = make_api(answers=[payloads.search_page(49), {"data": {}}])
+
+    assert api.search({"keywords": "python"}) == []
+
+
+def test_iter_post_comments_exposes_the_pagination_token(make_api):
+    api, adapter = make_api(comment_pages(3))
+
+    pages = list(api.iter_post_comments("123", comment_count=10))
+
+    assert [[c["n"] for c in page] for page in pages] == [[0, 1], [2, 3], [4, 5]]
+    assert [(p.start, p.next_start, p.pagination_token) for p in pages] == [
+        (0, 100, "t1"),
+        (100, 200, "t2"),
+        (200, 300, ""),
+    ]
+
+    resumed = api.iter_post_comments("123", start=100, pagination_token="t1")
+    assert [c["n"] for page in resumed for c in page] == [2, 3, 4, 5]
+    assert "paginationToken=t1" in adapter.requests[-2].url
+
+
+def test_get_post_comments_keeps_failure_result(make_api):
+    api, _ = make_api(answers=[{"status": 500}])
+
+    assert api.get_post_comments("123") == [{}]
+
+
+def test_async_iter_search_yields_pages(make_async_api):
+    import httpx
+
+    respond = search_results(60)
+    api = make_async_api(
+        lambda request: httpx.Response(
+            200, content=json.dumps(respond(request)).encode()
+        )
+    )
+
+    async def pages():
+        return [
+            (len(page), page.start)
+            async for page in api.iter_search({"keywords": "python"})
+        ]
+
+    assert asyncio.run(pages()) == [(49, 0), (11, 49)]
+    assert len(asyncio.run(api.search({"keywords": "python"}))) == 60
+
+
+def test_next_pages_stops_at_the_end():
+    assert next_pages(0, 49, 2) == [(49, 49), (98, 49)]
+    assert next_pages(0, 49, 3, end=100) == [(49, 49), (98, 2)]
+    assert next_pages(0, 49, 0) == []
+
+
+def test_prefetch_fetches_the_next_page_while_one_is_consumed(make_api):
+    respond = search_results(150)
+    second_page_requested = threading.Event()
+
+    def recording(request):
+        if "start:49," in unquote(request.url):
+            second_page_requested.set()
+        return respond(request)
+
+    api, adapter = make_api(recording)
+
+    pages = api.iter_search({"keywords": "python"}, prefetch=1)
+    next(pages)
+
+    assert second_page_requested.wait(timeout=5)
+    results = [r for p in [*pages] for r in p]
+    assert len(results) == 150 - 49
+    assert api.search({"keywords": "python"}, prefetch=2) == api.search(
+        {"keywords": "python"}
+    )
+
+
+def test_prefetch_throws_away_wrongly_guessed_pages(make_api):
+    api, adapter = make_api(search_results(60))
+
+    pages = list(api.iter_search({"keywords": "python"}, prefetch=1))
+
+    assert [(p.start, p.next_start) for p in pages] == [(0, 49), (49, 60)]
+    starts = {
+        int(re.search(r"start:(\d+)", unquote(r.url)).group(1))
+        for r in adapter.requests
+    }
+    # the first page was full, so the second page was guessed to be too,
+    # but the results ended at 60: the page fetched from 98 is not used
+    assert {0, 49, 60} <= starts <= {0, 49, 60, 98, 109}
+    assert [r for p in pages for r in p] == api.search({"keywords": "python"})
+
+
+def test_prefetch_follows_the_page_size_linkedin_picks(make_api):
+    # search URIs don't send the count, and Linkedin answers 10 results a page
+    api, adapter = make_api(search_results(60, per_page=10))
+
+    def starts():
+        return sorted(
+            int(re.search(r"start:(\d+)", unquote(r.url)).group(1))
+            for r in adapter.requests
+        )
+
+    pages = list(api.iter_search({"keywords": "python"}, prefetch=1))
+
+    assert [p.start for p in pages] == [0, 10, 20, 30, 40, 50]
+    assert starts() == [0, 10, 20, 30, 40, 50, 60]
+    adapter.requests.clear()
+    prefetched = api.search({"keywords": "python"}, prefetch=3)
+    # the guesses past the end of the results are the only wasted requests
+    assert set(starts()) <= set(range(0, 90, 10))
+    assert prefetched == api.search({"keywords": "python"})
+
+
+def test_async_prefetch_matches_sequential_search(make_async_api):
+    import httpx
+
+    respond = search_results(150)
+    api = make_async_api(
+        lambda request: httpx.Response(
+            200, content=json.dumps(respond(request)).encode()
+        )
+    )
+
+    async def search():
+        return (
+            await api.search({"keywords": "python"}, prefetch=2),
+            await api.search({"keywords": "python"}),
+        )
+
+    prefetched, sequential = asyncio.run(search())
+    assert len(prefetched) == 150 and prefetched == sequential
+
+
+def updates(total, per_page=100):
+    """Answer `/feed/updates` with `total` updates, `per_page` per page."""
+
+    def respond(request):
+        start = int(re.search(r"start=(\d+)", str(request.url)).group(1))
+        return {
+            "elements": [{"n": n} for n in range(start, min(total, start + per_page))]
+        }
+
+    return respond
+
+
+def test_company_updates_crawl_resumes_from_its_cursor(make_api):
+    api, adapter = make_api(updates(250))
+    crawl = api.iter_company_updates("linkedin")
+    done = [next(crawl), next(crawl)]
+    crawl.close()
+    cursor = json.loads(json.dumps(done[-1].next_start))
+
+    resumed = list(api.iter_company_updates("linkedin", start=cursor))
+
+    assert cursor == 200
+    assert [u["n"] for page in done + resumed for u in page] == list(range(250))
+    assert api.get_company_updates("linkedin") == [{"n": n} for n in range(250)]
+
+
+def test_updates_crawl_does_not_recurse(make_api):
+    pages = sys.getrecursionlimit() + 100
+    api, adapter = make_api(updates(pages, per_page=1))
+
+    assert len(api.get_profile_updates("tom", max_results=pages - 10)) == pages - 10
+    assert len(adapter.requests) == pages - 10
+
+
+def test_async_company_updates_crawl(make_async_api):
+    import httpx
+
+    respond = updates(250)
+    api = make_async_api(
+        lambda request: httpx.Response(
+            200, content=json.dumps(respond(request)).encode()
+        )
+    )
+
+    async def crawl():
+        return [page.start async for page in api.iter_company_updates("linkedin")]
+
+    assert asyncio.run(crawl()) == [0, 100, 200]
+    assert len(asyncio.run(api.get_company_updates("linkedin"))) == 250
@@ -0,0 +1,129 @@
+import asyncio
+import logging
+import random
+import re
+from urllib.parse import unquote
+import pytest
+
+from linkedin_api.partitioned_search import SearchPartition
+
+CAP = 10
+PAGE_SIZE = 5
+# (region, industry) of each member, the members of r3 last
+MEMBERS = (
+    [("r0", "i0")] * 8
+    + [("r0", "i1")] * 8
+    + [("r1", "i0")] * 9
+    + [("r2", "i1")] * 5
+    + [("r3", "i0")] * 12
+)
+
+
+@pytest.fixture(autouse=True)
+def no_evade(monkeypatch):
+    monkeypatch.setattr(random, "randint", lambda a, b: 0)
+
+
+def search_response(url: str):
+    """Answer a people search of MEMBERS, stopping at CAP results like Linkedin."""
+    url = unquote(url)
+    start = int(re.search(r"start:(\d+)", url).group(1))
+    facets = {}
+    for key, value in re.findall(r"key:(geoUrn|industry),value:List\(([^)]*)\)", url):
+        facets[key] = value.split(" | ")
+    matches = [
+        i
+        for i, (region, industry) in enumerate(MEMBERS)
+        if region in facets.get("geoUrn", [region])
+        and industry in facets.get("industry", [industry])
+    ]
+    items = [
+        {
+            "_type": "com.linkedin.voyager.dash.search.SearchItem",
+            "item": {
+                "entityResult": {
+                    "_type": "com.linkedin.voyager.dash.search.EntityResultViewModel",
+                    "entityUrn": f"urn:li:fsd_entityResultViewModel:(urn:li:fsd_profile:m{i},SEARCH_SRP,DEFAULT)",
+                    "title": {"text": f"Member {i}"},
+                }
+            },
+        }
+        for i in matches[:CAP][start : start + PAGE_SIZE]
+    ]
+    return {
+        "data": {
+            "searchDashClustersByAll": {
+                "_type": "com.linkedin.restli.common.CollectionResponse",
+                "elements": [
+                    {
+                        "_type": "com.linkedin.voyager.dash.search.SearchClusterViewModel",
+                        "items": items,
+                    }
+                ],
+            }
+        }
+    }
+
+
+def test_capped_partitions_are_refined_and_people_deduped(make_api, caplog):
+    api, adapter = make_api(lambda request: search_response(request.url))
+    partition_by = {"regions": ["r0", "r1", "r2", "r3"], "industries": ["i0", "i1"]}
+
+    with caplog.at_level(logging.WARNING):
+        people = api.search_people_partitioned(
+            partition_by, max_concurrency=3, cap=CAP, keywords="python"
+        )
+
+    urn_ids = [person["urn_id"] for person in people]
+    assert len(urn_ids) == len(set(urn_ids))
+    # only the 2 members of r3 past the cap of its last partition are missed
+    assert set(urn_ids) == {f"m{i}" for i in range(len(MEMBERS) - 2)}
+    searched = {
+        tuple(re.findall(r"key:(?:geoUrn|industry),value:List\((\w+)\)", url))
+        for url in map(unquote, (request.url for request in adapter.requests))
+    }
+    # r1 and r2 are under the cap, and are not split by industry
+    assert searched == {
+        (),
+        ("r0",),
+        ("r1",),
+        ("r2",),
+        ("r3",),
+        ("r0", "i0"),
+        ("r0", "i1"),
+        ("r3", "i0"),
+        ("r3", "i1"),
+    }
+    assert "{'regions': 'r3'} has" not in caplog.text
+    assert "'industries': 'i0'} has too many results" in caplog.text
+    assert SearchPartition().refine({}) == []
+
+
+def test_partitions_must_be_search_facets(make_api):
+    api, _ = make_api()
+
+    with pytest.raises(ValueError):
+        api.search_people_partitioned({"current_company": ["1"]})
+    with pytest.raises(ValueError):
+        api.search_people_partitioned({"regions": ["r0"]}, regions=["r1"])
+    with pytest.raises(ValueError):
+        api.search_people_partitioned({"network_depths": ["F"]}, network_depth="S")
+
+
+def test_async_partitioned_search(make_async_api):
+    import httpx
+
+    api = make_async_api(
+        lambda request: httpx.Response(200, json=search_response(str(request.url))),
+        compact_results=True,
+    )
+
+    people = asyncio.run(
+        api.search_people_partitioned(
+            {"regions": ["r0", "r1", "r2"], "industries": ["i0", "i1"]}, cap=CAP
+        )
+    )
+
+    assert sorted(person["urn_id"] for person in people) == sorted(
+        f"m{i}" for i in range(30)
+    )
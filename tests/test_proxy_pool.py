@@ -0,0 +1,169 @@
+import asyncio
+import json
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+import requests
+
+from linkedin_api import Linkedin, ProxyPool
+
+
+class MockProxy(object):
+    """
+    A local HTTP proxy answering every request itself, with `status` after
+    `delay` seconds, and recording the URLs it was asked for.
+    """
+
+    def __init__(self, status=200, delay=0.0):
+        self.status = status
+        self.delay = delay
+        self.paths = []
+        proxy = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                proxy.paths.append(self.path)
+                time.sleep(proxy.delay)
+                body = json.dumps({"proxy": proxy.url}).encode()
+                self.send_response(proxy.status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_port}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def mock_proxy():
+    proxies = []
+
+    def make(**kwargs):
+        proxies.append(MockProxy(**kwargs))
+        return proxies[-1]
+
+    yield make
+    for proxy in proxies:
+        proxy.close()
+
+
+def closed_port_url():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return f"http://127.0.0.1:{sock.getsockname()[1]}"
+
+
+def test_untried_then_fastest_proxies_are_picked_first(clock):
+    pool = ProxyPool(["http://a", "http://b", "http://c"], clock=clock)
+    pool.record("http://a", 0.5, 200)
+    pool.record("http://b", 0.1, 200)
+
+    assert pool.acquire() == "http://c"
+    pool.record("http://c", 0.3, 200)
+    assert pool.acquire() == "http://b"
+    assert [s.url for s in pool.stats()] == ["http://b", "http://c", "http://a"]
+
+
+def test_errors_and_throttling_lower_the_score(clock):
+    pool = ProxyPool(["http://a", "http://b"], clock=clock)
+    pool.record("http://a", 0.1, 429)
+    pool.record("http://b", 0.1, error=requests.ConnectionError())
+
+    assert pool.score("http://a") == pytest.approx(0.1 + 0.2 * 5)
+    assert pool.score("http://b") == pytest.approx(0.1 + 0.2 * 10)
+    assert pool.acquire() == "http://a"
+
+
+def test_sessions_stick_to_their_proxy_until_quarantined(clock):
+    pool = ProxyPool(["http://a", "http://b"], max_failures=2, cooldown=60, clock=clock)
+
+    alice = pool.acquire("alice")
+    bob = pool.acquire("bob")
+    assert alice != bob
+    pool.record(bob, 0.01, 200)
+    pool.record(alice, 2.0, 200)
+    assert pool.acquire("alice") == alice
+
+    pool.record(alice, 0.1, 429)
+    pool.record(alice, 0.1, 429)
+    assert pool.healthy() == [bob]
+    assert pool.acquire("alice") == bob
+
+    clock.now += 60
+    assert sorted(pool.healthy()) == ["http://a", "http://b"]
+    assert pool.acquire("alice") == bob
+
+
+def test_the_first_proxy_out_of_quarantine_is_used_when_all_are(clock):
+    pool = ProxyPool(["http://a", "http://b"], max_failures=1, cooldown=60, clock=clock)
+    pool.record("http://a", 0.1, 429)
+    clock.now += 10
+    pool.record("http://b", 0.1, 429)
+
+    assert pool.healthy() == []
+    assert pool.acquire() == "http://a"
+
+
+def test_linkedin_requests_rotate_away_from_a_throttled_proxy(mock_proxy, monkeypatch):
+    import random
+
+    monkeypatch.setattr(random, "randint", lambda a, b: 0)
+    throttled = mock_proxy(status=429)
+    good = mock_proxy()
+    pool = ProxyPool([throttled.url, good.url])
+    api = Linkedin("test", "test", authenticate=False, proxy_pool=pool)
+    api.client.API_BASE_URL = "http://linkedin.test/voyager/api"
+
+    statuses = [api._fetch(f"/me?n={n}").status_code for n in range(6)]
+
+    assert statuses == [429, 429, 429, 200, 200, 200]
+    assert len(throttled.paths) == 3
+    assert good.paths == [
+        f"http://linkedin.test/voyager/api/me?n={n}" for n in range(3, 6)
+    ]
+    assert pool.healthy() == [good.url]
+
+
+def test_connection_errors_are_recorded(mock_proxy):
+    dead = closed_port_url()
+    good = mock_proxy()
+    pool = ProxyPool([dead, good.url], max_failures=1)
+    session = requests.Session()
+    session.mount("http://", pool.adapter(session.get_adapter("http://")))
+
+    with pytest.raises(requests.ConnectionError):
+        session.get("http://linkedin.test/")
+    assert session.get("http://linkedin.test/").json() == {"proxy": good.url}
+    assert pool.healthy() == [good.url]
+
+
+def test_async_requests_go_through_the_pool(mock_proxy, no_async_evade):
+    pytest.importorskip("httpx")
+    from linkedin_api import AsyncLinkedin
+
+    slow = mock_proxy(delay=0.2)
+    fast = mock_proxy()
+    pool = ProxyPool([slow.url, fast.url])
+    pool.record(slow.url, 0.2, 200)
+
+    async def fetch():
+        api = AsyncLinkedin("test", "test", authenticate=False, proxy_pool=pool)
+        api.client.API_BASE_URL = "http://linkedin.test/voyager/api"
+        async with api:
+            res = await api._fetch("/me", evade=no_async_evade)
+        return res.json()
+
+    assert asyncio.run(fetch()) == {"proxy": fast.url}
+    assert fast.paths == ["http://linkedin.test/voyager/api/me"]
+    assert slow.paths == []
@@ -0,0 +1,114 @@
+import asyncio
+import pytest
+
+from linkedin_api import Linkedin
+from linkedin_api.linkedin import default_evade
+from linkedin_api.rate_limiter import RateLimiter, TokenBucket
+from linkedin_api.utils.helpers import get_endpoint_family
+
+
+def test_bucket_allows_burst_then_waits(clock):
+    bucket = TokenBucket(rate=2, burst=3, clock=clock)
+
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert bucket.reserve() == pytest.approx(0.5)
+    assert bucket.reserve() == pytest.approx(1.0)
+
+
+def test_bucket_refills_up_to_burst(clock):
+    bucket = TokenBucket(rate=1, burst=2, clock=clock)
+    bucket.reserve()
+    bucket.reserve()
+
+    clock.now += 10
+
+    assert bucket.tokens == 2
+
+
+def test_bucket_jitter_only_applies_to_waits(clock):
+    bucket = TokenBucket(rate=1, burst=1, jitter=0.5, clock=clock)
+
+    assert bucket.reserve() == 0.0
+    assert 1.0 <= bucket.reserve() <= 1.5
+
+
+def test_limiter_paces_per_family(clock):
+    limiter = RateLimiter(
+        {
+            "search": {"rate": 1, "burst": 1, "jitter": 0},
+            "profile": {"rate": 1, "burst": 5, "jitter": 0},
+        },
+        clock=clock,
+        sleep=clock.sleep,
+    )
+
+    for _ in range(3):
+        limiter.acquire("search")
+    for _ in range(3):
+        limiter.acquire("profile")
+
+    assert clock.sleeps == [1.0, 1.0]
+    assert limiter.remaining("profile") == pytest.approx(2)
+
+
+def test_limiter_unknown_family_uses_default():
+    limiter = RateLimiter()
+
+    assert limiter.bucket("nope") is limiter.bucket("default")
+
+
+def test_limiter_acquire_async(clock):
+    limiter = RateLimiter(
+        {"default": {"rate": 4, "burst": 1, "jitter": 0}},
+        clock=clock,
+        async_sleep=clock.async_sleep,
+    )
+
+    async def run():
+        for _ in range(3):
+            await limiter.acquire_async()
+
+    asyncio.run(run())
+
+    assert clock.sleeps == [0.25, 0.25]
+
+
+def test_linkedin_uses_rate_limiter_instead_of_evade(clock):
+    limiter = RateLimiter(
+        {"profile": {"rate": 1, "burst": 1, "jitter": 0}},
+        clock=clock,
+        sleep=clock.sleep,
+    )
+    api = Linkedin("test", "test", authenticate=False, rate_limiter=limiter)
+
+    api._pace("GET", "/identity/profiles/tom-quirk/profileView", default_evade)
+    api._pace("GET", "/identity/profiles/tom-quirk/profileView", default_evade)
+
+    assert clock.sleeps == [1.0]
+
+
+def test_linkedin_explicit_evade_bypasses_rate_limiter():
+    limiter = RateLimiter()
+    api = Linkedin("test", "test", authenticate=False, rate_limiter=limiter)
+    calls = []
+
+    api._pace("GET", "/me", lambda: calls.append(1))
+
+    assert calls == [1]
+    assert limiter.remaining("profile") == pytest.approx(10, abs=0.01)
+
+
+@pytest.mark.parametrize(
+    "method,uri,family",
+    [
+        ("GET", "/identity/profiles/tom-quirk/profileView", "profile"),
+        ("GET", "/graphql?variables=()&queryId=voyagerSearchDashClusters.b0", "search"),
+        ("GET", "/voyagerJobsDashJobCards?q=jobSearch", "search"),
+        ("GET", "/messaging/conversations", "messaging"),
+        ("POST", "/messaging/conversations", "messaging"),
+        ("POST", "/growth/normInvitations", "write"),
+        ("GET", "/organization/companies", "default"),
+    ],
+)
+def test_get_endpoint_family(method, uri, family):
+    assert get_endpoint_family(method, uri) == family
@@ -0,0 +1,99 @@
+import asyncio
+import pytest
+import requests
+from email.utils import formatdate
+
+from linkedin_api.retry import RetryPolicy, get_retry_after
+
+
+@pytest.fixture
+def make_retrying_api(make_api, clock):
+    def make(answers, **policy_kwargs):
+        policy = RetryPolicy(sleep=clock.sleep, jitter=0, **policy_kwargs)
+        return make_api(answers=answers, retry_policy=policy)
+
+    return make
+
+
+def test_get_retry_after_seconds_and_date():
+    assert get_retry_after({"Retry-After": "7"}) == 7
+    assert get_retry_after({}) is None
+    assert get_retry_after({"Retry-After": "soon"}) is None
+    in_a_minute = formatdate(timeval=None, usegmt=True)
+    assert 0 <= get_retry_after({"Retry-After": in_a_minute}) <= 1
+
+
+def test_backoff_is_exponential_and_capped():
+    policy = RetryPolicy(backoff_base=1, backoff_max=5, jitter=0)
+
+    assert [policy.backoff(i) for i in range(4)] == [1, 2, 4, 5]
+
+
+def test_retries_honor_retry_after(make_retrying_api, clock, no_evade):
+    api, adapter = make_retrying_api(
+        [(429, {}, {"Retry-After": "3"}), (503, {}), (200, {})]
+    )
+
+    res = api._fetch("/me", evade=no_evade)
+
+    assert res.status_code == 200
+    assert len(adapter.requests) == 3
+    assert clock.sleeps == [3, 2]
+
+
+def test_gives_up_after_budget(make_retrying_api, no_evade):
+    api, adapter = make_retrying_api(
+        [(500, {}), (500, {}), (500, {})], budgets={"profile": 1}
+    )
+
+    res = api._fetch("/me", evade=no_evade)
+
+    assert res.status_code == 500
+    assert len(adapter.requests) == 2
+
+
+def test_connection_errors_are_retried(make_retrying_api, clock, no_evade):
+    api, adapter = make_retrying_api([requests.ConnectionError("reset"), (200, {})])
+
+    res = api._fetch("/me", evade=no_evade)
+
+    assert res.status_code == 200
+    assert clock.sleeps == [1]
+
+
+def test_posts_are_not_replayed(make_retrying_api, clock, no_evade):
+    api, adapter = make_retrying_api([(503, {}), (200, {})])
+
+    res = api._post("/messaging/conversations", evade=no_evade, data="{}")
+
+    assert res.status_code == 503
+    assert len(adapter.requests) == 1
+    assert clock.sleeps == []
+
+
+def test_idempotent_posts_are_retried(make_retrying_api, no_evade):
+    api, adapter = make_retrying_api(
+        [(503, {}), (200, {})], idempotent_posts=["/li/track"]
+    )
+
+    res = api._post("/li/track", evade=no_evade, base_request=True)
+
+    assert res.status_code == 200
+
+
+def test_async_retries(make_async_api, clock, no_async_evade):
+    httpx = pytest.importorskip("httpx")
+    answers = [httpx.Response(429, headers={"Retry-After": "2"}), httpx.Response(200)]
+    api = make_async_api(
+        lambda request: answers.pop(0),
+        retry_policy=RetryPolicy(async_sleep=clock.async_sleep),
+    )
+
+    async def run():
+        async with api:
+            return await api._fetch("/me", evade=no_async_evade)
+
+    res = asyncio.run(run())
+
+    assert res.status_code == 200
+    assert clock.sleeps == [2]
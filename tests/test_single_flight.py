@@ -0,0 +1,104 @@
+import asyncio
+import threading
+import time
+import pytest
+
+from linkedin_api.single_flight import SingleFlight
+
+
+def wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+
+def run_threads(count, target):
+    results = [None] * count
+
+    def run(i):
+        results[i] = target()
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_single_flight_shares_one_call():
+    flight = SingleFlight()
+    calls = []
+
+    def fn():
+        calls.append(1)
+        wait_for(lambda: flight.coalesced == 3)
+        return [1, 2]
+
+    results = run_threads(4, lambda: flight.do("key", fn))
+
+    assert len(calls) == 1
+    assert results == [[1, 2]] * 4
+    assert len({id(r) for r in results}) == 4
+
+
+def test_single_flight_propagates_errors_and_forgets_calls():
+    flight = SingleFlight()
+
+    def fail():
+        raise KeyError("boom")
+
+    with pytest.raises(KeyError):
+        flight.do("key", fail)
+
+    assert flight.do("key", lambda: 1) == 1
+    assert flight.do("key", lambda: 2) == 2
+
+
+@pytest.mark.parametrize("coalesce, expected_requests", [(True, 1), (False, 4)])
+def test_concurrent_fetches_are_coalesced(make_api, coalesce, expected_requests):
+    api, adapter = make_api(
+        lambda request: {"elements": [{"n": len(adapter.requests)}]},
+        coalesce=coalesce,
+    )
+
+    def evade():
+        if coalesce:
+            wait_for(lambda: api._in_flight.coalesced == 3)
+
+    results = run_threads(
+        4, lambda: api._fetch("/organization/companies", evade=evade, params={"q": 1})
+    )
+
+    assert len(adapter.requests) == expected_requests
+    assert len({id(res) for res in results}) == 4
+    if coalesce:
+        assert all(res.json() == {"elements": [{"n": 1}]} for res in results)
+
+    api._fetch("/organization/companies", evade=lambda: None, params={"q": 1})
+    assert len(adapter.requests) == expected_requests + 1
+
+
+def test_async_concurrent_fetches_are_coalesced(make_async_api):
+    httpx = pytest.importorskip("httpx")
+    seen = []
+
+    def handler(request):
+        seen.append(request)
+        return httpx.Response(200, json={"n": len(seen)})
+
+    async def yielding_evade():
+        await asyncio.sleep(0)
+
+    api = make_async_api(handler)
+
+    async def run():
+        async with api:
+            return await asyncio.gather(
+                *(api._fetch("/me", evade=yielding_evade) for _ in range(5))
+            )
+
+    results = asyncio.run(run())
+
+    assert len(seen) == 1
+    assert [res.json() for res in results] == [{"n": 1}] * 5
@@ -0,0 +1,149 @@
+import asyncio
+import json
+import random
+import pytest
+
+import linkedin_api.async_linkedin
+import linkedin_api.linkedin
+from benchmarks import payloads
+from linkedin_api.streaming import AsyncStreamedPage, IncludedParser, StreamedPage
+
+BODY = json.dumps(
+    {
+        "data": {"*elements": ["a", "b"], "text": 'a "quoted" [bracket] {brace}'},
+        "included": [
+            {"id": 1, "actor": {"name": "x\\y"}},
+            {"id": 2, "nested": [[1, 2], {"deep": [3]}]},
+            'escaped " string ]',
+            12.5,
+            None,
+            {"id": 3, "actor": None},
+        ],
+        "meta": {"included": [1]},
+    }
+).encode()
+
+
+def chunked(body: bytes, size: int):
+    return [body[i : i + size] for i in range(0, len(body), size)]
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64, len(BODY)])
+def test_parser_matches_full_decode_for_any_chunking(size):
+    expected = json.loads(BODY)
+    parser = IncludedParser()
+
+    entities = []
+    for chunk in chunked(BODY, size):
+        entities.extend(parser.feed(chunk))
+
+    assert entities == expected.pop("included")
+    assert parser.close() == dict(expected, included=[])
+    assert parser.count == 6
+
+
+def test_parser_skips_entities_without_needles():
+    page = StreamedPage(chunked(BODY, 5), needles=(b'"actor"',))
+
+    assert [entity["id"] for entity in page] == [1, 3]
+    assert page.count == 6
+    assert page.data["data"]["*elements"] == ["a", "b"]
+
+
+def test_async_page_yields_entities_as_the_body_arrives():
+    sent = []
+
+    async def body():
+        for chunk in chunked(BODY, 5):
+            sent.append(chunk)
+            yield chunk
+
+    async def read(page):
+        # bytes of the body received by the time each entity is yielded
+        return [(entity["id"], len(b"".join(sent))) async for entity in page]
+
+    page = AsyncStreamedPage(body(), needles=(b'"actor"',))
+    received = asyncio.run(read(page))
+
+    assert [entity_id for entity_id, _ in received] == [1, 3]
+    assert received[0][1] < BODY.index(b'"nested"') + 5
+    assert page.count == 6 and page.data["data"]["*elements"] == ["a", "b"]
+
+
+def test_parser_rejects_truncated_response():
+    parser = IncludedParser()
+    parser.feed(BODY[: BODY.index(b"12.5")])
+
+    with pytest.raises(ValueError):
+        parser.close()
+
+
+def test_get_feed_posts_streamed_matches_decoded(monkeypatch, make_api):
+    monkeypatch.setattr(random, "randint", lambda a, b: 0)
+    monkeypatch.setattr(linkedin_api.linkedin, "STREAM_CHUNK_SIZE", 997)
+    body = payloads.to_bytes(payloads.feed_page(50, promoted_ratio=0.2))
+    decoded = []
+
+    def decoder(raw: bytes):
+        decoded.append(len(raw))
+        return json.loads(raw)
+
+    api, _ = make_api(lambda request: body)
+    streamed_api, adapter = make_api(
+        lambda request: body, stream_included=True, json_decoder=decoder
+    )
+
+    posts = api.get_feed_posts(limit=50)
+
+    assert streamed_api.get_feed_posts(limit=50) == posts
+    assert 0 < len(posts) < 50
+    assert len(adapter.requests) == 1
+    # each of the 50 updates, then the rest of the page; the filler is skipped
+    assert len(decoded) == 51 and max(decoded) < len(body) / 2
+
+
+def test_search_jobs_streamed_matches_decoded(monkeypatch, make_api):
+    monkeypatch.setattr(random, "randint", lambda a, b: 0)
+    monkeypatch.setattr(linkedin_api.linkedin, "STREAM_CHUNK_SIZE", 997)
+    body = payloads.to_bytes(payloads.job_search_page(100))
+    api, _ = make_api(lambda request: body)
+    streamed_api, _ = make_api(lambda request: body, stream_included=True)
+
+    jobs = api.search_jobs(keywords="python", limit=10)
+
+    assert streamed_api.search_jobs(keywords="python", limit=10) == jobs
+    assert jobs
+
+
+def test_async_search_jobs_streamed_matches_decoded(monkeypatch, make_async_api):
+    import httpx
+
+    monkeypatch.setattr(random, "randint", lambda a, b: 0)
+    monkeypatch.setattr(linkedin_api.async_linkedin, "STREAM_CHUNK_SIZE", 997)
+    body = payloads.to_bytes(payloads.job_search_page(100))
+    api = make_async_api(lambda request: httpx.Response(200, content=body))
+    streamed_api = make_async_api(
+        lambda request: httpx.Response(200, content=body), stream_included=True
+    )
+
+    jobs = asyncio.run(api.search_jobs(keywords="python", limit=10))
+
+    assert asyncio.run(streamed_api.search_jobs(keywords="python", limit=10)) == jobs
+    assert jobs
+
+
+def test_async_feed_streamed_matches_decoded(monkeypatch, make_async_api):
+    import httpx
+
+    monkeypatch.setattr(random, "randint", lambda a, b: 0)
+    monkeypatch.setattr(linkedin_api.async_linkedin, "STREAM_CHUNK_SIZE", 997)
+    body = payloads.to_bytes(payloads.feed_page(50, promoted_ratio=0.2))
+    api = make_async_api(lambda request: httpx.Response(200, content=body))
+    streamed_api = make_async_api(
+        lambda request: httpx.Response(200, content=body), stream_included=True
+    )
+
+    posts = asyncio.run(api.get_feed_posts(limit=50))
+
+    assert asyncio.run(streamed_api.get_feed_posts(limit=50)) == posts
+    assert posts
@@ -0,0 +1,85 @@
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+
+from linkedin_api.client import Client
+from linkedin_api.cookie_repository import CookieRepository, SQLiteCookieRepository
+from linkedin_api.transport import TransportConfig
+
+
+def login_flow(request):
+    """Answer the LinkedIn login flow."""
+    if request.method == "POST":
+        return {"login_result": "PASS"}
+    if request.url.endswith("/uas/authenticate"):
+        return b""
+    return b'<meta name="clientPageInstanceId" content="page-1">'
+
+
+def test_configure_session_mounts_sized_adapter():
+    session = requests.session()
+    TransportConfig(pool_connections=3, pool_maxsize=42).configure_session(session)
+
+    adapter = session.get_adapter("https://www.linkedin.com")
+
+    assert isinstance(adapter, HTTPAdapter)
+    assert adapter._pool_maxsize == 42
+    assert adapter._pool_connections == 3
+
+
+def test_keep_alive_disabled():
+    session = requests.session()
+    TransportConfig(keep_alive=False).configure_session(session)
+
+    assert session.headers["Connection"] == "close"
+
+
+def test_authentication_goes_through_session(tmp_path, fake_adapter):
+    client = Client(refresh_cookies=True, cookies_dir=f"{tmp_path}/")
+    adapter = fake_adapter(login_flow, cookies={"JSESSIONID": '"ajax:123"'})
+    client.session.mount("https://", adapter)
+
+    client.authenticate("user", "pass")
+
+    assert [r.method for r in adapter.requests] == ["GET", "POST", "GET"]
+    for request in adapter.requests:
+        assert request.headers["User-Agent"] == "ANDROID OS"
+        assert "csrf-token" not in request.headers
+        assert "x-li-lang" not in request.headers
+    assert "JSESSIONID" in adapter.requests[1].headers["Cookie"]
+    assert client.session.headers["csrf-token"] == "ajax:123"
+    assert client.metadata["clientPageInstanceId"] == "page-1"
+
+
+def test_httpx_limits():
+    pytest.importorskip("httpx")
+
+    limits = TransportConfig(
+        max_connections=7, pool_maxsize=3, keep_alive=False
+    ).httpx_limits()
+
+    assert limits.max_connections == 7
+    assert limits.max_keepalive_connections == 0
+
+
+@pytest.mark.parametrize(
+    "make_repository",
+    [
+        lambda path: CookieRepository(cookies_dir=f"{path}/"),
+        lambda path: SQLiteCookieRepository(f"{path}/sessions.sqlite3"),
+    ],
+)
+def test_cached_session_reuses_saved_metadata(tmp_path, fake_adapter, make_repository):
+    cookies = {"JSESSIONID": '"ajax:123"'}
+    client = Client(refresh_cookies=True, cookie_repository=make_repository(tmp_path))
+    client.session.mount("https://", fake_adapter(login_flow, cookies=cookies))
+    client.authenticate("user", "pass")
+
+    warm = Client(cookie_repository=make_repository(tmp_path))
+    adapter = fake_adapter(login_flow, cookies=cookies)
+    warm.session.mount("https://", adapter)
+    warm.authenticate("user", "pass")
+
+    assert adapter.requests == []
+    assert warm.metadata == {"clientPageInstanceId": "page-1"}
+    assert warm.session.headers["csrf-token"] == "ajax:123"